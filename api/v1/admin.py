@@ -1,10 +1,18 @@
 from fastapi import APIRouter, HTTPException, Depends, Query
-from typing import List, Dict, Any
+from fastapi.responses import StreamingResponse
+from datetime import datetime
+from typing import List, Dict, Any, Optional
 
-from models.user import User
-from repositories.user_repo import UserRepository
+from repositories.inquiries_repo import INQUIRY_EXPORT_FIELDS, InquiryRepository
+from repositories.user_repo import ADMIN_USER_FIELDS, LAST_LOGIN_FIELDS, UserRepository
+from services.analytics_service import AnalyticsService
 from services.user_service import UserService
-from schemas.user import AdminUserOut, AdminUserListResponse, UserDeleteResponse
+from schemas.analytics import ActiveUsersOut, DailyActivityListOut, DailyActivityOut
+from schemas.user import AdminUserOut, AdminUserListResponse, AdminUserSearchResponse, UserDeleteResponse
+from core.config import settings
+from core.export import export_response
+from core.pagination import decode_cursor, encode_cursor
+from core.principal import UserPrincipal
 from core.security import get_current_user, get_current_admin   # 관리자 권한 의존성 가져오기
 
 router = APIRouter(prefix="/admin", tags=["admin"])
@@ -13,47 +21,55 @@ router = APIRouter(prefix="/admin", tags=["admin"])
 # 전체 사용자 조회 (관리자 전용)
 @router.get("/users", response_model=AdminUserListResponse)
 async def get_all_users(
-    current_user: User = Depends(get_current_user),
+    limit: int = Query(settings.PAGE_SIZE_DEFAULT, ge=1, le=settings.PAGE_SIZE_MAX),
+    cursor: Optional[str] = Query(None, description="이전 응답의 next_cursor"),
+    with_total: bool = Query(False, description="True면 전체 사용자 수(캐시된 값) 포함"),
+    current_user: UserPrincipal = Depends(get_current_user),
 ) -> AdminUserListResponse:
     if not current_user.is_superuser:
         raise HTTPException(status_code=403, detail="관리자만 접근할 수 있습니다.")
 
-    users = await User.all().order_by("-created_at")
+    users, next_cursor = await UserService.get_all_users(limit, decode_cursor(cursor, datetime, int))
+    total = await UserService.count_all_users() if with_total else None
 
-    # is_google_user 계산해서 AdminUserOut으로 변환
-    user_out_list = []
-    for u in users:
-        user_dict = u.__dict__.copy()
-        user_dict["is_google_user"] = bool(getattr(u, "google_id", None))
-        user_out_list.append(AdminUserOut.model_validate(user_dict))
-
-    return AdminUserListResponse(users=user_out_list, total=len(users))
+    return AdminUserListResponse(
+        users=[AdminUserOut(**u) for u in users],
+        total=total,
+        next_cursor=next_cursor,
+    )
 
 
 
 # 특정 사용자 검색 (관리자 전용)
-@router.get("/users/search", response_model=List[AdminUserOut])
+@router.get("/users/search", response_model=AdminUserSearchResponse)
 async def search_users(
-    search: str,
-    current_user: User = Depends(get_current_user),
-) -> List[AdminUserOut]:
+    search: str = Query(..., min_length=1, max_length=100),
+    limit: int = Query(20, ge=1, le=100, description="한 번에 가져올 최대 사용자 수"),
+    cursor: Optional[str] = Query(None, description="이전 응답의 next_cursor"),
+    current_user: UserPrincipal = Depends(get_current_user),
+) -> AdminUserSearchResponse:
     """
-    관리자 전용 — 유저 이름 또는 이메일 일부 검색
-    ex) 'oh' → oh, ohna, ohnana 모두 반환
+    관리자 전용 — 유저 이름 또는 이메일 검색
+    - 3글자 이상: 부분 일치 + 비슷한 이름 (유사도 순)
+    - 2글자 이하: 앞부분 일치 (ex. 'oh' → oh, ohna, ohnana)
     """
     if not current_user.is_superuser:
         raise HTTPException(status_code=403, detail="관리자만 접근할 수 있습니다.")
 
-    users = await UserRepository.search_users(search)
-    if not users:
+    after = decode_cursor(cursor, float, int)
+    users = await UserRepository.search_users(search, limit=limit, after=after)
+    if not users and after is None:
         raise HTTPException(status_code=404, detail="검색 결과가 없습니다.")
 
-    # ✅ dict 리스트 기반 변환 + 구글 로그인 여부 추가
-    result = []
-    for u in users:
-        u["is_google_user"] = bool(u.get("google_id"))
-        result.append(AdminUserOut(**u))
-    return result
+    next_cursor = None
+    if len(users) == limit:
+        last = users[-1]
+        next_cursor = encode_cursor(last["score"], last["id"])
+
+    return AdminUserSearchResponse(
+        users=[AdminUserOut(**u) for u in users],
+        next_cursor=next_cursor,
+    )
 
 
 
@@ -62,7 +78,7 @@ async def search_users(
 @router.delete("/users/{user_id}", response_model=UserDeleteResponse)
 async def delete_user(
     user_id: int,
-    current_admin: User = Depends(get_current_admin),
+    current_admin: UserPrincipal = Depends(get_current_admin),
 ) -> UserDeleteResponse:
     deleted = await UserService.delete_user(user_id)
     if not deleted:
@@ -75,7 +91,7 @@ async def delete_user(
 async def update_user_status(
     user_id: int,
     is_active: bool,
-    current_admin: User = Depends(get_current_admin),
+    current_admin: UserPrincipal = Depends(get_current_admin),
 ) -> AdminUserOut:
     user = await UserService.update_user_status(user_id, is_active)
     if not user:
@@ -91,7 +107,7 @@ async def update_user_status(
 # 전체 유저 최근 로그인 시간 조회 (관리자 전용)
 @router.get("/users/last-login")
 async def get_all_user_last_login(
-    current_user: User = Depends(get_current_user),
+    current_user: UserPrincipal = Depends(get_current_user),
 ) -> Dict[str, List[Dict]]:
 
     # 전체 유저의 최근 로그인 시간을 조회합니다.
@@ -105,3 +121,52 @@ async def get_all_user_last_login(
         u["is_google_user"] = bool(u.get("google_id"))
 
     return {"users": users}
+
+
+# ========================
+# 로그인 활동 통계 (관리자 전용, 미리 집계된 값만 조회)
+# ========================
+@router.get("/analytics/active-users", response_model=ActiveUsersOut, dependencies=[Depends(get_current_admin)])
+async def get_active_users() -> ActiveUsersOut:
+    stat = await AnalyticsService.get_active_users()
+    if not stat:
+        raise HTTPException(status_code=404, detail="ANALYTICS_NOT_READY")
+    return ActiveUsersOut(**stat)
+
+
+@router.get("/analytics/daily", response_model=DailyActivityListOut, dependencies=[Depends(get_current_admin)])
+async def get_daily_activity(
+    days: int = Query(30, ge=1, le=366, description="최근 며칠치 (KST 날짜 기준)"),
+) -> DailyActivityListOut:
+    stats = await AnalyticsService.get_daily_stats(days)
+    return DailyActivityListOut(days=[DailyActivityOut(**s) for s in stats])
+
+
+# ========================
+# 대용량 내보내기 (관리자 전용, NDJSON / CSV 스트리밍)
+# ========================
+ExportFormat = Query("ndjson", alias="format", pattern="^(ndjson|csv)$", description="ndjson 또는 csv")
+
+
+@router.get("/users/export", dependencies=[Depends(get_current_admin)])
+async def export_users(fmt: str = ExportFormat) -> StreamingResponse:
+    return await export_response(
+        UserRepository.export_users(), ADMIN_USER_FIELDS, fmt, "users"
+    )
+
+
+@router.get("/users/last-login/export", dependencies=[Depends(get_current_admin)])
+async def export_users_last_login(fmt: str = ExportFormat) -> StreamingResponse:
+    return await export_response(
+        UserRepository.export_users_last_login(),
+        (*LAST_LOGIN_FIELDS, "is_google_user"),
+        fmt,
+        "users_last_login",
+    )
+
+
+@router.get("/inquiries/export", dependencies=[Depends(get_current_admin)])
+async def export_inquiries(fmt: str = ExportFormat) -> StreamingResponse:
+    return await export_response(
+        InquiryRepository.export_inquiries(), INQUIRY_EXPORT_FIELDS, fmt, "inquiries"
+    )
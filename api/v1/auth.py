@@ -1,8 +1,10 @@
 from datetime import timezone, datetime, timedelta
-from fastapi import APIRouter, HTTPException, Response, Request
+from fastapi import APIRouter, Depends, HTTPException, Response, Request
 from fastapi.responses import JSONResponse
 from typing import Dict
 
+from core.principal import UserPrincipal
+from core.security import get_current_user
 from repositories.user_repo import UserRepository
 from schemas.user import (
     UserCreateRequest,
@@ -173,17 +175,10 @@ async def login_user(request: UserLoginRequest, response: Response) -> UserLogin
         path= "/"
     )
 
-    # ✅ 로그인 시간 업데이트
-    user = await UserRepository.get_user_by_email(request.email)
-    if not user:
-        raise HTTPException(status_code=404, detail="등록되지 않은 이메일입니다.")
-
-    user.last_login_at = datetime.now(timezone.utc)
-    await user.save(update_fields=["last_login_at"])
-
-    # ✅ 한국시간 변환
+    # ✅ 한국시간 변환 (로그인 시각은 AuthService.login에서 기록)
     KST = timezone(timedelta(hours=9))
-    kst_time = user.last_login_at.astimezone(KST).strftime("%Y-%m-%d %H:%M")
+    last_login_at = datetime.fromisoformat(result["last_login_at"])
+    kst_time = last_login_at.astimezone(KST).strftime("%Y-%m-%d %H:%M")
 
     return UserLoginResponse(success=True, last_login_at=kst_time)
 
@@ -198,7 +193,7 @@ async def logout_user(request: Request) -> Response:
     if token is None:
         raise HTTPException(status_code=401, detail="로그인 상태가 아닙니다.")
 
-    revoked = await AuthService.logout(token)
+    revoked = await AuthService.logout(token, request.cookies.get("access_token"))
     if not revoked:
         raise HTTPException(status_code=400, detail="로그아웃 중 오류가 발생했습니다.")
 
@@ -221,4 +216,33 @@ async def logout_user(request: Request) -> Response:
         path="/"
     )
 
-    return response
\ No newline at end of file
+    return response
+
+
+# -----------------------------
+# 모든 기기에서 로그아웃 (/auth/logout/all)
+# -----------------------------
+@router.post("/logout/all")
+async def logout_all_sessions(current_user: UserPrincipal = Depends(get_current_user)) -> Response:
+    # ✅ 세션 버전 증가 → 발급된 모든 토큰 무효화
+    await AuthService.revoke_all_sessions(current_user.id)
+
+    response = JSONResponse({"success": True})
+    response.delete_cookie(
+        "refresh_token",
+        httponly=True,
+        domain="www.nyangbiseo.store",
+        secure=True,
+        samesite="none",
+        path="/"
+    )
+    response.delete_cookie(
+        "access_token",
+        httponly=True,
+        domain="www.nyangbiseo.store",
+        secure=True,
+        samesite="none",
+        path="/"
+    )
+
+    return response
@@ -1,12 +1,16 @@
+import json
+from dataclasses import dataclass, field
 from datetime import datetime, date, timedelta, timezone
-from typing import Any
+from typing import Any, AsyncIterator, Optional
 from fastapi import APIRouter, HTTPException, Depends
+from fastapi.responses import StreamingResponse
 
 from models.schedules import Schedule
 from models.todo import Todo
-from models.user import User
 from services import gemini_service
-from services.gemini_client import gemini_request
+from services.briefing_service import BriefingStore
+from services.gemini_client import gemini_request, gemini_stream
+from core.principal import UserPrincipal
 from core.security import get_current_user
 
 router = APIRouter(prefix="/gemini", tags=["Gemini"])
@@ -15,28 +19,203 @@ router = APIRouter(prefix="/gemini", tags=["Gemini"])
 KST = timezone(timedelta(hours=9))
 
 
+@dataclass
+class GeminiJob:
+    """Gemini 호출 1건 (일반 응답 / SSE 스트리밍 공용)"""
+    prompt: str
+    cache_ttl: int
+    cache_scope: str
+    result_field: str                      # 응답 data 안에서 생성 텍스트가 들어갈 키
+    meta: dict[str, Any] = field(default_factory=dict)
+
+
+def _job_response(job: GeminiJob, text: str) -> dict[str, Any]:
+    return {
+        "success": True,
+        "data": {
+            **job.meta,
+            job.result_field: text,
+            "generated_at": datetime.now(KST).isoformat(),
+        },
+    }
+
+
+# ==================================================
+# SSE 스트리밍 공통
+# event: token → 텍스트 조각 / done → 메타데이터 / error → 오류
+# ==================================================
+def _sse(event: str, data: dict[str, Any]) -> str:
+    return f"event: {event}\ndata: {json.dumps(data, ensure_ascii=False)}\n\n"
+
+
+async def _stream_job(job: GeminiJob) -> AsyncIterator[str]:
+    try:
+        async for text in gemini_stream(
+            job.prompt, cache_ttl=job.cache_ttl, cache_scope=job.cache_scope
+        ):
+            yield _sse("token", {"text": text})
+    except HTTPException as e:
+        yield _sse("error", {"status_code": e.status_code, "detail": e.detail})
+        return
+    except Exception as e:
+        yield _sse("error", {"status_code": 500, "detail": str(e)})
+        return
+
+    yield _sse("done", {**job.meta, "generated_at": datetime.now(KST).isoformat()})
+
+
+async def _stream_text(text: str, meta: dict[str, Any]) -> AsyncIterator[str]:
+    yield _sse("token", {"text": text})
+    yield _sse("done", meta)
+
+
+def _stream_stored(stored: dict[str, Any], result_field: str) -> StreamingResponse:
+    """이미 생성된 결과를 SSE 형식으로 한 번에 전송"""
+    meta = {k: v for k, v in stored.items() if k != result_field}
+    return StreamingResponse(
+        _stream_text(stored[result_field], meta),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
+def _stream_response(job: GeminiJob) -> StreamingResponse:
+    return StreamingResponse(
+        _stream_job(job),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
+def _kst_day_range_utc(target: date) -> tuple[datetime, datetime]:
+    """KST 하루 범위 → UTC (DB 저장 기준)"""
+    start_of_day_kst = datetime.combine(target, datetime.min.time(), tzinfo=KST)
+    end_of_day_kst = datetime.combine(target, datetime.max.time(), tzinfo=KST)
+    return start_of_day_kst.astimezone(timezone.utc), end_of_day_kst.astimezone(timezone.utc)
+
+
+async def _load_day_lists(user: UserPrincipal, target: date) -> tuple[list[str], list[str]]:
+    """해당 날짜의 일정 / 투두를 프롬프트용 문자열 목록으로 변환"""
+    start_of_day_utc, end_of_day_utc = _kst_day_range_utc(target)
+
+    schedules = await Schedule.filter(
+        user_id=user.id,
+        deleted_at=None,
+        start_time__gte=start_of_day_utc,
+        start_time__lte=end_of_day_utc,
+    ).order_by("id").all()
+
+    todos = await Todo.filter(
+        user_id=user.id,
+        deleted_at=None,
+        created_at__gte=start_of_day_utc,
+        created_at__lte=end_of_day_utc,
+    ).order_by("id").all()
+
+    schedule_list = gemini_service.format_schedule_lines((s.start_time, s.title) for s in schedules)
+    todo_list = gemini_service.format_todo_lines((t.is_completed, t.title) for t in todos)
+
+    return schedule_list, todo_list
+
+
+# ==================================================
+# 프롬프트 + 캐시 범위 구성
+# ==================================================
+async def _fortune_job(user: UserPrincipal) -> GeminiJob:
+    if not user.birthday:
+        raise HTTPException(status_code=400, detail="생년월일 정보가 없습니다.")
+
+    prompt = await gemini_service.get_fortune_prompt(str(user.birthday))
+
+    # ✅ 같은 생일 + 같은 브리핑 날짜면 캐시 재사용 (KST 05시 만료)
+    return GeminiJob(
+        prompt=prompt,
+        cache_ttl=gemini_service.seconds_until_next_briefing_date(),
+        cache_scope=str(gemini_service.get_briefing_date()),
+        result_field="fortune",
+        meta={"type": "fortune", "birthday": str(user.birthday)},
+    )
+
+
+async def _conversation_job(user: UserPrincipal) -> GeminiJob:
+    now_kst = datetime.now(KST)
+    today = now_kst.date()
+
+    schedule_list, todo_list = await _load_day_lists(user, today)
+
+    # ✅ Gemini 요약 프롬프트 생성
+    prompt = await gemini_service.get_conversation_summary_prompt(
+        schedule_list, todo_list
+    )
+    return GeminiJob(
+        prompt=prompt,
+        cache_ttl=gemini_service.seconds_until_next_day(now_kst),
+        cache_scope=str(today),
+        result_field="summary",
+        meta={"type": "conversation_summary"},
+    )
+
+
+async def _briefing_job(user: UserPrincipal) -> GeminiJob:
+    now_kst = datetime.now(KST)
+
+    # ✅ 시간대 분기
+    period = gemini_service.get_briefing_period(now_kst)
+
+    # ✅ 브리핑 기준 날짜 (자정~05시는 전날)
+    target_date = gemini_service.get_briefing_date()
+
+    # ✅ 오늘 일정 / 투두
+    schedule_list, todo_list = await _load_day_lists(user, target_date)
+
+    # ✅ 저녁일 경우: 내일 일정도 함께 조회
+    next_day_schedules = None
+    if period == "저녁":
+        next_start_utc, next_end_utc = _kst_day_range_utc(target_date + timedelta(days=1))
+
+        next_schedules = await Schedule.filter(
+            user_id=user.id,
+            deleted_at=None,
+            start_time__gte=next_start_utc,
+            start_time__lte=next_end_utc,
+        ).order_by("id").all()
+
+        next_day_schedules = gemini_service.format_schedule_lines(
+            ((s.start_time, s.title) for s in next_schedules), empty="내일 일정 없음"
+        )
+
+    # ✅ Gemini 프롬프트 생성 (저녁 프롬프트에는 내일 일정도 포함)
+    prompt = await gemini_service.get_briefing_prompt(
+        period=period,
+        schedules=schedule_list,
+        todos=todo_list,
+        target_date=target_date,
+        next_day_schedules=next_day_schedules,
+    )
+
+    # ✅ 다음 시간대 경계까지 캐시
+    return GeminiJob(
+        prompt=prompt,
+        cache_ttl=gemini_service.seconds_until_briefing_boundary(now_kst),
+        cache_scope=f"{target_date}:{period}",
+        result_field="briefing",
+        meta={"type": "briefing", "period": period, "date": str(target_date)},
+    )
+
+
 # ==================================================
 # 1️⃣ 오늘의 운세 API
 # ==================================================
 @router.get("/fortune")
-async def get_fortune(current_user: User = Depends(get_current_user)) -> dict[str, Any]:
+async def get_fortune(current_user: UserPrincipal = Depends(get_current_user)) -> dict[str, Any]:
     """Gemini 기반 오늘의 운세 조회"""
-    if not current_user.birthday:
-        raise HTTPException(status_code=400, detail="생년월일 정보가 없습니다.")
+    job = await _fortune_job(current_user)
 
     try:
-        prompt = await gemini_service.get_fortune_prompt(str(current_user.birthday))
-        fortune = await gemini_request(prompt)
-
-        return {
-            "success": True,
-            "data": {
-                "type": "fortune",
-                "birthday": str(current_user.birthday),
-                "fortune": fortune,
-                "generated_at": datetime.now(KST).isoformat(),
-            },
-        }
+        fortune = await gemini_request(
+            job.prompt, cache_ttl=job.cache_ttl, cache_scope=job.cache_scope
+        )
+        return _job_response(job, fortune)
 
     except HTTPException as e:
         raise e
@@ -44,166 +223,96 @@ async def get_fortune(current_user: User = Depends(get_current_user)) -> dict[st
         raise HTTPException(status_code=500, detail=f"운세 생성 실패: {e}")
 
 
+@router.get("/fortune/stream")
+async def stream_fortune(current_user: UserPrincipal = Depends(get_current_user)) -> StreamingResponse:
+    """오늘의 운세 (SSE 스트리밍)"""
+    return _stream_response(await _fortune_job(current_user))
+
+
 # ==================================================
 # 2️⃣ 일정 & 투두 요약 API
 # ==================================================
 @router.get("/conversations")
 async def get_conversations(
-    current_user: User = Depends(get_current_user),
+    current_user: UserPrincipal = Depends(get_current_user),
 ) -> dict[str, Any]:
     """Gemini 기반 오늘의 일정 & 투두 요약"""
     try:
-        now_kst = datetime.now(KST)
-        today = now_kst.date()
-
-        # ✅ KST 하루 범위 계산
-        start_of_day_kst = datetime.combine(today, datetime.min.time(), tzinfo=KST)
-        end_of_day_kst = datetime.combine(today, datetime.max.time(), tzinfo=KST)
-
-        # ✅ UTC 변환 (DB 저장 기준)
-        start_of_day_utc = start_of_day_kst.astimezone(timezone.utc)
-        end_of_day_utc = end_of_day_kst.astimezone(timezone.utc)
-
-        # ✅ 일정 & 투두 조회
-        schedules = await Schedule.filter(
-            user=current_user,
-            start_time__gte=start_of_day_utc,
-            start_time__lte=end_of_day_utc,
-        ).all()
-
-        todos = await Todo.filter(
-            user=current_user,
-            created_at__gte=start_of_day_utc,
-            created_at__lte=end_of_day_utc,
-        ).all()
-
-        schedule_list = [
-            f"{s.start_time.astimezone(KST).strftime('%H:%M')} {s.title}"
-            for s in schedules
-        ] or ["일정 없음"]
-
-        todo_list = [
-            f"- [{'x' if t.is_completed else ' '}] {t.title}" for t in todos
-        ] or ["투두 없음"]
-
-        # ✅ Gemini 요약 프롬프트 생성
-        prompt = await gemini_service.get_conversation_summary_prompt(
-            schedule_list, todo_list
+        job = await _conversation_job(current_user)
+        summary = await gemini_request(
+            job.prompt, cache_ttl=job.cache_ttl, cache_scope=job.cache_scope
         )
-        summary = await gemini_request(prompt)
+        return _job_response(job, summary)
 
-        return {
-            "success": True,
-            "data": {
-                "type": "conversation_summary",
-                "summary": summary,
-                "generated_at": datetime.now(KST).isoformat(),
-            },
-        }
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"대화 요약 실패: {e}")
 
+
+@router.get("/conversations/stream")
+async def stream_conversations(
+    current_user: UserPrincipal = Depends(get_current_user),
+) -> StreamingResponse:
+    """오늘의 일정 & 투두 요약 (SSE 스트리밍)"""
+    try:
+        job = await _conversation_job(current_user)
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"대화 요약 실패: {e}")
+    return _stream_response(job)
 
 
 # ==================================================
 # 3️⃣ 아침/점심/저녁 브리핑 API
 # ==================================================
+async def _stored_briefing(user: UserPrincipal) -> Optional[dict[str, Any]]:
+    """미리 생성된 브리핑이 있으면 응답 형태로 반환"""
+    period = gemini_service.get_briefing_period()
+    target_date = gemini_service.get_briefing_date()
+    stored = await BriefingStore.get(user.id, target_date, period)
+    if not stored:
+        return None
+    return {
+        "type": "briefing",
+        "period": period,
+        "date": str(target_date),
+        "briefing": stored["briefing"],
+        "generated_at": stored["generated_at"],
+    }
+
+
 @router.get("/briefings")
-async def get_briefings(current_user: User = Depends(get_current_user)) -> dict[str, Any]:
+async def get_briefings(current_user: UserPrincipal = Depends(get_current_user)) -> dict[str, Any]:
     """Gemini 기반 시간대별 브리핑"""
+    # ✅ 미리 생성된 브리핑이 있으면 바로 반환
+    stored = await _stored_briefing(current_user)
+    if stored:
+        return {"success": True, "data": stored}
+
     try:
-        now_kst = datetime.now(KST)
-        hour = now_kst.hour
-
-        # ✅ 시간대 분기
-        if 6 <= hour < 12:
-            period = "아침"
-        elif 12 <= hour < 18:
-            period = "점심"
-        else:
-            period = "저녁"
-
-        # ✅ 브리핑 기준 날짜 (자정~05시는 전날)
-        target_date = gemini_service.get_briefing_date()
-
-        # ✅ KST 하루 범위 계산 (target_date 기준)
-        start_of_day_kst = datetime.combine(target_date, datetime.min.time(), tzinfo=KST)
-        end_of_day_kst = datetime.combine(target_date, datetime.max.time(), tzinfo=KST)
-
-        # ✅ UTC로 변환
-        start_of_day_utc = start_of_day_kst.astimezone(timezone.utc)
-        end_of_day_utc = end_of_day_kst.astimezone(timezone.utc)
-
-        # ✅ 오늘 일정 / 투두
-        schedules = await Schedule.filter(
-            user=current_user,
-            start_time__gte=start_of_day_utc,
-            start_time__lte=end_of_day_utc,
-        ).all()
-
-        todos = await Todo.filter(
-            user=current_user,
-            created_at__gte=start_of_day_utc,
-            created_at__lte=end_of_day_utc,
-        ).all()
-
-        schedule_list = [
-            f"{s.start_time.astimezone(KST).strftime('%H:%M')} {s.title}"
-            for s in schedules
-        ] or ["일정 없음"]
-
-        todo_list = [
-            f"- [{'x' if t.is_completed else ' '}] {t.title}" for t in todos
-        ] or ["투두 없음"]
-
-        # ✅ 저녁일 경우: 내일 일정도 함께 조회
-        next_day_schedules = []
-        if period == "저녁":
-            next_date = target_date + timedelta(days=1)
-            next_start_kst = datetime.combine(next_date, datetime.min.time(), tzinfo=KST)
-            next_end_kst = datetime.combine(next_date, datetime.max.time(), tzinfo=KST)
-            next_start_utc = next_start_kst.astimezone(timezone.utc)
-            next_end_utc = next_end_kst.astimezone(timezone.utc)
-
-            next_schedules = await Schedule.filter(
-                user=current_user,
-                start_time__gte=next_start_utc,
-                start_time__lte=next_end_utc,
-            ).all()
-
-            next_day_schedules = [
-                f"{s.start_time.astimezone(KST).strftime('%H:%M')} {s.title}"
-                for s in next_schedules
-            ] or ["내일 일정 없음"]
-
-        # ✅ Gemini 프롬프트 생성
-        prompt = await gemini_service.get_briefing_prompt(
-            period=period,
-            schedules=schedule_list,
-            todos=todo_list,
-            target_date=target_date,
+        job = await _briefing_job(current_user)
+
+        # ✅ Gemini 호출
+        briefing = await gemini_request(
+            job.prompt, cache_ttl=job.cache_ttl, cache_scope=job.cache_scope
         )
+        return _job_response(job, briefing)
+
+    except HTTPException as e:
+        raise e
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"브리핑 생성 실패: {e}")
 
-        # ✅ 저녁 프롬프트에는 내일 일정도 포함
-        if period == "저녁":
-            next_text = "\n".join(next_day_schedules)
-            prompt += f"\n\n# 내일 일정 미리보기\n{next_text}\n"
 
-        # ✅ Gemini 호출
-        briefing = await gemini_request(prompt)
-
-        return {
-            "success": True,
-            "data": {
-                "type": "briefing",
-                "period": period,
-                "date": str(target_date),
-                "briefing": briefing,
-                "generated_at": datetime.now(KST).isoformat(),
-            },
-        }
+@router.get("/briefings/stream")
+async def stream_briefings(current_user: UserPrincipal = Depends(get_current_user)) -> StreamingResponse:
+    """시간대별 브리핑 (SSE 스트리밍)"""
+    stored = await _stored_briefing(current_user)
+    if stored:
+        return _stream_stored(stored, "briefing")
 
+    try:
+        job = await _briefing_job(current_user)
     except HTTPException as e:
         raise e
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"브리핑 생성 실패: {e}")
+    return _stream_response(job)
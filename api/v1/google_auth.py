@@ -26,11 +26,8 @@ async def google_login() -> RedirectResponse:
 # used_code : 계속 중복 호출로 인한 코드 중복 사용으로 문제가 발생했음, 해당 부분으로 중복 호출 시 이미 사용된 코드는 무시하게 처리함
 @router.get("/google/callback")
 async def google_callback(code: str) -> Response:
-    # ✅ 동일한 code 재사용 방지
-    if not hasattr(GoogleAuthService, "_used_codes"):  # type: ignore[attr-defined]
-        GoogleAuthService._used_codes = set()  # type: ignore[attr-defined]
-
-    if code in GoogleAuthService._used_codes:  # type: ignore[attr-defined]
+    # ✅ 동일한 code 재사용 방지 (Redis, 워커 간 공유)
+    if not await GoogleAuthService.claim_code(code):
         print(f"⚠️ 이미 사용된 code: {code[:20]}... 중복 요청 무시")
         error_url = (
             f"{core.google_handler.GOOGLE_FRONTEND_URL}"
@@ -38,24 +35,11 @@ async def google_callback(code: str) -> Response:
         )
         return RedirectResponse(url=error_url, status_code=302)
 
-    GoogleAuthService._used_codes.add(code)  # type: ignore[attr-defined]
-
     try:
         # ✅ 구글 로그인 처리
         data = await GoogleAuthService.google_callback(code)
 
-        KST = timezone(timedelta(hours=9))
-
-        # ✅ 구글 로그인 성공한 사용자 정보 가져오기
-        email = data.get("email")  # google_callback()이 email 반환해야 함
-        if email:
-            user = await UserRepository.get_user_by_email(email)
-            if user:
-                user.last_login_at = datetime.now(timezone.utc)
-                await user.save(update_fields=["last_login_at"])
-
-                kst_time = user.last_login_at.astimezone(KST).strftime("%Y-%m-%d %H:%M")
-                print(f"🕒 last_login_at 갱신 완료 (KST): {kst_time}")
+        # ✅ 로그인 시각은 google_callback()에서 버퍼에 기록됨
 
         # ✅ 프론트엔드로 리디렉트 (경로 유지)
         redirect_url = f"{core.google_handler.GOOGLE_FRONTEND_URL}/auth/google/callback"
@@ -1,6 +1,9 @@
-from fastapi import APIRouter, Depends, HTTPException
-from typing import List, Any
-from models.user import User
+from datetime import datetime
+from fastapi import APIRouter, Depends, HTTPException, Query
+from typing import List, Any, Optional
+from core.config import settings
+from core.pagination import decode_cursor
+from core.principal import UserPrincipal
 from core.security import get_current_user, get_current_admin
 from services.inquiries_service import InquiryService
 from schemas.inquiries import (
@@ -20,25 +23,35 @@ router = APIRouter(prefix="/inquiries", tags=["inquiries"])
 @router.post("", response_model=InquiryOut)
 async def create_inquiry(
     request: InquiryCreate,
-    current_user: User = Depends(get_current_user),
+    current_user: UserPrincipal = Depends(get_current_user),
 ) -> InquiryOut:
     inquiry = await InquiryService.create_inquiry(
         user_id=current_user.id,
         title=request.title,
         message=request.message,
     )
+    await InquiryService.invalidate_count(current_user.id)
     return InquiryOut.from_orm(inquiry)
 
 
 # -----------------------------
-# 2. 내 문의 목록 조회 (사용자)
+# 2. 내 문의 목록 조회 (사용자, 최신순 커서 페이지)
 # -----------------------------
 @router.get("/me", response_model=InquiryListOut)
-async def get_my_inquiries(current_user: User = Depends(get_current_user)) -> InquiryListOut:
-    inquiries = await InquiryService.get_inquiries_by_user(current_user.id)
+async def get_my_inquiries(
+    limit: int = Query(settings.PAGE_SIZE_DEFAULT, ge=1, le=settings.PAGE_SIZE_MAX),
+    cursor: Optional[str] = Query(None, description="이전 응답의 next_cursor"),
+    with_total: bool = Query(False, description="True면 전체 개수(캐시된 값) 포함"),
+    current_user: UserPrincipal = Depends(get_current_user),
+) -> InquiryListOut:
+    inquiries, next_cursor = await InquiryService.get_inquiries_by_user(
+        current_user.id, limit, decode_cursor(cursor, datetime, int)
+    )
+    total = await InquiryService.count_inquiries_by_user(current_user.id) if with_total else None
     return InquiryListOut(
         inquiries=[InquiryOut.from_orm(i) for i in inquiries],
-        total=len(inquiries),
+        total=total,
+        next_cursor=next_cursor,
     )
 
 # -----------------------------
@@ -47,14 +60,14 @@ async def get_my_inquiries(current_user: User = Depends(get_current_user)) -> In
 @router.get("/{inquiry_id}", response_model=InquiryOut)
 async def get_inquiry(
     inquiry_id: int,
-    current_user: User = Depends(get_current_user),
+    current_user: UserPrincipal = Depends(get_current_user),
 ) -> InquiryOut:
     inquiry = await InquiryService.get_inquiry_by_id(inquiry_id)
     if not inquiry:
         raise HTTPException(status_code=404, detail="INQUIRY_NOT_FOUND")
 
     # 본인 것만 접근 가능 (단, 관리자는 예외)
-    if not current_user.is_superuser and inquiry.user != current_user:
+    if not current_user.is_superuser and inquiry.user_id != current_user.id:
         raise HTTPException(status_code=403, detail="NOT_ALLOWED")
 
     return InquiryOut.from_orm(inquiry)
@@ -65,7 +78,7 @@ async def get_inquiry(
 async def update_my_inquiry(
     inquiry_id: int,
     request: InquiryUserUpdate,   # 새로운 스키마 (title/message만 포함)
-    current_user: User = Depends(get_current_user),
+    current_user: UserPrincipal = Depends(get_current_user),
 ) -> InquiryOut:
     inquiry = await InquiryService.update_inquiry_user(
         inquiry_id=inquiry_id,
@@ -79,14 +92,21 @@ async def update_my_inquiry(
 
 
 # -----------------------------
-# 4. 전체 문의 목록 조회 (관리자 전용)
+# 4. 전체 문의 목록 조회 (관리자 전용, 최신순 커서 페이지)
 # -----------------------------
 @router.get("", response_model=InquiryListOut, dependencies=[Depends(get_current_admin)])
-async def get_all_inquiries() -> dict[str, Any]:
-    inquiries = await InquiryService.get_all_inquiries()
+async def get_all_inquiries(
+    limit: int = Query(settings.PAGE_SIZE_DEFAULT, ge=1, le=settings.PAGE_SIZE_MAX),
+    cursor: Optional[str] = Query(None, description="이전 응답의 next_cursor"),
+    with_total: bool = Query(False, description="True면 전체 개수(캐시된 값) 포함"),
+) -> dict[str, Any]:
+    inquiries, next_cursor = await InquiryService.get_all_inquiries(
+        limit, decode_cursor(cursor, datetime, int)
+    )
     return {
         "inquiries": [InquiryOut.from_orm(i) for i in inquiries],
-        "total": len(inquiries),
+        "total": await InquiryService.count_all_inquiries() if with_total else None,
+        "next_cursor": next_cursor,
     }
 
 
@@ -112,7 +132,7 @@ async def update_inquiry(inquiry_id: int, request: InquiryUpdate) -> InquiryOut:
 @router.delete("/{inquiry_id}", response_model=InquiryDeleteResponse)
 async def delete_inquiry(
     inquiry_id: int,
-    current_user: User = Depends(get_current_user),
+    current_user: UserPrincipal = Depends(get_current_user),
 ) -> InquiryDeleteResponse:
     inquiry = await InquiryService.get_inquiry_by_id(inquiry_id)
     if not inquiry:
@@ -125,6 +145,7 @@ async def delete_inquiry(
     deleted = await InquiryService.delete_inquiry(inquiry_id)
     if not deleted:
         raise HTTPException(status_code=500, detail="DELETE_FAILED")
+    await InquiryService.invalidate_count(inquiry.user_id)
 
     return InquiryDeleteResponse()
 
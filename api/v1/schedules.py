@@ -1,7 +1,13 @@
+from datetime import datetime
+from typing import Optional
+
 from fastapi import APIRouter, Depends, HTTPException, Query
-from models.user import User
+from core.config import settings
+from core.pagination import decode_cursor
+from core.principal import UserPrincipal
 from core.security import get_current_user
 from services.schedules_service import ScheduleService
+from services.briefing_service import BriefingStore
 from schemas.schedules import (
     ScheduleCreateRequest,
     ScheduleUpdateRequest,
@@ -19,28 +25,39 @@ router = APIRouter(prefix="/schedules", tags=["schedules"])
 @router.post("", response_model=ScheduleOut)
 async def create_schedule(
     request: ScheduleCreateRequest,
-    current_user: User = Depends(get_current_user),
+    current_user: UserPrincipal = Depends(get_current_user),
 ) -> ScheduleOut:
-    return await ScheduleService.create_schedule(
+    schedule = await ScheduleService.create_schedule(
         user_id=current_user.id,
         **request.model_dump()
     )
+    await BriefingStore.invalidate(current_user.id)  # 미리 생성된 브리핑 무효화
+    await ScheduleService.invalidate_count(current_user.id)
+    return schedule
 
 
 # -----------------------------
-# 2. 내 일정 목록 조회
+# 2. 내 일정 목록 조회 (시작 시각 순, 커서 페이지)
 # -----------------------------
 @router.get("/me", response_model=ScheduleListOut)
-async def get_my_schedules(current_user: User = Depends(get_current_user)) -> ScheduleListOut:
-    schedules = await ScheduleService.get_schedules_by_user(current_user.id)
-    return ScheduleListOut(schedules=schedules, total=len(schedules))
+async def get_my_schedules(
+    limit: int = Query(settings.PAGE_SIZE_DEFAULT, ge=1, le=settings.PAGE_SIZE_MAX),
+    cursor: Optional[str] = Query(None, description="이전 응답의 next_cursor"),
+    with_total: bool = Query(False, description="True면 전체 개수(캐시된 값) 포함"),
+    current_user: UserPrincipal = Depends(get_current_user),
+) -> ScheduleListOut:
+    schedules, next_cursor = await ScheduleService.get_schedules_by_user(
+        current_user.id, limit, decode_cursor(cursor, datetime, int)
+    )
+    total = await ScheduleService.count_schedules_by_user(current_user.id) if with_total else None
+    return ScheduleListOut(schedules=schedules, total=total, next_cursor=next_cursor)
 
 
 # -----------------------------
 # 3. 단일 일정 조회
 # -----------------------------
 @router.get("/{schedule_id}", response_model=ScheduleOut)
-async def get_schedule(schedule_id: int, current_user: User = Depends(get_current_user)) -> ScheduleOut:
+async def get_schedule(schedule_id: int, current_user: UserPrincipal = Depends(get_current_user)) -> ScheduleOut:
     schedule = await ScheduleService.get_schedule_by_id(schedule_id)
     if not schedule:
         raise HTTPException(status_code=404, detail="SCHEDULE_NOT_FOUND")
@@ -58,19 +75,20 @@ async def get_schedule(schedule_id: int, current_user: User = Depends(get_curren
 async def update_schedule(
     schedule_id: int,
     request: ScheduleUpdateRequest,
-    current_user: User = Depends(get_current_user),
+    current_user: UserPrincipal = Depends(get_current_user),
 ) -> ScheduleOut:
-    schedule = await ScheduleService.get_schedule_by_id(schedule_id)
-    if not schedule:
+    # 소유 확인 + 수정을 한 번에 (UPDATE ... RETURNING)
+    owner_id, updated = await ScheduleService.update_schedule(
+        schedule_id, current_user.id, **request.model_dump(exclude_unset=True)
+    )
+    if owner_id is None:
         raise HTTPException(status_code=404, detail="SCHEDULE_NOT_FOUND")
 
-    if schedule.user_id != current_user.id:
+    if updated is None:
         raise HTTPException(status_code=403, detail="NOT_ALLOWED")
 
-    updated = await ScheduleService.update_schedule(
-        schedule_id, **request.model_dump(exclude_unset=True)
-    )
-    return ScheduleOut.model_validate(updated)
+    await BriefingStore.invalidate(current_user.id)
+    return updated
 
 
 # -----------------------------
@@ -80,23 +98,19 @@ async def update_schedule(
 async def delete_schedule(
     schedule_id: int,
     hard: bool = Query(False, description="True면 완전 삭제, False면 소프트 삭제"),
-    current_user: User = Depends(get_current_user),
+    current_user: UserPrincipal = Depends(get_current_user),
 ) -> ScheduleDeleteResponse:
-    schedule = await ScheduleService.get_schedule_by_id(schedule_id)
-    if not schedule:
+    # 소유 확인 + 삭제를 한 번에 (✅ soft/hard 분기 포함)
+    owner_id, deleted = await ScheduleService.delete_schedule(schedule_id, current_user.id, hard=hard)
+    if owner_id is None:
         raise HTTPException(status_code=404, detail="SCHEDULE_NOT_FOUND")
 
-    if schedule.user_id != current_user.id:
+    if not deleted:
         raise HTTPException(status_code=403, detail="NOT_ALLOWED")
 
+    await BriefingStore.invalidate(current_user.id)
+    await ScheduleService.invalidate_count(current_user.id)
+
     if hard:
-        deleted = await ScheduleService.delete_schedule(schedule_id, hard=hard)  # ✅ 분기 포함
-        if not deleted:
-            raise HTTPException(status_code=500, detail="HARD_DELETE_FAILED")
         return ScheduleDeleteResponse(message="Schedule permanently deleted")
-
-    else:
-        deleted = await ScheduleService.delete_schedule(schedule_id)
-        if not deleted:
-            raise HTTPException(status_code=500, detail="SOFT_DELETE_FAILED")
-        return ScheduleDeleteResponse(message="Schedule deleted successfully")
+    return ScheduleDeleteResponse(message="Schedule deleted successfully")
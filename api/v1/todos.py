@@ -1,15 +1,21 @@
+from datetime import datetime
 from typing import Optional
 
 from fastapi import APIRouter, Depends, HTTPException, Query
-from models.user import User
+from core.config import settings
+from core.pagination import decode_cursor
+from core.principal import UserPrincipal
 from core.security import get_current_user
 from services.todo_service import TodoService
+from services.briefing_service import BriefingStore
 from schemas.todos import (
     TodoBase,
     TodoUpdate,
     TodoOut,
     TodoListOut,
     TodoDeleteResponse,
+    TodoBatchRequest,
+    TodoBatchResponse,
 )
 
 router = APIRouter(prefix="/todos", tags=["todos"])
@@ -21,29 +27,58 @@ router = APIRouter(prefix="/todos", tags=["todos"])
 @router.post("", response_model=TodoOut)
 async def create_todo(
     request: TodoBase,
-    current_user: User = Depends(get_current_user),
+    current_user: UserPrincipal = Depends(get_current_user),
 ) -> TodoOut:
-    return await TodoService.create_todo(
+    todo = await TodoService.create_todo(
         user_id=current_user.id,
         title=request.title,
         description=request.description
     )
+    await BriefingStore.invalidate(current_user.id)  # 미리 생성된 브리핑 무효화
+    await TodoService.invalidate_count(current_user.id)
+    return todo
 
 
 # -----------------------------
-# 2. 내 Todo 전체 조회
+# 2. 내 Todo 목록 조회 (최신순, 커서 페이지)
 # -----------------------------
 @router.get("", response_model=TodoListOut)
-async def get_my_todos(current_user: User = Depends(get_current_user)) -> TodoListOut:
-    todos = await TodoService.get_todos_by_user(current_user.id)
-    return TodoListOut(todos=todos, total=len(todos))
+async def get_my_todos(
+    limit: int = Query(settings.PAGE_SIZE_DEFAULT, ge=1, le=settings.PAGE_SIZE_MAX),
+    cursor: Optional[str] = Query(None, description="이전 응답의 next_cursor"),
+    with_total: bool = Query(False, description="True면 전체 개수(캐시된 값) 포함"),
+    current_user: UserPrincipal = Depends(get_current_user),
+) -> TodoListOut:
+    todos, next_cursor = await TodoService.get_todos_by_user(
+        current_user.id, limit, decode_cursor(cursor, datetime, int)
+    )
+    total = await TodoService.count_todos_by_user(current_user.id) if with_total else None
+    return TodoListOut(todos=todos, total=total, next_cursor=next_cursor)
+
+
+# -----------------------------
+# 2-1. Todo 일괄 처리 (생성 / 수정 / 완료 / 삭제 혼합, 한 트랜잭션)
+# -----------------------------
+@router.post("/batch", response_model=TodoBatchResponse)
+async def batch_todos(
+    request: TodoBatchRequest,
+    current_user: UserPrincipal = Depends(get_current_user),
+) -> TodoBatchResponse:
+    if len(request.operations) > settings.TODO_BATCH_MAX_OPERATIONS:
+        raise HTTPException(status_code=400, detail="TOO_MANY_OPERATIONS")
+
+    results = await TodoService.apply_batch(current_user.id, request.operations)
+    if any(r.success for r in results):
+        await BriefingStore.invalidate(current_user.id)
+        await TodoService.invalidate_count(current_user.id)
+    return TodoBatchResponse(results=results)
 
 
 # -----------------------------
 # 3. 특정 Todo 조회
 # -----------------------------
 @router.get("/{todo_id}", response_model=TodoOut)
-async def get_todo(todo_id: int, current_user: User = Depends(get_current_user)) -> TodoOut:
+async def get_todo(todo_id: int, current_user: UserPrincipal = Depends(get_current_user)) -> TodoOut:
     todo = await TodoService.get_todo_by_id(todo_id)
     if not todo:
         raise HTTPException(status_code=404, detail="TODO_NOT_FOUND")
@@ -59,18 +94,20 @@ async def get_todo(todo_id: int, current_user: User = Depends(get_current_user))
 async def update_todo(
     todo_id: int,
     request: TodoUpdate,
-    current_user: User = Depends(get_current_user),
+    current_user: UserPrincipal = Depends(get_current_user),
 ) -> Optional[TodoOut]:
-    todo = await TodoService.get_todo_by_id(todo_id)
-    if not todo:
-        raise HTTPException(status_code=404, detail="TODO_NOT_FOUND")
-    if todo.user_id != current_user.id:
-        raise HTTPException(status_code=403, detail="NOT_ALLOWED")
-
-    updated = await TodoService.update_todo(
+    # 소유 확인 + 수정을 한 번에 (UPDATE ... RETURNING)
+    owner_id, updated = await TodoService.update_todo(
         todo_id,
+        current_user.id,
         **request.model_dump(exclude_unset=True)  #  v2 방식
     )
+    if owner_id is None:
+        raise HTTPException(status_code=404, detail="TODO_NOT_FOUND")
+    if updated is None:
+        raise HTTPException(status_code=403, detail="NOT_ALLOWED")
+
+    await BriefingStore.invalidate(current_user.id)
     return updated
 
 
@@ -81,18 +118,17 @@ async def update_todo(
 async def delete_todo(
     todo_id: int,
     hard: bool = Query(False, description="True면 완전 삭제, False면 소프트 삭제"),
-    current_user: User = Depends(get_current_user),
+    current_user: UserPrincipal = Depends(get_current_user),
 ) -> TodoDeleteResponse:
-    todo = await TodoService.get_todo_by_id(todo_id)
-    if not todo:
+    # 소유 확인 + 삭제를 한 번에
+    owner_id, deleted = await TodoService.delete_todo(todo_id, current_user.id, hard=hard)
+    if owner_id is None:
         raise HTTPException(status_code=404, detail="TODO_NOT_FOUND")
-    if todo.user_id != current_user.id:
-        raise HTTPException(status_code=403, detail="NOT_ALLOWED")
-
-    deleted = await TodoService.delete_todo(todo_id, hard=hard)
     if not deleted:
-        raise HTTPException(status_code=500, detail="DELETE_FAILED")
+        raise HTTPException(status_code=403, detail="NOT_ALLOWED")
 
+    await BriefingStore.invalidate(current_user.id)
+    await TodoService.invalidate_count(current_user.id)
     return TodoDeleteResponse(
         message="Todo permanently deleted" if hard else "Todo soft deleted successfully"
     )
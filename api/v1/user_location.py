@@ -1,8 +1,8 @@
 from fastapi import APIRouter, Depends, HTTPException
 from decimal import Decimal
 from models.user_locations import UserLocation
-from models.user import User
 from schemas.user_locations import UserLocationUpdateRequest, UserLocationUpdateResponse
+from core.principal import UserPrincipal
 from core.security import get_current_user
 
 router = APIRouter(prefix="/user-locations", tags=["User Location"])
@@ -11,7 +11,7 @@ router = APIRouter(prefix="/user-locations", tags=["User Location"])
 @router.patch("/", response_model=UserLocationUpdateResponse)
 async def update_user_location(
     request: UserLocationUpdateRequest,
-    current_user: User = Depends(get_current_user)
+    current_user: UserPrincipal = Depends(get_current_user)
 ) -> UserLocationUpdateResponse:
 
     # 로그인한 사용자의 위치 정보를 업데이트하거나 없으면 새로 생성
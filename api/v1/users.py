@@ -1,4 +1,4 @@
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Response
 from mypyc.crash import crash_report
 
 from schemas.user import (
@@ -9,8 +9,9 @@ from schemas.user import (
     UserVerifySuccessResponse,
     PasswordChangeRequest, UserOut,
 )
+from services.auth_service import AuthService
 from services.user_service import UserService
-from models.user import User
+from core.principal import UserPrincipal
 from core.security import get_current_user
 
 router = APIRouter(prefix="/users", tags=["users"])
@@ -19,11 +20,12 @@ router = APIRouter(prefix="/users", tags=["users"])
 # 내 프로필 조회
 # -----------------------------
 @router.get("/me", response_model=UserOut)
-async def get_my_profile(current_user: User = Depends(get_current_user)) -> UserOut:
+async def get_my_profile(current_user: UserPrincipal = Depends(get_current_user)) -> UserOut:
+    user = await current_user.load()  # 전체 프로필이 필요한 경우에만 DB 조회
     return UserOut.model_validate(
         {
-            **current_user.__dict__,
-            "is_google_user": bool(current_user.google_id)
+            **user.__dict__,
+            "is_google_user": bool(user.google_id)
         },
         from_attributes=True,
     )
@@ -34,7 +36,7 @@ async def get_my_profile(current_user: User = Depends(get_current_user)) -> User
 @router.patch("/me", response_model=UserUpdateResponse)
 async def update_my_profile(
     request: UserUpdateRequest,
-    current_user: User = Depends(get_current_user),
+    current_user: UserPrincipal = Depends(get_current_user),
 ) -> UserUpdateResponse:
     updated_user = await UserService.update_profile(
         user_id=current_user.id,
@@ -54,10 +56,11 @@ async def update_my_profile(
 )
 async def change_password(
     request: PasswordChangeRequest,
-    current_user: User = Depends(get_current_user),
+    response: Response,
+    current_user: UserPrincipal = Depends(get_current_user),
 ) -> dict[str, bool]:
     result = await UserService.change_password(
-        user=current_user,
+        user=await current_user.load(),
         old_password=request.old_password,
         new_password=request.new_password,
         new_password_check=request.new_password_check,
@@ -65,13 +68,34 @@ async def change_password(
 
     if not result.get("success"):
         raise HTTPException(status_code=400, detail=result.get("error"))
+
+    # ✅ 세션 버전이 올라가 기존 토큰은 모두 무효 → 현재 기기는 새 버전 토큰으로 로그인 유지
+    tokens = await AuthService.issue_tokens(current_user.id)
+    response.set_cookie(
+        key="access_token",
+        value=tokens["access_token"],
+        httponly=True,
+        domain=".nyangbiseo.store",
+        secure=True,
+        samesite="none",
+        path="/"
+    )
+    response.set_cookie(
+        key="refresh_token",
+        value=tokens["refresh_token"],
+        domain=".nyangbiseo.store",
+        httponly=True,
+        secure=True,
+        samesite="none",
+        path="/"
+    )
     return {"success": True}
 
 # -----------------------------
 # 회원 탈퇴
 # -----------------------------
 @router.delete("/me", response_model=UserDeleteResponse)
-async def delete_my_account(current_user: User = Depends(get_current_user)) -> UserDeleteResponse:
+async def delete_my_account(current_user: UserPrincipal = Depends(get_current_user)) -> UserDeleteResponse:
     deleted = await UserService.delete_user(current_user.id)
     if not deleted:
         raise HTTPException(status_code=404, detail="USER_NOT_FOUND")
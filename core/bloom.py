@@ -0,0 +1,40 @@
+import hashlib
+import math
+from typing import Iterable
+
+
+# ========================
+# 프로세스 내 Bloom filter
+# ========================
+class BloomFilter:
+    """
+    "확실히 없음"을 네트워크 조회 없이 판정하기 위한 비트 배열.
+    - 포함 여부가 False면 실제로도 없음 (false negative 없음)
+    - True면 있을 수도 있음 → 원본 저장소로 확인 필요
+    - 삭제를 지원하지 않으므로 주기적으로 새로 만들어 교체
+    """
+
+    def __init__(self, capacity: int, error_rate: float = 0.001):
+        capacity = max(capacity, 1)
+        self.size = max(int(-capacity * math.log(error_rate) / (math.log(2) ** 2)), 8)
+        self.hash_count = max(int(round(self.size / capacity * math.log(2))), 1)
+        self._bits = bytearray((self.size + 7) // 8)
+        self.count = 0
+
+    def _positions(self, item: str) -> Iterable[int]:
+        # double hashing: h1 + i*h2 (해시 1회로 k개 위치 생성)
+        digest = hashlib.blake2b(item.encode(), digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], "little")
+        h2 = int.from_bytes(digest[8:], "little") | 1
+        return ((h1 + i * h2) % self.size for i in range(self.hash_count))
+
+    def add(self, item: str) -> None:
+        for pos in self._positions(item):
+            self._bits[pos >> 3] |= 1 << (pos & 7)
+        self.count += 1
+
+    def __contains__(self, item: str) -> bool:
+        return all(self._bits[pos >> 3] & (1 << (pos & 7)) for pos in self._positions(item))
+
+    def __len__(self) -> int:
+        return self.count
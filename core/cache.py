@@ -0,0 +1,83 @@
+import json
+import time
+from collections import OrderedDict
+from typing import Any, Optional
+
+from core.redis_client import redis_client
+
+
+# ========================
+# 프로세스 내 LRU 캐시 (TTL 지원)
+# ========================
+class TTLCache:
+    """
+    워커 프로세스 안에서만 쓰는 작은 LRU 캐시.
+    - maxsize 초과 시 가장 오래 안 쓴 항목부터 제거
+    - 항목마다 만료 시각(monotonic)을 함께 저장
+    """
+
+    def __init__(self, maxsize: int = 1024, ttl: float = 60.0):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data: "OrderedDict[str, tuple[float, Any]]" = OrderedDict()
+
+    def get(self, key: str) -> Optional[Any]:
+        item = self._data.get(key)
+        if item is None:
+            return None
+        expires_at, value = item
+        if expires_at <= time.monotonic():
+            del self._data[key]
+            return None
+        self._data.move_to_end(key)
+        return value
+
+    def set(self, key: str, value: Any, ttl: Optional[float] = None) -> None:
+        expires_at = time.monotonic() + (self.ttl if ttl is None else ttl)
+        self._data[key] = (expires_at, value)
+        self._data.move_to_end(key)
+        while len(self._data) > self.maxsize:
+            self._data.popitem(last=False)
+
+    def delete(self, key: str) -> None:
+        self._data.pop(key, None)
+
+    def clear(self) -> None:
+        self._data.clear()
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+
+# ========================
+# Redis JSON 캐시 헬퍼
+# Redis 장애 시에도 요청은 원본 조회로 계속 진행되도록 예외를 삼킴
+# ========================
+async def redis_get_json(key: str) -> Optional[Any]:
+    try:
+        raw = await redis_client.get(key)
+    except Exception as e:
+        print(f"⚠️ Redis 조회 실패 ({key}): {e}")
+        return None
+    if raw is None:
+        return None
+    try:
+        return json.loads(raw)
+    except ValueError:
+        return None
+
+
+async def redis_set_json(key: str, value: Any, ttl: int) -> None:
+    try:
+        await redis_client.set(key, json.dumps(value, ensure_ascii=False, default=str), ex=ttl)
+    except Exception as e:
+        print(f"⚠️ Redis 저장 실패 ({key}): {e}")
+
+
+async def redis_delete(*keys: str) -> None:
+    if not keys:
+        return
+    try:
+        await redis_client.delete(*keys)
+    except Exception as e:
+        print(f"⚠️ Redis 삭제 실패 ({keys}): {e}")
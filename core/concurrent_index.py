@@ -0,0 +1,49 @@
+"""
+수동 마이그레이션(migrations/manual)용 CREATE INDEX CONCURRENTLY 헬퍼.
+- 마이그레이션 파일은 migrations/models로 복사해 aerich가 불러오므로 패키지 안(core)에 둠
+- 쓰기를 막지 않도록 CONCURRENTLY로 생성 → 트랜잭션 밖에서 한 문장씩 실행
+- 이전 시도가 중간에 실패해 INVALID로 남은 인덱스는 지우고 다시 생성
+- 오래 걸리는 인덱스 생성이 끊기지 않도록 command_timeout 없는 커넥션에서만 실행
+"""
+from typing import Dict, Iterable
+
+from tortoise import BaseDBAsyncClient
+from tortoise.backends.base.client import TransactionalDBClient
+
+INVALID_INDEXES_SQL = (
+    "SELECT c.relname AS name FROM pg_index i"
+    " JOIN pg_class c ON c.oid = i.indexrelid"
+    " WHERE NOT i.indisvalid AND c.relname = ANY($1::text[])"
+)
+
+
+def ensure_migration_db(db: BaseDBAsyncClient) -> None:
+    if isinstance(db, TransactionalDBClient):
+        raise RuntimeError(
+            "CREATE INDEX CONCURRENTLY는 트랜잭션 안에서 실행할 수 없습니다. "
+            "`aerich upgrade --in-transaction False`로 적용하세요."
+        )
+    # 타임아웃으로 취소되면 INVALID 인덱스만 남음 (core.db.MIGRATION_TORTOISE_ORM 사용)
+    if getattr(db, "extra", {}).get("command_timeout"):
+        raise RuntimeError(
+            "command_timeout이 설정된 커넥션으로는 인덱스를 만들 수 없습니다. "
+            "`core.db.MIGRATION_TORTOISE_ORM`으로 적용하세요."
+        )
+
+
+async def drop_indexes(db: BaseDBAsyncClient, names: Iterable[str]) -> None:
+    ensure_migration_db(db)
+    for name in names:
+        await db.execute_script(f'DROP INDEX CONCURRENTLY IF EXISTS "{name}";')
+
+
+async def create_indexes(db: BaseDBAsyncClient, indexes: Dict[str, str]) -> None:
+    """indexes: 이름 → "ON table (cols) [WHERE ...]" """
+    ensure_migration_db(db)
+
+    _, invalid = await db.execute_query(INVALID_INDEXES_SQL, [list(indexes)])
+    await drop_indexes(db, [row["name"] for row in invalid])
+
+    # 여러 문장을 한 번에 보내면 암묵적 트랜잭션으로 묶이므로 한 문장씩 실행
+    for name, definition in indexes.items():
+        await db.execute_script(f'CREATE INDEX CONCURRENTLY IF NOT EXISTS "{name}" {definition};')
@@ -18,6 +18,39 @@ class Settings(BaseSettings):
     ALGORITHM: str = Field(default="HS256")
     ACCESS_TOKEN_EXPIRE_MINUTES: int = Field(default=30)
     REFRESH_TOKEN_EXPIRE_DAYS: int = Field(default=7)
+    BCRYPT_ROUNDS: int = Field(default=12, description="bcrypt 비용 계수 (2^N 라운드)")
+    PASSWORD_HASH_WORKERS: int = Field(default=2, description="bcrypt 전용 스레드 수")
+    PASSWORD_HASH_MAX_PENDING: int = Field(default=64, description="bcrypt 대기+실행 작업 최대 수")
+    PASSWORD_HASH_ACQUIRE_TIMEOUT: float = Field(default=2.0, description="bcrypt 대기열 자리 대기 시간 (초), 초과 시 503")
+    TOKEN_REVOCATION_BLOOM_CAPACITY: int = Field(default=200000, description="무효화 토큰 Bloom filter 예상 최대 항목 수")
+    TOKEN_REVOCATION_BLOOM_ERROR_RATE: float = Field(default=0.001, description="무효화 토큰 Bloom filter 오탐률")
+    TOKEN_REVOCATION_RESYNC_INTERVAL: int = Field(default=300, description="Bloom filter 재구성 주기 (초)")
+    SESSION_VERSION_LOCAL_TTL: int = Field(default=5, description="세션 버전 워커 내부 캐시 TTL (초)")
+    SESSION_VERSION_CACHE_TTL: int = Field(default=600, description="세션 버전 Redis 캐시 TTL (초), 원본은 users.session_version")
+    TOKEN_REVOCATION_PURGE_INTERVAL: int = Field(default=3600, description="만료된 토큰 무효화 기록 정리 주기 (초)")
+    TOKEN_REVOCATION_PURGE_BATCH: int = Field(default=5000, description="정리 작업 1회 DELETE 최대 행 수")
+    TOKEN_REVOCATION_STATS_TTL: int = Field(default=60, description="/metrics 무효화 테이블 크기 조회 캐시 (초)")
+    USER_PRINCIPAL_CACHE_TTL: int = Field(default=300, description="인증 사용자 요약 Redis 캐시 TTL (초)")
+    USER_PRINCIPAL_LOCAL_TTL: int = Field(default=10, description="인증 사용자 요약 워커 내부 캐시 TTL (초)")
+
+    # ==============================
+    # 목록 조회 / 내보내기
+    # ==============================
+    PAGE_SIZE_DEFAULT: int = Field(default=50, description="목록 조회 기본 페이지 크기")
+    PAGE_SIZE_MAX: int = Field(default=200, description="목록 조회 최대 페이지 크기")
+    LIST_COUNT_CACHE_TTL: int = Field(default=60, description="목록 총 개수 캐시 TTL (초)")
+    EXPORT_CHUNK_SIZE: int = Field(default=1000, description="내보내기 시 커서에서 한 번에 읽는 행 수")
+    EXPORT_MAX_CONCURRENCY: int = Field(default=2, description="워커당 동시 내보내기 수 (초과 시 503, 백그라운드 풀 크기보다 작게)")
+    TODO_BATCH_MAX_OPERATIONS: int = Field(default=100, description="POST /todos/batch 한 번에 처리할 최대 작업 수")
+    USER_SEARCH_MAX_CANDIDATES: int = Field(default=1000, description="관리자 사용자 검색에서 유사도 순위를 매길 최대 후보 수")
+
+    # ==============================
+    # 로그인 기록 / 활동 집계
+    # ==============================
+    LAST_LOGIN_FLUSH_INTERVAL: int = Field(default=5, description="로그인 시각 버퍼 → DB 일괄 반영 주기 (초)")
+    ACTIVITY_ROLLUP_INTERVAL: int = Field(default=300, description="로그인 활동 집계(DAU/WAU/MAU) 갱신 주기 (초)")
+    ACTIVITY_BACKFILL_DAYS: int = Field(default=90, description="집계 테이블이 비어 있을 때 처음 계산할 일수")
+    ACTIVITY_RETENTION_DAYS: int = Field(default=400, description="일별 사용자 활동 기록 보관 일수")
 
     # ==============================
     # Database
@@ -28,6 +61,25 @@ class Settings(BaseSettings):
     POSTGRES_HOST: str = Field(default="db")
     POSTGRES_PORT: int = Field(default=5432)
     DATABASE_URL: Optional[str] = None
+    DB_POOL_MIN_SIZE: int = Field(default=2, description="요청 처리용 풀 최소 연결 수 (워커당)")
+    DB_POOL_MAX_SIZE: int = Field(default=10, description="요청 처리용 풀 최대 연결 수 (워커당)")
+    DB_BACKGROUND_POOL_MIN_SIZE: int = Field(default=1, description="백그라운드 작업용 풀 최소 연결 수 (워커당)")
+    DB_BACKGROUND_POOL_MAX_SIZE: int = Field(default=3, description="백그라운드 작업용 풀 최대 연결 수 (워커당)")
+    DB_POOL_MAX_QUERIES: int = Field(default=50000, description="연결 하나가 처리할 최대 쿼리 수 (초과 시 재연결)")
+    DB_POOL_MAX_INACTIVE_LIFETIME: float = Field(default=300.0, description="유휴 연결 유지 시간 (초)")
+    DB_STATEMENT_CACHE_SIZE: int = Field(default=100, description="연결당 prepared statement 캐시 수 (pgbouncer transaction 모드면 0)")
+    DB_CONNECT_TIMEOUT: float = Field(default=10.0, description="DB 연결 수립 타임아웃 (초)")
+    DB_COMMAND_TIMEOUT: float = Field(default=30.0, description="쿼리 실행 타임아웃 (초)")
+    DATABASE_REPLICA_URL: Optional[str] = Field(default=None, description="읽기 전용 replica DSN (없으면 모든 조회 primary)")
+    DB_REPLICA_MAX_LAG: float = Field(default=2.0, description="이 시간(초) 이상 지연된 replica는 사용하지 않음")
+    DB_REPLICA_LAG_CHECK_INTERVAL: int = Field(default=5, description="replica 지연 확인 주기 (초)")
+    DB_READ_YOUR_WRITES_TTL: int = Field(default=5, description="쓰기 후 이 시간(초) 동안 해당 사용자 조회는 primary")
+    DB_POOL_ACQUIRE_TIMEOUT: float = Field(default=5.0, description="풀에서 연결을 기다리는 최대 시간 (초), 초과 시 503")
+
+    # ==============================
+    # Redis
+    # ==============================
+    REDIS_URL: str = Field(default="redis://redis:6379/0")
 
     # ==============================
     # Gemini (Google Generative AI)
@@ -37,11 +89,21 @@ class Settings(BaseSettings):
         default="https://generativelanguage.googleapis.com/v1/models/gemini-2.5-flash:generateContent",
         description="Gemini API 기본 URL",
     )
+    BRIEFING_PREFETCH_LEAD_MINUTES: int = Field(default=20, description="시간대 시작 몇 분 전에 브리핑 미리 생성")
+    BRIEFING_PREFETCH_CONCURRENCY: int = Field(default=5, description="브리핑 미리 생성 시 Gemini 동시 호출 수")
+    BRIEFING_ACTIVE_DAYS: int = Field(default=7, description="최근 며칠 내 로그인한 사용자만 미리 생성")
 
     # ==============================
     # 외부 API
     # ==============================
     OPENWEATHER_API_KEY: str = Field(default="", description="OpenWeather API Key")
+    NEWS_REFRESH_INTERVAL: int = Field(default=300, description="뉴스 스냅샷 갱신 주기 (초)")
+    NEWS_STALE_AFTER: int = Field(default=900, description="이 시간(초)이 지난 스냅샷은 응답 후 백그라운드 갱신")
+    NEWS_PARSE_WORKERS: int = Field(default=2, description="뉴스 HTML 파싱 스레드 수")
+    NEWS_SNAPSHOT_TTL: int = Field(default=86400, description="Redis 뉴스 스냅샷 보관 시간 (초)")
+    WEATHER_CACHE_GRID: float = Field(default=0.01, description="날씨 캐시 좌표 격자 (도 단위, 0.01 ≈ 1km)")
+    WEATHER_CACHE_TTL: int = Field(default=600, description="현재 날씨 캐시 TTL (초)")
+    FORECAST_CACHE_TTL: int = Field(default=1800, description="5일 예보 캐시 TTL (초)")
 
     # ==============================
     # 이메일 설정
@@ -55,6 +117,10 @@ class Settings(BaseSettings):
     MAIL_SSL_TLS: bool = Field(default=False)
     USE_CREDENTIALS: bool = Field(default=True)
     VALIDATE_CERTS: bool = Field(default=True)
+    MAIL_SMTP_POOL_SIZE: int = Field(default=2, description="워커당 유지할 SMTP 연결 수")
+    MAIL_OUTBOX_BATCH: int = Field(default=20, description="메일 대기열에서 한 번에 꺼내는 건수")
+    MAIL_MAX_ATTEMPTS: int = Field(default=5, description="메일 발송 최대 시도 횟수")
+    MAIL_RETRY_BASE_DELAY: int = Field(default=5, description="메일 재시도 기본 대기 (초), 시도마다 2배")
 
     # ==============================
     # AWS S3
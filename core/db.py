@@ -1,6 +1,17 @@
-from tortoise import Tortoise
+from typing import Any, Dict, Optional
+
+from tortoise import Tortoise, connections
+from tortoise.backends.base.client import BaseDBAsyncClient
+from tortoise.backends.base.config_generator import expand_db_url
 import os
 
+from core.config import settings
+
+# 요청 처리용 / 백그라운드 작업용 커넥션 분리 (백그라운드 작업이 요청 풀을 잠식하지 않도록)
+DEFAULT_DB = "default"
+BACKGROUND_DB = "background"
+REPLICA_DB = "replica"          # DATABASE_REPLICA_URL 설정 시에만 생성 (읽기 전용 조회)
+
 
 def _build_database_url() -> str:
     database_url = os.getenv("DATABASE_URL")
@@ -8,18 +19,59 @@ def _build_database_url() -> str:
         return database_url
 
     user = os.getenv("POSTGRES_USER", "postgres")
-    password = os.getenv("POSTGRES_PASSWORD", "postgres") 
+    password = os.getenv("POSTGRES_PASSWORD", "postgres")
     host = os.getenv("POSTGRES_HOST", "db")
     port = os.getenv("POSTGRES_PORT", "5432")
     dbname = os.getenv("POSTGRES_DB", "postgres")
-    
+
     return f"postgres://{user}:{password}@{host}:{port}/{dbname}"
 
 
+def _connection_config(url: str, minsize: int, maxsize: int, application_name: str) -> Dict[str, Any]:
+    """DSN + 풀 설정 → Tortoise 커넥션 설정 (엔진은 계측용 asyncpg 클라이언트)"""
+    config = expand_db_url(url)
+    config["engine"] = "core.db_pool"
+    config["credentials"].update(
+        {
+            "minsize": minsize,
+            "maxsize": maxsize,
+            "max_queries": settings.DB_POOL_MAX_QUERIES,
+            "max_inactive_connection_lifetime": settings.DB_POOL_MAX_INACTIVE_LIFETIME,
+            "statement_cache_size": settings.DB_STATEMENT_CACHE_SIZE,
+            "timeout": settings.DB_CONNECT_TIMEOUT,
+            "command_timeout": settings.DB_COMMAND_TIMEOUT,
+            "acquire_timeout": settings.DB_POOL_ACQUIRE_TIMEOUT,
+            "application_name": application_name,
+        }
+    )
+    return config
+
+
+_CONNECTIONS: Dict[str, Any] = {
+    DEFAULT_DB: _connection_config(
+        _build_database_url(),
+        settings.DB_POOL_MIN_SIZE,
+        settings.DB_POOL_MAX_SIZE,
+        "oz-union-api",
+    ),
+    BACKGROUND_DB: _connection_config(
+        _build_database_url(),
+        settings.DB_BACKGROUND_POOL_MIN_SIZE,
+        settings.DB_BACKGROUND_POOL_MAX_SIZE,
+        "oz-union-background",
+    ),
+}
+if settings.DATABASE_REPLICA_URL:
+    _CONNECTIONS[REPLICA_DB] = _connection_config(
+        settings.DATABASE_REPLICA_URL,
+        settings.DB_POOL_MIN_SIZE,
+        settings.DB_POOL_MAX_SIZE,
+        "oz-union-api-replica",
+    )
+
+
 TORTOISE_ORM = {
-    "connections": {
-        "default": _build_database_url(),
-    },
+    "connections": _CONNECTIONS,
     "apps": {
         "models": {
             "models": [
@@ -30,16 +82,48 @@ TORTOISE_ORM = {
                 "models.inquiries",
                 "models.user_locations",
                 "models.token_revocations",
+                "models.user_activity",
                 "aerich.models",   # aerich 내부 관리용
             ],
-            "default_connection": "default",
+            "default_connection": DEFAULT_DB,
         }
     }
 }
 
 
+# aerich 전용 (pyproject [tool.aerich]): 요청용 command_timeout이 CREATE INDEX CONCURRENTLY를
+# 중간에 취소하면 INVALID 인덱스가 남으므로 마이그레이션은 타임아웃 없이 실행
+_MIGRATION_CONNECTION = _connection_config(_build_database_url(), 1, 1, "oz-union-migration")
+_MIGRATION_CONNECTION["credentials"]["command_timeout"] = None
+_MIGRATION_CONNECTION["credentials"]["server_settings"] = {"statement_timeout": "0"}
+
+MIGRATION_TORTOISE_ORM = {
+    "connections": {DEFAULT_DB: _MIGRATION_CONNECTION},
+    "apps": TORTOISE_ORM["apps"],
+}
+
+
+def replica_configured() -> bool:
+    return REPLICA_DB in _CONNECTIONS
+
+
+def background_db() -> BaseDBAsyncClient:
+    """백그라운드 작업(prefetch, 정리, 일괄 반영)용 커넥션"""
+    return connections.get(BACKGROUND_DB)
+
+
+def pool_metrics() -> Dict[str, Optional[Dict[str, Any]]]:
+    """커넥션별 풀 상태 (/metrics)"""
+    result: Dict[str, Optional[Dict[str, Any]]] = {}
+    for name in _CONNECTIONS:
+        client = connections.get(name)
+        metrics = getattr(client, "pool_metrics", None)
+        result[name] = metrics() if metrics else None
+    return result
+
+
 async def init_db() -> None:
     await Tortoise.init(config=TORTOISE_ORM)
 
 async def close_db() -> None:
-    await Tortoise.close_connections()
\ No newline at end of file
+    await Tortoise.close_connections()
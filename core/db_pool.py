@@ -0,0 +1,84 @@
+"""
+Tortoise asyncpg 엔진 + 커넥션 풀 계측.
+TORTOISE_ORM의 "engine": "core.db_pool"로 사용 (Tortoise가 client_class를 찾아 생성).
+"""
+import time
+from typing import Any, Dict, Optional
+
+import asyncpg
+from tortoise.backends.asyncpg.client import AsyncpgDBClient
+
+
+class DBPoolTimeout(Exception):
+    """커넥션 풀 acquire 타임아웃 (main.py에서 503 DB_BUSY로 변환)"""
+
+
+class InstrumentedPool:
+    """
+    asyncpg.Pool 래퍼.
+    - acquire에 타임아웃 적용 (초과 시 DBPoolTimeout, 요청이 무한정 줄 서지 않도록)
+    - 대기 중 요청 수 / 대기 시간 / 타임아웃 횟수 집계
+    """
+
+    def __init__(self, pool: asyncpg.Pool, acquire_timeout: Optional[float]):
+        self._pool = pool
+        self._acquire_timeout = acquire_timeout
+        self.waiting = 0
+        self.acquired = 0
+        self.timeouts = 0
+        self.total_wait = 0.0
+        self.max_wait = 0.0
+
+    async def acquire(self) -> asyncpg.Connection:
+        self.waiting += 1
+        started = time.perf_counter()
+        try:
+            connection = await self._pool.acquire(timeout=self._acquire_timeout)
+        except TimeoutError as e:
+            self.timeouts += 1
+            raise DBPoolTimeout("connection pool acquire timed out") from e
+        finally:
+            self.waiting -= 1
+        wait = time.perf_counter() - started
+        self.acquired += 1
+        self.total_wait += wait
+        self.max_wait = max(self.max_wait, wait)
+        return connection
+
+    def __getattr__(self, name: str) -> Any:
+        # release / close / terminate / expire_connections 등은 그대로 위임
+        return getattr(self._pool, name)
+
+    def metrics(self) -> Dict[str, Any]:
+        size = self._pool.get_size()
+        idle = self._pool.get_idle_size()
+        max_size = self._pool.get_max_size()
+        return {
+            "size": size,
+            "max_size": max_size,
+            "in_use": size - idle,
+            "idle": idle,
+            "waiting": self.waiting,
+            "saturation": round((size - idle) / max_size, 3) if max_size else 0.0,
+            "acquired": self.acquired,
+            "acquire_timeouts": self.timeouts,
+            "avg_acquire_wait_ms": round(self.total_wait / self.acquired * 1000, 2) if self.acquired else 0.0,
+            "max_acquire_wait_ms": round(self.max_wait * 1000, 2),
+        }
+
+
+class InstrumentedAsyncpgClient(AsyncpgDBClient):
+    def __init__(self, *args: Any, acquire_timeout: Optional[float] = None, **kwargs: Any):
+        super().__init__(*args, **kwargs)
+        self._acquire_timeout = float(acquire_timeout) if acquire_timeout else None
+
+    async def create_pool(self, **kwargs: Any) -> InstrumentedPool:  # type: ignore[override]
+        pool = await asyncpg.create_pool(None, **kwargs)
+        return InstrumentedPool(pool, self._acquire_timeout)
+
+    def pool_metrics(self) -> Optional[Dict[str, Any]]:
+        pool = self._pool
+        return pool.metrics() if isinstance(pool, InstrumentedPool) else None
+
+
+client_class = InstrumentedAsyncpgClient
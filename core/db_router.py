@@ -0,0 +1,120 @@
+import asyncio
+from contextvars import ContextVar
+from typing import Any, Dict, Optional
+
+from tortoise import connections
+from tortoise.backends.base.client import BaseDBAsyncClient
+
+from core.config import settings
+from core.db import DEFAULT_DB, REPLICA_DB, background_db, replica_configured
+from core.redis_client import redis_client
+
+RECENT_WRITE_KEY = "db:recent_write:{user_id}"
+
+# 현재 요청의 인증 사용자 (get_current_user에서 설정)
+current_user_id: ContextVar[Optional[int]] = ContextVar("current_user_id", default=None)
+
+# 복제 지연 계산 (재생할 WAL이 없으면 0, 있으면 마지막 재생 트랜잭션 이후 경과 시간)
+REPLICA_LAG_SQL = (
+    "SELECT CASE WHEN pg_last_wal_receive_lsn() = pg_last_wal_replay_lsn() THEN 0"
+    " ELSE COALESCE(EXTRACT(EPOCH FROM now() - pg_last_xact_replay_timestamp()), 0)"
+    " END AS lag"
+)
+
+
+class ReplicaRouter:
+    """
+    읽기 전용 리포지토리 조회를 replica로 보내는 라우터.
+    - replica 미설정 / 지연이 DB_REPLICA_MAX_LAG 초과 / 조회 실패 시 primary
+    - 사용자가 최근 DB_READ_YOUR_WRITES_TTL초 안에 쓰기 요청을 했으면 primary
+      (Redis 마커, 워커 간 공유 → 방금 쓴 내용이 바로 보이도록)
+    """
+
+    def __init__(self) -> None:
+        self._healthy = False
+        self._lag: Optional[float] = None
+        self._task: Optional[asyncio.Task] = None
+        self.replica_reads = 0
+        self.primary_reads = 0
+
+    async def mark_write(self, user_id: int) -> None:
+        if not replica_configured():
+            return
+        try:
+            await redis_client.set(
+                RECENT_WRITE_KEY.format(user_id=user_id), "1", ex=settings.DB_READ_YOUR_WRITES_TTL
+            )
+        except Exception as e:
+            print(f"⚠️ 쓰기 마커 저장 실패 (user={user_id}): {e}")
+
+    async def _recently_wrote(self, user_id: int) -> bool:
+        try:
+            return bool(await redis_client.exists(RECENT_WRITE_KEY.format(user_id=user_id)))
+        except Exception:
+            return True  # 확인할 수 없으면 primary에서 읽음
+
+    async def read_db(self, user_id: Optional[int] = None) -> BaseDBAsyncClient:
+        """읽기용 커넥션 선택 (user_id 생략 시 현재 요청 사용자 기준)"""
+        if not replica_configured() or not self._healthy:
+            self.primary_reads += 1
+            return connections.get(DEFAULT_DB)
+
+        user_id = user_id if user_id is not None else current_user_id.get()
+        if user_id is not None and await self._recently_wrote(user_id):
+            self.primary_reads += 1
+            return connections.get(DEFAULT_DB)
+
+        self.replica_reads += 1
+        return connections.get(REPLICA_DB)
+
+    def bulk_read_db(self) -> BaseDBAsyncClient:
+        """내보내기처럼 커넥션을 오래 잡는 대량 조회용 (요청 풀은 피함)"""
+        if replica_configured() and self._healthy:
+            self.replica_reads += 1
+            return connections.get(REPLICA_DB)
+        return background_db()
+
+    # --------------------
+    # replica 지연 감시 (lifespan)
+    # --------------------
+    async def check_lag(self) -> None:
+        try:
+            _, rows = await connections.get(REPLICA_DB).execute_query(REPLICA_LAG_SQL)
+            self._lag = float(rows[0]["lag"]) if rows else None
+            self._healthy = self._lag is not None and self._lag <= settings.DB_REPLICA_MAX_LAG
+        except Exception as e:
+            print(f"⚠️ replica 지연 확인 실패: {e}")
+            self._lag = None
+            self._healthy = False
+
+    async def _loop(self) -> None:
+        while True:
+            await self.check_lag()
+            await asyncio.sleep(settings.DB_REPLICA_LAG_CHECK_INTERVAL)
+
+    def metrics(self) -> Dict[str, Any]:
+        return {
+            "configured": replica_configured(),
+            "healthy": self._healthy,
+            "lag_seconds": self._lag,
+            "replica_reads": self.replica_reads,
+            "primary_reads": self.primary_reads,
+        }
+
+    def start(self) -> None:
+        if replica_configured() and (self._task is None or self._task.done()):
+            self._task = asyncio.create_task(self._loop())
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+            self._task = None
+        self._healthy = False
+
+
+replica_router = ReplicaRouter()
+
+
+async def read_db(user_id: Optional[int] = None) -> BaseDBAsyncClient:
+    return await replica_router.read_db(user_id)
@@ -0,0 +1,154 @@
+"""
+대용량 목록 스트리밍 내보내기 (NDJSON / CSV).
+- .values() 쿼리를 서버 측 커서로 읽어 chunk 단위로 바로 응답에 씀
+- 한 번에 메모리에 올라가는 행은 EXPORT_CHUNK_SIZE개뿐
+- 내보내기 하나가 다운로드 내내 커넥션 1개를 잡으므로 워커당 EXPORT_MAX_CONCURRENCY개까지만 (초과 시 503)
+"""
+import asyncio
+import csv
+import io
+import json
+from datetime import date, datetime
+from enum import Enum
+from typing import Any, AsyncGenerator, Callable, Dict, List, Optional, Sequence
+
+from fastapi import HTTPException
+from fastapi.responses import StreamingResponse
+from starlette.types import Receive, Scope, Send
+from tortoise.queryset import ValuesQuery
+
+from core.config import settings
+from core.db_router import replica_router
+
+Rows = AsyncGenerator[List[Dict[str, Any]], None]
+Body = AsyncGenerator[bytes, None]
+
+MEDIA_TYPES = {
+    "ndjson": "application/x-ndjson",
+    "csv": "text/csv; charset=utf-8",
+}
+
+_export_slots = asyncio.Semaphore(settings.EXPORT_MAX_CONCURRENCY)
+
+
+async def stream_values(queryset: ValuesQuery, chunk_size: Optional[int] = None) -> Rows:
+    """
+    .values() 쿼리 결과를 chunk_size개씩 전달.
+    - 커서는 트랜잭션 안에서만 유지되므로 내보내기 동안 커넥션 1개를 점유
+      (replica가 정상이면 replica, 아니면 요청 풀이 아닌 백그라운드 풀 사용)
+    """
+    chunk_size = chunk_size or settings.EXPORT_CHUNK_SIZE
+    sql = queryset.sql(params_inline=True)
+    db = replica_router.bulk_read_db()
+    async with db.acquire_connection() as connection:
+        async with connection.transaction(readonly=True):
+            cursor = await connection.cursor(sql)
+            while True:
+                records = await cursor.fetch(chunk_size)
+                if not records:
+                    break
+                yield [dict(record) for record in records]
+
+
+def _json_default(value: Any) -> Any:
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    if isinstance(value, Enum):
+        return value.value
+    return str(value)
+
+
+def _csv_value(value: Any) -> Any:
+    if value is None:
+        return ""
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    if isinstance(value, Enum):
+        return value.value
+    return value
+
+
+async def _ndjson(rows: Rows, columns: Sequence[str]) -> Body:
+    async for chunk in rows:
+        lines = [
+            json.dumps({c: row.get(c) for c in columns}, ensure_ascii=False, default=_json_default)
+            for row in chunk
+        ]
+        yield ("\n".join(lines) + "\n").encode()
+
+
+async def _csv(rows: Rows, columns: Sequence[str]) -> Body:
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    # 엑셀에서 한글이 깨지지 않도록 BOM + 헤더는 첫 chunk와 함께 전송
+    buffer.write("\ufeff")
+    writer.writerow(columns)
+    async for chunk in rows:
+        writer.writerows([_csv_value(row.get(c)) for c in columns] for row in chunk)
+        yield buffer.getvalue().encode()
+        buffer.seek(0)
+        buffer.truncate()
+    if buffer.tell():
+        yield buffer.getvalue().encode()
+
+
+_ENCODERS: Dict[str, Callable[[Rows, Sequence[str]], Body]] = {
+    "ndjson": _ndjson,
+    "csv": _csv,
+}
+
+
+async def _close(body: Body, rows: Rows) -> None:
+    # async for는 중간에 빠져나와도 안쪽 제너레이터를 닫지 않으므로 바깥부터 직접 닫음
+    # (rows가 닫혀야 커서 트랜잭션이 끝나고 커넥션이 풀로 돌아감)
+    await body.aclose()
+    await rows.aclose()
+    _export_slots.release()
+
+
+class _ExportResponse(StreamingResponse):
+    """전송이 끝나거나 클라이언트가 끊기면 (예외 포함) 커넥션과 내보내기 슬롯을 바로 반환"""
+
+    def __init__(self, content: Body, body: Body, rows: Rows, **kwargs: Any) -> None:
+        super().__init__(content, **kwargs)
+        self._body = body
+        self._rows = rows
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        try:
+            await super().__call__(scope, receive, send)
+        finally:
+            await _close(self._body, self._rows)
+
+
+async def export_response(
+    rows: Rows,
+    columns: Sequence[str],
+    fmt: str,
+    filename: str,
+) -> StreamingResponse:
+    if _export_slots.locked():
+        await rows.aclose()
+        raise HTTPException(status_code=503, detail="EXPORT_BUSY")
+    await _export_slots.acquire()
+
+    body = _ENCODERS[fmt](rows, columns)
+    try:
+        # 커넥션 획득 / 쿼리 오류는 응답 헤더를 보내기 전에 드러나도록 첫 chunk를 먼저 읽음
+        first = await anext(body, b"")
+    except BaseException:
+        await _close(body, rows)
+        raise
+
+    async def content() -> Body:
+        yield first
+        async for part in body:
+            yield part
+
+    return _ExportResponse(
+        content(),
+        body,
+        rows,
+        media_type=MEDIA_TYPES[fmt],
+        headers={"Content-Disposition": f'attachment; filename="{filename}.{fmt}"'},
+    )
@@ -0,0 +1,70 @@
+from dataclasses import dataclass
+from typing import Dict
+
+import httpx
+
+# HTTP/2는 httpx[http2] 의존성의 h2 사용 (h2 없이 설치된 환경에서는 HTTP/1.1)
+try:
+    import h2  # noqa: F401
+
+    HTTP2_AVAILABLE = True
+except ImportError:
+    HTTP2_AVAILABLE = False
+
+
+# ========================
+# 외부 연동별 커넥션 설정
+# ========================
+@dataclass(frozen=True)
+class UpstreamConfig:
+    timeout: float
+    max_connections: int = 20
+    max_keepalive_connections: int = 10
+    keepalive_expiry: float = 30.0
+    http2: bool = False
+
+
+UPSTREAMS: Dict[str, UpstreamConfig] = {
+    "openweather": UpstreamConfig(timeout=10),
+    "naver": UpstreamConfig(timeout=15, max_connections=10, max_keepalive_connections=6, http2=True),
+    "google": UpstreamConfig(timeout=30, max_connections=10, max_keepalive_connections=5, http2=True),
+    "gemini": UpstreamConfig(timeout=15, max_connections=50, max_keepalive_connections=20, http2=True),
+}
+
+_clients: Dict[str, httpx.AsyncClient] = {}
+
+
+def _build_client(name: str) -> httpx.AsyncClient:
+    config = UPSTREAMS[name]
+    return httpx.AsyncClient(
+        timeout=httpx.Timeout(config.timeout, connect=min(config.timeout, 5.0)),
+        limits=httpx.Limits(
+            max_connections=config.max_connections,
+            max_keepalive_connections=config.max_keepalive_connections,
+            keepalive_expiry=config.keepalive_expiry,
+        ),
+        http2=config.http2 and HTTP2_AVAILABLE,
+    )
+
+
+def get_http_client(name: str) -> httpx.AsyncClient:
+    """
+    앱 전역에서 공유하는 외부 연동용 AsyncClient 반환.
+    lifespan에서 미리 만들어 두지만, 없으면 여기서 생성.
+    """
+    client = _clients.get(name)
+    if client is None or client.is_closed:
+        client = _build_client(name)
+        _clients[name] = client
+    return client
+
+
+async def init_http_clients() -> None:
+    for name in UPSTREAMS:
+        get_http_client(name)
+
+
+async def close_http_clients() -> None:
+    for client in _clients.values():
+        await client.aclose()
+    _clients.clear()
@@ -0,0 +1,274 @@
+import asyncio
+import json
+import os
+import socket
+import time
+from dataclasses import asdict, dataclass
+from email.message import EmailMessage
+from typing import Any, Optional
+
+import aiosmtplib
+
+from core.config import settings
+from core.redis_client import redis_client
+
+OUTBOX_STREAM = "mail:outbox"          # 발송 대기 (Redis stream)
+OUTBOX_GROUP = "mailers"               # 워커 consumer group
+RETRY_KEY = "mail:outbox:retry"        # 재시도 대기 (zset, score = 재시도 시각)
+DEAD_KEY = "mail:outbox:dead"          # 최대 재시도 초과 (list)
+OUTBOX_MAXLEN = 10000
+CLAIM_IDLE_MS = 60_000                 # 이 시간 동안 ack 안 된 메시지는 다른 워커가 가져감
+
+# 재시도 시각이 된 메일을 retry zset → stream으로 원자적으로 이동 (스크립트 실행 중에는 다른 명령이 끼어들지 않음)
+# XADD가 실패하면 스크립트가 거기서 멈추므로 ZREM 전에 XADD
+PROMOTE_RETRIES_LUA = """
+local due = redis.call('ZRANGEBYSCORE', KEYS[1], '-inf', ARGV[1], 'LIMIT', 0, ARGV[2])
+for _, raw in ipairs(due) do
+    redis.call('XADD', KEYS[2], 'MAXLEN', '~', ARGV[3], '*', 'mail', raw)
+    redis.call('ZREM', KEYS[1], raw)
+end
+return #due
+"""
+
+
+@dataclass(slots=True)
+class OutgoingMail:
+    to: str
+    subject: str
+    body: str
+    attempts: int = 0
+
+    def to_fields(self) -> dict[str, str]:
+        return {"mail": json.dumps(asdict(self), ensure_ascii=False)}
+
+    @classmethod
+    def from_fields(cls, fields: dict[str, Any]) -> "OutgoingMail":
+        return cls(**json.loads(fields["mail"]))
+
+    def to_message(self) -> EmailMessage:
+        message = EmailMessage()
+        message["From"] = settings.MAIL_FROM or settings.MAIL_USERNAME
+        message["To"] = self.to
+        message["Subject"] = self.subject
+        message.set_content(self.body)
+        return message
+
+
+# ========================
+# SMTP 연결 풀 (연결 / TLS / 로그인을 메시지마다 반복하지 않도록 유지)
+# ========================
+class SMTPPool:
+    """
+    - 동시 발송 수는 세마포어(size)로 제한: 자리를 잡은 뒤 유휴 연결을 꺼내거나 새로 연결
+    - 연결 실패 / 발송 실패로 연결을 버려도 자리는 반납되므로 대기 중인 발송이 멈추지 않음
+    - 수신자 거부처럼 메시지 자체의 오류는 연결을 그대로 재사용 (aiosmtplib가 RSET 처리)
+    """
+
+    def __init__(self, size: int):
+        self._slots = asyncio.Semaphore(size)
+        self._idle: "asyncio.LifoQueue[aiosmtplib.SMTP]" = asyncio.LifoQueue()
+
+    async def _connect(self) -> aiosmtplib.SMTP:
+        smtp = aiosmtplib.SMTP(
+            hostname=settings.MAIL_SERVER,
+            port=settings.MAIL_PORT,
+            use_tls=settings.MAIL_SSL_TLS,
+            start_tls=settings.MAIL_STARTTLS,
+            validate_certs=settings.VALIDATE_CERTS,
+            timeout=30,
+        )
+        await smtp.connect()
+        if settings.USE_CREDENTIALS:
+            await smtp.login(settings.MAIL_USERNAME, settings.MAIL_PASSWORD)
+        return smtp
+
+    async def _acquire(self) -> aiosmtplib.SMTP:
+        """자리를 잡은 상태에서 호출: 살아 있는 유휴 연결, 없으면 새 연결"""
+        while not self._idle.empty():
+            smtp = self._idle.get_nowait()
+            if smtp.is_connected:
+                return smtp
+            self._discard(smtp)
+        return await self._connect()
+
+    def _discard(self, smtp: aiosmtplib.SMTP) -> None:
+        try:
+            smtp.close()
+        except Exception:
+            pass
+
+    async def send(self, message: EmailMessage) -> None:
+        async with self._slots:
+            smtp = await self._acquire()
+            try:
+                try:
+                    await smtp.send_message(message)
+                except aiosmtplib.SMTPServerDisconnected:
+                    # 서버가 유휴 연결을 끊은 경우: 한 번만 다시 연결해서 재전송
+                    await smtp.connect()
+                    if settings.USE_CREDENTIALS:
+                        await smtp.login(settings.MAIL_USERNAME, settings.MAIL_PASSWORD)
+                    await smtp.send_message(message)
+            except (aiosmtplib.SMTPRecipientsRefused, aiosmtplib.SMTPResponseException):
+                # 메시지 단위 거부 (잘못된 주소 등): 연결이 살아 있으면 재사용
+                if smtp.is_connected:
+                    self._idle.put_nowait(smtp)
+                else:
+                    self._discard(smtp)
+                raise
+            except BaseException:
+                self._discard(smtp)
+                raise
+            self._idle.put_nowait(smtp)
+
+    async def close(self) -> None:
+        while not self._idle.empty():
+            smtp = self._idle.get_nowait()
+            try:
+                await smtp.quit()
+            except Exception:
+                smtp.close()
+
+
+# ========================
+# 메일 발송 대기열 (Redis stream) + 발송 워커
+# ========================
+class MailOutbox:
+    """
+    요청 경로에서는 Redis stream에 넣기만 하고 바로 반환.
+    - 각 워커 프로세스의 consumer가 배치 단위로 꺼내 SMTP 풀로 발송
+    - 실패 시 지수 백오프로 재시도, MAIL_MAX_ATTEMPTS 초과 시 dead 목록으로 이동
+    - 죽은 워커가 ack하지 못한 메시지는 다른 워커가 XAUTOCLAIM으로 회수
+    """
+
+    def __init__(self) -> None:
+        self._pool = SMTPPool(settings.MAIL_SMTP_POOL_SIZE)
+        self._consumer = f"{socket.gethostname()}:{os.getpid()}"
+        self._task: Optional[asyncio.Task] = None
+        self.sent = 0
+        self.failed = 0
+
+    async def enqueue(self, to: str, subject: str, body: str) -> None:
+        mail = OutgoingMail(to=to, subject=subject, body=body)
+        try:
+            await redis_client.xadd(
+                OUTBOX_STREAM, mail.to_fields(), maxlen=OUTBOX_MAXLEN, approximate=True
+            )
+        except Exception as e:
+            # Redis 장애 시에는 기존처럼 바로 발송
+            print(f"⚠️ 메일 대기열 저장 실패, 직접 발송: {e}")
+            await self._pool.send(mail.to_message())
+
+    # --------------------
+    # 발송 워커
+    # --------------------
+    async def _ensure_group(self) -> None:
+        try:
+            await redis_client.xgroup_create(OUTBOX_STREAM, OUTBOX_GROUP, id="0", mkstream=True)
+        except Exception as e:
+            if "BUSYGROUP" not in str(e):
+                raise
+
+    async def _promote_due_retries(self) -> int:
+        """재시도 시각이 된 메일을 다시 stream으로 (Lua 스크립트 1회, 옮기다 실패해도 zset에 남음)"""
+        moved = await redis_client.eval(
+            PROMOTE_RETRIES_LUA, 2, RETRY_KEY, OUTBOX_STREAM,
+            time.time(), settings.MAIL_OUTBOX_BATCH, OUTBOX_MAXLEN,
+        )
+        return int(moved)
+
+    async def _deliver(self, entry_id: str, fields: dict[str, Any]) -> None:
+        try:
+            mail = OutgoingMail.from_fields(fields)
+        except (KeyError, TypeError, ValueError) as e:
+            print(f"⚠️ 잘못된 메일 대기열 항목 제거 ({entry_id}): {e}")
+            await self._ack(entry_id)
+            return
+
+        try:
+            await self._pool.send(mail.to_message())
+            self.sent += 1
+        except Exception as e:
+            self.failed += 1
+            mail.attempts += 1
+            payload = mail.to_fields()["mail"]
+            if mail.attempts >= settings.MAIL_MAX_ATTEMPTS:
+                print(f"⚠️ 메일 발송 최종 실패 ({mail.to}): {e}")
+                await redis_client.rpush(DEAD_KEY, payload)
+            else:
+                delay = settings.MAIL_RETRY_BASE_DELAY * (2 ** (mail.attempts - 1))
+                print(f"⚠️ 메일 발송 실패, {delay}초 후 재시도 ({mail.to}): {e}")
+                await redis_client.zadd(RETRY_KEY, {payload: time.time() + delay})
+        await self._ack(entry_id)
+
+    async def _ack(self, entry_id: str) -> None:
+        async with redis_client.pipeline(transaction=False) as pipe:
+            pipe.xack(OUTBOX_STREAM, OUTBOX_GROUP, entry_id)
+            pipe.xdel(OUTBOX_STREAM, entry_id)
+            await pipe.execute()
+
+    async def _read_batch(self) -> list[tuple[str, dict[str, Any]]]:
+        # 다른 워커가 처리하다 멈춘 메시지부터 회수
+        claimed = await redis_client.xautoclaim(
+            OUTBOX_STREAM, OUTBOX_GROUP, self._consumer,
+            min_idle_time=CLAIM_IDLE_MS, start_id="0-0", count=settings.MAIL_OUTBOX_BATCH,
+        )
+        entries: list[tuple[str, dict[str, Any]]] = list(claimed[1]) if claimed else []
+        if entries:
+            return entries
+
+        result = await redis_client.xreadgroup(
+            OUTBOX_GROUP, self._consumer, {OUTBOX_STREAM: ">"},
+            count=settings.MAIL_OUTBOX_BATCH, block=5000,
+        )
+        for _, stream_entries in result or []:
+            entries.extend(stream_entries)
+        return entries
+
+    async def _loop(self) -> None:
+        while True:
+            try:
+                await self._ensure_group()
+                while True:
+                    await self._promote_due_retries()
+                    entries = await self._read_batch()
+                    if entries:
+                        await asyncio.gather(
+                            *(self._deliver(entry_id, fields) for entry_id, fields in entries)
+                        )
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                print(f"⚠️ 메일 발송 워커 오류: {e}")
+                await asyncio.sleep(1)
+
+    async def metrics(self) -> dict[str, Any]:
+        try:
+            async with redis_client.pipeline(transaction=False) as pipe:
+                pipe.xlen(OUTBOX_STREAM)
+                pipe.zcard(RETRY_KEY)
+                pipe.llen(DEAD_KEY)
+                queued, retrying, dead = await pipe.execute()
+        except Exception:
+            queued = retrying = dead = None
+        return {
+            "queued": queued,
+            "retrying": retrying,
+            "dead": dead,
+            "sent": self.sent,
+            "failed": self.failed,
+        }
+
+    def start(self) -> None:
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._loop())
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+            self._task = None
+        await self._pool.close()
+
+
+mail_outbox = MailOutbox()
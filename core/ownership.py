@@ -0,0 +1,67 @@
+"""
+본인 소유 행에 대한 수정 / 삭제를 SQL 1문장으로 처리.
+
+대상 행(id)을 CTE로 먼저 고르고, user_id가 일치할 때만 UPDATE / DELETE 한 뒤
+(소유자 id, 반영된 행)을 함께 돌려받음 → 조회 없이 404 / 403 구분
+- 행 없음           → (None, None)   : 404
+- 소유자 불일치      → (owner_id, None): 403
+- 반영됨            → (owner_id, row)
+"""
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+from tortoise import connections
+
+from core.db import DEFAULT_DB
+
+OwnedResult = Tuple[Optional[int], Optional[Dict[str, Any]]]
+
+
+def _target_cte(table: str, live_only: bool) -> str:
+    live = " AND deleted_at IS NULL" if live_only else ""
+    return f"target AS (SELECT id, user_id FROM {table} WHERE id = $1{live})"
+
+
+def owned_update_sql(table: str, columns: Dict[str, str], returning: Sequence[str]) -> str:
+    """
+    columns: 컬럼명 → PostgreSQL 타입 ($3부터 순서대로 바인딩, NULL이면 기존 값 유지)
+    파라미터: $1 = id, $2 = user_id
+    """
+    sets = ", ".join(
+        f"{column} = COALESCE(${position}::{pg_type}, t.{column})"
+        for position, (column, pg_type) in enumerate(columns.items(), start=3)
+    )
+    return (
+        f"WITH {_target_cte(table, live_only=True)},"
+        f" changed AS (UPDATE {table} AS t SET {sets}, updated_at = now()"
+        f" FROM target WHERE t.id = target.id AND target.user_id = $2 AND t.deleted_at IS NULL"
+        f" RETURNING {', '.join('t.' + c for c in returning)})"
+        f" SELECT target.user_id AS owner_id, changed.* FROM target LEFT JOIN changed ON TRUE"
+    )
+
+
+def owned_soft_delete_sql(table: str) -> str:
+    return (
+        f"WITH {_target_cte(table, live_only=True)},"
+        f" changed AS (UPDATE {table} AS t SET deleted_at = now(), updated_at = now()"
+        f" FROM target WHERE t.id = target.id AND target.user_id = $2 AND t.deleted_at IS NULL"
+        f" RETURNING t.id)"
+        f" SELECT target.user_id AS owner_id, changed.id FROM target LEFT JOIN changed ON TRUE"
+    )
+
+
+def owned_hard_delete_sql(table: str, live_only: bool) -> str:
+    return (
+        f"WITH {_target_cte(table, live_only)},"
+        f" changed AS (DELETE FROM {table} AS t USING target"
+        f" WHERE t.id = target.id AND target.user_id = $2 RETURNING t.id)"
+        f" SELECT target.user_id AS owner_id, changed.id FROM target LEFT JOIN changed ON TRUE"
+    )
+
+
+async def execute_owned(sql: str, params: List[Any]) -> OwnedResult:
+    rows = await connections.get(DEFAULT_DB).execute_query_dict(sql, params)
+    if not rows:
+        return None, None
+    row = dict(rows[0])
+    owner_id = row.pop("owner_id")
+    return owner_id, (row if row.get("id") is not None else None)
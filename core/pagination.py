@@ -0,0 +1,98 @@
+"""
+keyset 페이지네이션.
+- 커서: 마지막 행의 정렬 키 값들을 JSON 배열 → base64(url-safe)로 감싼 불투명 문자열
+- 목록 총 개수는 요청 시에만 계산하고 Redis에 잠시 캐시
+"""
+import base64
+import json
+from datetime import datetime
+from typing import Any, Callable, Optional, Tuple
+
+from fastapi import HTTPException
+from tortoise.expressions import Q
+from tortoise.queryset import QuerySet
+
+from core.cache import redis_delete, redis_get_json, redis_set_json
+from core.config import settings
+
+
+def encode_cursor(*values: Any) -> str:
+    payload = [v.isoformat() if isinstance(v, datetime) else v for v in values]
+    raw = json.dumps(payload, separators=(",", ":")).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_cursor(
+    cursor: Optional[str], *types: type | Callable[[Any], Any]
+) -> Optional[Tuple[Any, ...]]:
+    """
+    커서 → 정렬 키 튜플 (types 순서대로 변환, datetime은 ISO 문자열에서 복원).
+    커서가 없으면 None, 형식이 잘못되면 400.
+    """
+    if not cursor:
+        return None
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        values = json.loads(raw)
+        if not isinstance(values, list) or len(values) != len(types):
+            raise ValueError(cursor)
+        return tuple(
+            datetime.fromisoformat(v) if t is datetime else t(v)
+            for t, v in zip(types, values)
+        )
+    except (ValueError, TypeError):
+        raise HTTPException(status_code=400, detail="INVALID_CURSOR")
+
+
+def after_filter(field: str, after: Tuple[Any, int], descending: bool) -> Q:
+    """
+    (field, id) 정렬에서 after 다음 행들만 남기는 조건.
+    field 범위 조건을 따로 두어 (user_id, field) 인덱스 범위 스캔이 가능하도록 함.
+    """
+    value, last_id = after
+    op = "lt" if descending else "gt"
+    range_filter: dict[str, Any] = {f"{field}__{op}e": value}
+    value_filter: dict[str, Any] = {f"{field}__{op}": value}
+    id_filter: dict[str, Any] = {f"id__{op}": last_id}
+    return Q(**range_filter) & (Q(**value_filter) | Q(**id_filter))
+
+
+async def fetch_page(
+    queryset: QuerySet,
+    field: str,
+    limit: int,
+    after: Optional[Tuple[Any, int]] = None,
+    descending: bool = False,
+    values: Tuple[str, ...] = (),
+) -> Tuple[list, Optional[str]]:
+    """
+    (field, id) 기준 keyset 페이지 조회 → (행 목록, 다음 페이지 커서)
+    - limit + 1개를 읽어 다음 페이지 존재 여부를 판단
+    - values 지정 시 모델 대신 해당 컬럼만 dict로 조회 (field, id 포함해야 함)
+    """
+    if after is not None:
+        queryset = queryset.filter(after_filter(field, after, descending))
+    prefix = "-" if descending else ""
+    queryset = queryset.order_by(f"{prefix}{field}", f"{prefix}id").limit(limit + 1)
+    rows = await (queryset.values(*values) if values else queryset)
+    if len(rows) <= limit:
+        return list(rows), None
+    rows = rows[:limit]
+    last = rows[-1]
+    if isinstance(last, dict):
+        return rows, encode_cursor(last[field], last["id"])
+    return rows, encode_cursor(getattr(last, field), last.id)
+
+
+async def cached_count(key: str, queryset: QuerySet) -> int:
+    """목록 총 개수 (LIST_COUNT_CACHE_TTL 동안 Redis 캐시, 생성/삭제 시 invalidate_count)"""
+    cached = await redis_get_json(key)
+    if isinstance(cached, int):
+        return cached
+    total = await queryset.count()
+    await redis_set_json(key, total, settings.LIST_COUNT_CACHE_TTL)
+    return total
+
+
+async def invalidate_count(*keys: str) -> None:
+    await redis_delete(*keys)
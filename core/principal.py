@@ -0,0 +1,95 @@
+from dataclasses import dataclass, field
+from datetime import date
+from typing import Any, Optional
+
+from fastapi import HTTPException
+
+from core.cache import TTLCache, redis_delete, redis_get_json, redis_set_json
+from core.config import settings
+from models.user import User
+
+PRINCIPAL_KEY = "user:principal:{user_id}"
+
+# 워커 내부 캐시는 다른 워커의 무효화를 받지 못하므로 짧게 유지
+_local_cache = TTLCache(maxsize=10000, ttl=settings.USER_PRINCIPAL_LOCAL_TTL)
+
+
+@dataclass(slots=True)
+class UserPrincipal:
+    """
+    인증된 사용자 요약 정보 (핸들러가 실제로 쓰는 필드만).
+    전체 User 객체가 필요하면 load()로 그때 조회.
+    """
+    id: int
+    is_active: bool
+    is_superuser: bool
+    birthday: Optional[date]
+    _user: Optional[User] = field(default=None, repr=False, compare=False)
+
+    async def load(self) -> User:
+        """전체 User ORM 객체 (요청 내에서 한 번만 조회)"""
+        if self._user is None:
+            user = await User.get_or_none(id=self.id)
+            if not user:
+                raise HTTPException(status_code=401, detail="USER_NOT_FOUND")
+            self._user = user
+        return self._user
+
+    @classmethod
+    def from_user(cls, user: User) -> "UserPrincipal":
+        return cls(
+            id=user.id,
+            is_active=user.is_active,
+            is_superuser=user.is_superuser,
+            birthday=user.birthday,
+            _user=user,
+        )
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "id": self.id,
+            "is_active": self.is_active,
+            "is_superuser": self.is_superuser,
+            "birthday": self.birthday.isoformat() if self.birthday else None,
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> "UserPrincipal":
+        birthday = data.get("birthday")
+        return cls(
+            id=int(data["id"]),
+            is_active=bool(data["is_active"]),
+            is_superuser=bool(data["is_superuser"]),
+            birthday=date.fromisoformat(birthday) if birthday else None,
+        )
+
+
+async def get_user_principal(user_id: int) -> Optional[UserPrincipal]:
+    """로컬 LRU → Redis → DB 순서로 사용자 요약 조회"""
+    key = PRINCIPAL_KEY.format(user_id=user_id)
+
+    cached = _local_cache.get(key)
+    if cached is not None:
+        return UserPrincipal.from_dict(cached)
+
+    cached = await redis_get_json(key)
+    if cached is not None:
+        _local_cache.set(key, cached)
+        return UserPrincipal.from_dict(cached)
+
+    user = await User.get_or_none(id=user_id)
+    if not user:
+        return None
+
+    principal = UserPrincipal.from_user(user)
+    data = principal.to_dict()
+    _local_cache.set(key, data)
+    await redis_set_json(key, data, settings.USER_PRINCIPAL_CACHE_TTL)
+    return principal
+
+
+async def invalidate_user_principal(user_id: int) -> None:
+    """프로필/상태/비밀번호 변경, 탈퇴 시 호출"""
+    key = PRINCIPAL_KEY.format(user_id=user_id)
+    _local_cache.delete(key)
+    await redis_delete(key)
@@ -0,0 +1,6 @@
+import redis.asyncio as redis
+
+from core.config import settings
+
+# ✅ 앱 전역 Redis 연결 (인증 코드, 캐시 등 공용)
+redis_client = redis.from_url(settings.REDIS_URL, decode_responses=True)
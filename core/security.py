@@ -1,10 +1,17 @@
+import hashlib
+import uuid
+from typing import Any
+
 import jwt
 from fastapi import Depends, HTTPException, status, Request, Response
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 
 from core.config import settings
-from models.user import User
-from datetime import datetime, timedelta
+from core.db_router import current_user_id
+from core.principal import UserPrincipal, get_user_principal
+from core.session_version import get_session_version
+from datetime import datetime, timedelta, timezone
+from services.token_revocation_service import token_revocation_store
 
 # bearer_scheme = HTTPBearer(
 #     description="로그인(/auth/login)에서 발급받은 Bearer Token을 입력하세요."
@@ -13,16 +20,48 @@ from datetime import datetime, timedelta
 
 #JWT 생성 관련 (access-token 발급)
 
-def create_access_token(user_id: int) -> str:
-    expire = datetime.utcnow() + timedelta(minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES)
-    payload = {"sub": str(user_id), "exp": expire}
+def _encode_token(user_id: int, expires_in: timedelta, session_version: int) -> str:
+    expire = datetime.utcnow() + expires_in
+    payload = {
+        "sub": str(user_id),
+        "exp": expire,
+        "jti": uuid.uuid4().hex,
+        "ver": session_version,  # 세션 버전 (증가 시 이전 토큰 전부 무효)
+    }
     return jwt.encode(payload, settings.SECRET_KEY, algorithm=settings.ALGORITHM)
 
 
+def create_access_token(user_id: int, session_version: int = 0) -> str:
+    return _encode_token(
+        user_id, timedelta(minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES), session_version
+    )
+
+
+def create_refresh_token(user_id: int, session_version: int = 0) -> str:
+    return _encode_token(
+        user_id, timedelta(days=settings.REFRESH_TOKEN_EXPIRE_DAYS), session_version
+    )
+
+
+def token_jti(payload: dict[str, Any], token: str) -> str:
+    """jti 클레임 (jti 없이 발급된 기존 토큰은 토큰 해시로 대체)"""
+    jti = payload.get("jti")
+    return str(jti) if jti else hashlib.sha256(token.encode()).hexdigest()
+
+
+def token_expires_at(payload: dict[str, Any]) -> datetime:
+    return datetime.fromtimestamp(int(payload["exp"]), tz=timezone.utc)
+
+
+async def _is_session_current(user_id: int, payload: dict[str, Any]) -> bool:
+    """토큰의 세션 버전이 현재 버전과 같은지 (캐시된 정수 비교 1회, Redis 장애 시 DB 기준)"""
+    return int(payload.get("ver", 0)) == await get_session_version(user_id)
+
+
 # ========================
 # 인증/인가 유틸
 # ========================
-async def get_current_user(request: Request, response: Response) -> User:
+async def get_current_user(request: Request, response: Response) -> UserPrincipal:
     # 1) 쿠키 확인
     token = request.cookies.get("access_token")
     refresh_token = request.cookies.get("refresh_token")
@@ -39,6 +78,7 @@ async def get_current_user(request: Request, response: Response) -> User:
         if not sub:
             raise HTTPException(status_code=401, detail="INVALID_ACCESS_TOKEN")
         user_id = int(sub)
+        access_jti = token_jti(payload, token)
 
     except jwt.ExpiredSignatureError:
         # 3) Access Token 만료 → Refresh Token 확인
@@ -57,8 +97,14 @@ async def get_current_user(request: Request, response: Response) -> User:
 
             user_id = int(sub)
 
+            # 로그아웃된 Refresh Token으로는 재발급 불가
+            if await token_revocation_store.is_revoked(token_jti(refresh_payload, refresh_token)):
+                raise HTTPException(status_code=401, detail="TOKEN_REVOKED")
+            if not await _is_session_current(user_id, refresh_payload):
+                raise HTTPException(status_code=401, detail="SESSION_REVOKED")
+
             # 새로운 Access Token 재발급 + 쿠키 갱신
-            new_access = create_access_token(user_id)
+            new_access = create_access_token(user_id, int(refresh_payload.get("ver", 0)))
 
             response.delete_cookie(
                 key="access_token",
@@ -78,6 +124,8 @@ async def get_current_user(request: Request, response: Response) -> User:
                 path= "/"
             )
 
+        except HTTPException:
+            raise
         except jwt.ExpiredSignatureError:
             raise HTTPException(status_code=401, detail="REFRESH_TOKEN_EXPIRED")
         except Exception:
@@ -86,15 +134,26 @@ async def get_current_user(request: Request, response: Response) -> User:
     except Exception:
         raise HTTPException(status_code=401, detail="TOKEN_INVALID")
 
-    # 4) DB 조회
-    user = await User.get_or_none(id=user_id)
+    else:
+        # 로그아웃된 Access Token 차단 (대부분 Bloom filter에서 네트워크 없이 통과)
+        if await token_revocation_store.is_revoked(access_jti):
+            raise HTTPException(status_code=401, detail="TOKEN_REVOKED")
+        if not await _is_session_current(user_id, payload):
+            raise HTTPException(status_code=401, detail="SESSION_REVOKED")
+
+    # 4) 사용자 요약 조회 (캐시 우선, 전체 User는 필요할 때 principal.load())
+    user = await get_user_principal(user_id)
     if not user:
         raise HTTPException(status_code=401, detail="USER_NOT_FOUND")
 
+    # 5) replica 라우팅용: 읽기 조회 기준 사용자 / 쓰기 요청이면 응답 후 마커 기록
+    current_user_id.set(user.id)
+    request.state.user_id = user.id
+
     return user
 
 
-async def get_current_admin(current_user: User = Depends(get_current_user)) -> User:
+async def get_current_admin(current_user: UserPrincipal = Depends(get_current_user)) -> UserPrincipal:
     """관리자 권한 확인"""
     if not current_user.is_superuser:
         raise HTTPException(status_code=403, detail="NOT_ENOUGH_PRIVILEGES")
@@ -0,0 +1,75 @@
+from tortoise import connections
+from tortoise.expressions import F
+
+from core.cache import TTLCache
+from core.config import settings
+from core.db import DEFAULT_DB
+from core.redis_client import redis_client
+from models.user import User
+
+# users.session_version이 원본, Redis / 워커 내부 캐시는 조회용 사본
+# (TTL 없이 Redis에만 있던 이전 키 user:session_version:*는 읽지 않음)
+SESSION_VERSION_KEY = "user:session_ver:{user_id}"
+
+# 다른 워커의 버전 증가는 최대 SESSION_VERSION_LOCAL_TTL초 뒤에 반영됨
+_local_cache = TTLCache(maxsize=10000, ttl=settings.SESSION_VERSION_LOCAL_TTL)
+
+
+async def _cache_set(key: str, version: int) -> None:
+    _local_cache.set(key, version)
+    try:
+        await redis_client.set(key, version, ex=settings.SESSION_VERSION_CACHE_TTL)
+    except Exception as e:
+        print(f"⚠️ 세션 버전 캐시 저장 실패 ({key}): {e}")
+
+
+async def get_session_version(user_id: int) -> int:
+    """
+    사용자의 현재 세션 버전 (토큰의 ver 클레임과 비교).
+    로컬 캐시 → Redis → DB 순서로 조회 (Redis 장애 / 키 유실 시 DB 값 사용)
+    """
+    key = SESSION_VERSION_KEY.format(user_id=user_id)
+    cached = _local_cache.get(key)
+    if cached is not None:
+        return int(cached)
+
+    try:
+        raw = await redis_client.get(key)
+    except Exception as e:
+        print(f"⚠️ 세션 버전 조회 실패, DB 사용 (user={user_id}): {e}")
+        raw = None
+    if raw is not None:
+        version = int(raw)
+        _local_cache.set(key, version)
+        return version
+
+    # 복제 지연으로 이전 버전을 읽지 않도록 primary에서 조회
+    rows = await User.filter(id=user_id).using_db(connections.get(DEFAULT_DB)).values("session_version")
+    version = int(rows[0]["session_version"]) if rows else 0
+    await _cache_set(key, version)
+    return version
+
+
+async def bump_session_version(user_id: int) -> int:
+    """
+    버전 증가 → 그 전에 발급된 모든 토큰 무효화 (비밀번호 변경, 비활성화, 전체 로그아웃).
+    DB 반영이 실패하면 예외를 그대로 올림 (무효화가 조용히 빠지지 않도록)
+    """
+    key = SESSION_VERSION_KEY.format(user_id=user_id)
+    db = connections.get(DEFAULT_DB)
+    await User.filter(id=user_id).using_db(db).update(session_version=F("session_version") + 1)
+    rows = await User.filter(id=user_id).using_db(db).values("session_version")
+    version = int(rows[0]["session_version"]) if rows else 0
+
+    _local_cache.delete(key)
+    try:
+        await redis_client.set(key, version, ex=settings.SESSION_VERSION_CACHE_TTL)
+    except Exception as e:
+        # 이전 버전이 Redis에 남아 있을 수 있으므로 지우기 시도 (실패해도 TTL 뒤에는 DB 값으로 돌아옴)
+        print(f"⚠️ 세션 버전 캐시 갱신 실패 (user={user_id}): {e}")
+        try:
+            await redis_client.delete(key)
+        except Exception:
+            pass
+    _local_cache.set(key, version)
+    return version
@@ -1,22 +1,5 @@
 from fastapi.security import HTTPBearer
-from fastapi_mail import FastMail, MessageSchema, ConnectionConfig, MessageType
-from pydantic import SecretStr
-from .config import settings
-
-# ========================
-# 메일 발송 설정
-# ========================
-conf = ConnectionConfig(
-    MAIL_USERNAME=settings.MAIL_USERNAME,
-    MAIL_PASSWORD=SecretStr(settings.MAIL_PASSWORD),
-    MAIL_FROM=settings.MAIL_USERNAME,
-    MAIL_PORT=587,
-    MAIL_SERVER="smtp.gmail.com",
-    MAIL_STARTTLS=True,
-    MAIL_SSL_TLS=False,
-    USE_CREDENTIALS=True,
-    VALIDATE_CERTS=True,
-)
+from .mail_outbox import mail_outbox
 
 bearer_scheme = HTTPBearer(
     description="로그인(/auth/login)에서 발급받은 Bearer Token을 입력하세요."
@@ -34,12 +17,6 @@ async def send_verification_email(email: str, code: str) -> None:
 10분 안에 인증하지 않으면 만료됩니다.
 """
 
-    message = MessageSchema(
-        subject="이메일 인증 요청",
-        recipients=[email],
-        body=text_body,
-        subtype=MessageType.plain,
-    )
-    fm = FastMail(conf)
-    await fm.send_message(message)
+    # ✅ 대기열에 넣고 바로 반환 (실제 발송은 mail_outbox 워커)
+    await mail_outbox.enqueue(to=email, subject="이메일 인증 요청", body=text_body)
 
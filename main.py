@@ -1,8 +1,22 @@
-from typing import AsyncIterator, Dict
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict
 from contextlib import asynccontextmanager
-from fastapi import FastAPI
+from fastapi import Depends, FastAPI, Request, Response
+from fastapi.responses import JSONResponse
 from starlette.middleware.cors import CORSMiddleware
-from core.db import init_db, close_db
+from core.db import init_db, close_db, pool_metrics
+from core.db_pool import DBPoolTimeout
+from core.db_router import replica_router
+from core.http_client import init_http_clients, close_http_clients
+from core.mail_outbox import mail_outbox
+from core.security import get_current_admin
+from services.analytics_service import activity_rollup
+from services.briefing_service import briefing_prefetcher
+from services.last_login_service import last_login_buffer
+from services.news_prefetcher import news_prefetcher
+from services.news_service import init_parse_executor, shutdown_parse_executor
+from services.password_service import password_hasher
+from services.quiz_service import quiz_bank
+from services.token_revocation_service import token_revocation_purger, token_revocation_store
 
 # ==================================================
 # 라우터 import
@@ -29,9 +43,53 @@ from api.v1 import (
 @asynccontextmanager
 async def lifespan(app: FastAPI) -> AsyncIterator[None]:
     await init_db()
+    await init_http_clients()
+
+    # replica 지연 감시 시작 (DATABASE_REPLICA_URL 설정 시)
+    replica_router.start()
+
+    # 퀴즈 엑셀 미리 적재 (실패해도 첫 요청 때 다시 시도)
+    try:
+        quiz_bank.load()
+    except Exception as e:
+        print(f"⚠️ 퀴즈 미리 로드 실패: {e}")
+
+    # 뉴스 스냅샷 백그라운드 갱신 시작 (HTML 파싱은 전용 스레드 풀에서)
+    init_parse_executor()
+    news_prefetcher.start()
+
+    # 무효화 토큰 Bloom filter 동기화 시작
+    token_revocation_store.start()
+
+    # 만료된 토큰 무효화 기록 정리 작업 시작
+    token_revocation_purger.start()
+
+    # 메일 발송 대기열 워커 시작
+    mail_outbox.start()
+
+    # 로그인 시각 일괄 반영 작업 시작
+    last_login_buffer.start()
+
+    # 로그인 활동 집계(DAU/WAU/MAU) 작업 시작
+    activity_rollup.start()
+
+    # 시간대별 브리핑 미리 생성 작업 시작
+    briefing_prefetcher.start()
+
     try:
         yield
     finally:
+        await briefing_prefetcher.stop()
+        await news_prefetcher.stop()
+        await activity_rollup.stop()
+        await last_login_buffer.stop()
+        await mail_outbox.stop()
+        await token_revocation_purger.stop()
+        await token_revocation_store.stop()
+        shutdown_parse_executor()
+        password_hasher.shutdown()
+        await replica_router.stop()
+        await close_http_clients()
         await close_db()
 
 
@@ -72,6 +130,27 @@ app.add_middleware(
     allow_credentials=True,
 )
 
+# ==================================================
+# DB 커넥션 풀 포화 → 503 (요청이 무한정 줄 서지 않도록)
+# ==================================================
+@app.exception_handler(DBPoolTimeout)
+async def db_pool_timeout_handler(request: Request, exc: DBPoolTimeout) -> JSONResponse:
+    return JSONResponse(status_code=503, content={"detail": "DB_BUSY"})
+
+# ==================================================
+# Read-your-writes 마커 (쓰기 요청 직후 해당 사용자 조회는 primary로)
+# ==================================================
+@app.middleware("http")
+async def mark_recent_write(
+    request: Request, call_next: Callable[[Request], Awaitable[Response]]
+) -> Response:
+    response = await call_next(request)
+    if request.method not in ("GET", "HEAD", "OPTIONS"):
+        user_id = getattr(request.state, "user_id", None)
+        if user_id is not None:
+            await replica_router.mark_write(user_id)
+    return response
+
 # ==================================================
 # Health Check
 # ==================================================
@@ -80,6 +159,21 @@ def health() -> dict[str, str]:
     return {"status": "ok"}
 
 
+# ==================================================
+# Metrics (워커 내부 풀 상태, 관리자 전용)
+# ==================================================
+@app.get("/metrics", dependencies=[Depends(get_current_admin)])
+async def metrics() -> dict[str, Any]:
+    return {
+        "db_pools": pool_metrics(),
+        "db_replica": replica_router.metrics(),
+        "password_hasher": password_hasher.metrics(),
+        "token_revocations": token_revocation_store.metrics(),
+        "token_revocations_table": await token_revocation_purger.metrics(),
+        "mail_outbox": await mail_outbox.metrics(),
+    }
+
+
 # ==================================================
 # 라우터 등록
 # ==================================================
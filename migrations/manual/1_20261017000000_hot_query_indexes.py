@@ -0,0 +1,35 @@
+"""
+자주 실행되는 조회 조건용 인덱스 (CREATE INDEX CONCURRENTLY).
+
+- 쓰기를 막지 않도록 CONCURRENTLY로 생성 → 트랜잭션 밖에서 실행해야 함
+    aerich upgrade --in-transaction False
+- 여기 인덱스는 모델 Meta에 선언하지 않음 (aerich migrate가 CONCURRENTLY 없이 먼저 만들지 않도록)
+- 이전 시도가 중간에 실패해 INVALID로 남은 인덱스는 지우고 다시 생성
+"""
+from tortoise import BaseDBAsyncClient
+
+from core.concurrent_index import create_indexes, drop_indexes
+
+INDEXES = {
+    # 투두 목록 / 날짜별 투두 (Soft Delete 제외)
+    "idx_todos_user_created_live":
+        "ON todos (user_id, created_at) WHERE deleted_at IS NULL",
+    # 일정 목록 / 날짜 범위 일정 (Soft Delete 제외)
+    "idx_schedules_user_start_live":
+        "ON schedules (user_id, start_time) WHERE deleted_at IS NULL",
+    # 내 문의 목록 / 관리자 상태별 목록
+    "idx_inquiries_user_created": "ON inquiries (user_id, created_at)",
+    "idx_inquiries_status_created": "ON inquiries (status, created_at)",
+    # 안 읽은 알림 / 발송 예정 알림
+    "idx_notifications_user_read_notify": "ON notifications (user_id, is_read, notify_at)",
+}
+
+
+async def upgrade(db: BaseDBAsyncClient) -> str:
+    await create_indexes(db, INDEXES)
+    return "SELECT 1;"
+
+
+async def downgrade(db: BaseDBAsyncClient) -> str:
+    await drop_indexes(db, INDEXES)
+    return "SELECT 1;"
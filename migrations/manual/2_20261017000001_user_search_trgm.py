@@ -0,0 +1,27 @@
+"""
+관리자 사용자 검색용 trigram GIN 인덱스 (pg_trgm).
+
+- username / email 의 ILIKE '%kw%' 와 유사도(%) 검색이 전체 스캔 없이 인덱스를 사용
+- CONCURRENTLY로 생성 → `aerich upgrade --in-transaction False`로 적용
+- pg_trgm 확장 생성 권한(CREATE on database)이 필요
+"""
+from tortoise import BaseDBAsyncClient
+
+from core.concurrent_index import create_indexes, drop_indexes
+
+INDEXES = {
+    "idx_users_username_trgm": "ON users USING gin (username gin_trgm_ops)",
+    "idx_users_email_trgm": "ON users USING gin (email gin_trgm_ops)",
+}
+
+
+async def upgrade(db: BaseDBAsyncClient) -> str:
+    await db.execute_script("CREATE EXTENSION IF NOT EXISTS pg_trgm;")
+    await create_indexes(db, INDEXES)
+    return "SELECT 1;"
+
+
+async def downgrade(db: BaseDBAsyncClient) -> str:
+    # 확장은 다른 곳에서 쓰고 있을 수 있으므로 남겨 둠
+    await drop_indexes(db, INDEXES)
+    return "SELECT 1;"
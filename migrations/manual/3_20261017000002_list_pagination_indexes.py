@@ -0,0 +1,25 @@
+"""
+전체 대상 목록 keyset 페이지네이션용 인덱스 (CREATE INDEX CONCURRENTLY).
+
+- 사용자별 목록은 1_hot_query_indexes의 (user_id, created_at/start_time) 인덱스 사용
+- `aerich upgrade --in-transaction False`로 적용
+"""
+from tortoise import BaseDBAsyncClient
+
+from core.concurrent_index import create_indexes, drop_indexes
+
+INDEXES = {
+    # 관리자 사용자 / 전체 문의 목록 (최신순 커서 페이지)
+    "idx_users_created": "ON users (created_at, id)",
+    "idx_inquiries_created": "ON inquiries (created_at, id)",
+}
+
+
+async def upgrade(db: BaseDBAsyncClient) -> str:
+    await create_indexes(db, INDEXES)
+    return "SELECT 1;"
+
+
+async def downgrade(db: BaseDBAsyncClient) -> str:
+    await drop_indexes(db, INDEXES)
+    return "SELECT 1;"
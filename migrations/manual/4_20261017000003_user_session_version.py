@@ -0,0 +1,17 @@
+"""
+users.session_version 컬럼 추가 (세션 버전 원본, Redis는 캐시).
+
+- 상수 DEFAULT라 PostgreSQL 11+에서는 테이블 재작성 없이 바로 추가됨
+- aerich migrate로 같은 컬럼이 먼저 추가된 경우에도 IF NOT EXISTS로 그대로 통과
+"""
+from tortoise import BaseDBAsyncClient
+
+
+async def upgrade(db: BaseDBAsyncClient) -> str:
+    return """
+        ALTER TABLE "users" ADD COLUMN IF NOT EXISTS "session_version" INT NOT NULL DEFAULT 0;"""
+
+
+async def downgrade(db: BaseDBAsyncClient) -> str:
+    return """
+        ALTER TABLE "users" DROP COLUMN IF EXISTS "session_version";"""
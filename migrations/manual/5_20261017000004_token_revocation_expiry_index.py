@@ -0,0 +1,35 @@
+"""
+만료된 토큰 무효화 기록 정리용 인덱스 (CREATE INDEX CONCURRENTLY).
+
+- TokenRevocationPurger의 `expires_at < now()` 배치 삭제가 전체 스캔하지 않도록
+- aerich migrate가 만든 이름 없는 (expires_at) 인덱스가 있으면 새 인덱스 생성 후 제거
+- `aerich upgrade --in-transaction False`로 적용
+"""
+from tortoise import BaseDBAsyncClient
+
+from core.concurrent_index import create_indexes, drop_indexes
+
+INDEXES = {
+    # 만료 기록 정리 (expires_at < now() 배치 삭제)
+    "idx_token_revocations_expires": "ON token_revocations (expires_at)",
+}
+
+# 같은 컬럼에 자동 이름으로 만들어진 중복 인덱스
+DUPLICATE_INDEXES_SQL = (
+    "SELECT indexname AS name FROM pg_indexes"
+    " WHERE tablename = 'token_revocations'"
+    " AND indexdef LIKE '%(expires_at)' AND NOT (indexname = ANY($1::text[]))"
+)
+
+
+async def upgrade(db: BaseDBAsyncClient) -> str:
+    await create_indexes(db, INDEXES)
+
+    _, duplicates = await db.execute_query(DUPLICATE_INDEXES_SQL, [list(INDEXES)])
+    await drop_indexes(db, [row["name"] for row in duplicates])
+    return "SELECT 1;"
+
+
+async def downgrade(db: BaseDBAsyncClient) -> str:
+    await drop_indexes(db, INDEXES)
+    return "SELECT 1;"
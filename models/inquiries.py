@@ -47,3 +47,5 @@ class Inquiry(Model):
 
     class Meta:
         table = "inquiries"
+        # 목록 조회 인덱스는 migrations/manual(1, 3)에서 CONCURRENTLY로 생성
+        # (Meta에 선언하면 aerich migrate가 쓰기를 막는 CREATE INDEX로 먼저 만듦)
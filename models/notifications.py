@@ -49,3 +49,4 @@ class Notification(Model):
 
     class Meta:
         table = "notifications"
+        # (user_id, is_read, notify_at) 인덱스는 migrations/manual/1에서 관리
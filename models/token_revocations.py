@@ -25,8 +25,9 @@ class TokenRevocation(Model):
     # 블랙리스트 등록 시각
 
     expires_at = fields.DatetimeField(null=True)
-    # 토큰 만료 시각
+    # 토큰 만료 시각 (이후 정리 작업에서 삭제)
 
     class Meta:
         table = "token_revocations"
         indexes = (("user_id", "jti"),)
+        # 만료 기록 정리용 (expires_at) 인덱스는 migrations/manual/5에서 관리
@@ -18,10 +18,14 @@ class User(Model):
 
     google_id = fields.CharField(max_length=255, unique=True, null=True)
 
+    session_version = fields.IntField(default=0)
+    # 세션 버전 (증가 시 그 전에 발급된 토큰 전부 무효, Redis는 캐시만)
+
     last_login_at = fields.DatetimeField(auto_now_add=True)
 
     created_at = fields.DatetimeField(auto_now_add=True)
     updated_at = fields.DatetimeField(auto_now=True)
 
     class Meta:
-        table = "users"
\ No newline at end of file
+        table = "users"
+        # 관리자 목록용 (created_at, id) 인덱스는 migrations/manual/3에서 관리
\ No newline at end of file
@@ -0,0 +1,45 @@
+from tortoise import fields, ForeignKeyFieldInstance
+from tortoise.models import Model
+
+from models.user import User
+
+
+class UserDailyActivity(Model):
+    id = fields.BigIntField(pk=True)
+
+    user: ForeignKeyFieldInstance[User] = fields.ForeignKeyField(
+        "models.User",
+        related_name="daily_activities",
+        on_delete=fields.CASCADE,
+        null=False
+    )
+    # FK → 활동한 사용자
+
+    day = fields.DateField(null=False)
+    # 로그인한 날짜 (KST 기준)
+
+    class Meta:
+        table = "user_daily_activity"
+        unique_together = (("day", "user_id"),)
+
+
+class ActivityDailyStat(Model):
+    day = fields.DateField(pk=True)
+    # 집계 기준 날짜 (KST)
+
+    signups = fields.IntField(default=0)
+    # 해당 날짜 가입자 수
+
+    dau = fields.IntField(default=0)
+    # 해당 날짜 로그인한 사용자 수
+
+    wau = fields.IntField(default=0)
+    # 해당 날짜까지 최근 7일 로그인 사용자 수
+
+    mau = fields.IntField(default=0)
+    # 해당 날짜까지 최근 30일 로그인 사용자 수
+
+    updated_at = fields.DatetimeField(auto_now=True)
+
+    class Meta:
+        table = "activity_daily_stats"
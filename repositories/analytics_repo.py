@@ -0,0 +1,112 @@
+from datetime import date
+from typing import Dict, List, Optional
+
+from core.config import settings
+from core.db import background_db
+from core.db_router import read_db
+from models.user_activity import ActivityDailyStat
+
+# 로그인 기록 (user_id, epoch 초) → 사용자별 KST 활동일 (같은 날 중복은 무시)
+RECORD_LOGINS_SQL = (
+    "INSERT INTO user_daily_activity (day, user_id)"
+    " SELECT date_trunc('day', to_timestamp(v.ts) AT TIME ZONE $3)::date, v.id"
+    " FROM (SELECT unnest($1::bigint[]) AS id, unnest($2::double precision[]) AS ts) AS v"
+    " JOIN users ON users.id = v.id"
+    " ON CONFLICT (day, user_id) DO NOTHING"
+)
+
+# 집계 테이블이 비어 있을 때 한 번: users.last_login_at으로 활동일 시드 (사용자당 마지막 로그인 1일만 알 수 있음)
+SEED_FROM_LAST_LOGIN_SQL = (
+    "INSERT INTO user_daily_activity (day, user_id)"
+    " SELECT date_trunc('day', last_login_at AT TIME ZONE $2)::date, id"
+    " FROM users WHERE last_login_at >= ($1::date::timestamp AT TIME ZONE $2)"
+    " ON CONFLICT (day, user_id) DO NOTHING"
+)
+
+# [$1, $2] 날짜 구간의 가입자 수 / DAU / WAU / MAU 재계산 후 upsert
+ROLLUP_SQL = """
+WITH days AS (
+    SELECT d::date AS day FROM generate_series($1::date, $2::date, interval '1 day') AS d
+),
+signups AS (
+    SELECT date_trunc('day', created_at AT TIME ZONE $3)::date AS day, count(*) AS n
+    FROM users
+    WHERE created_at >= ($1::date::timestamp AT TIME ZONE $3)
+      AND created_at < (($2::date + 1)::timestamp AT TIME ZONE $3)
+    GROUP BY 1
+)
+INSERT INTO activity_daily_stats (day, signups, dau, wau, mau, updated_at)
+SELECT days.day,
+       COALESCE(signups.n, 0),
+       (SELECT count(*) FROM user_daily_activity a WHERE a.day = days.day),
+       (SELECT count(DISTINCT a.user_id) FROM user_daily_activity a
+         WHERE a.day BETWEEN days.day - 6 AND days.day),
+       (SELECT count(DISTINCT a.user_id) FROM user_daily_activity a
+         WHERE a.day BETWEEN days.day - 29 AND days.day),
+       now()
+FROM days LEFT JOIN signups USING (day)
+ON CONFLICT (day) DO UPDATE SET
+    signups = EXCLUDED.signups,
+    dau = EXCLUDED.dau,
+    wau = EXCLUDED.wau,
+    mau = EXCLUDED.mau,
+    updated_at = EXCLUDED.updated_at
+RETURNING day
+"""
+
+STAT_FIELDS = ("day", "signups", "dau", "wau", "mau", "updated_at")
+
+
+class AnalyticsRepository:
+    """
+    로그인 활동 집계 (user_daily_activity → activity_daily_stats).
+    """
+
+    # --------------------
+    # 활동 기록 / 집계 (백그라운드)
+    # --------------------
+    @staticmethod
+    async def record_logins(entries: Dict[int, float]) -> None:
+        """로그인 시각 일괄 반영 때 함께 호출 (user_id → epoch 초)"""
+        ids = list(entries)
+        await background_db().execute_query(
+            RECORD_LOGINS_SQL, [ids, [entries[i] for i in ids], settings.TZ]
+        )
+
+    @staticmethod
+    async def seed_from_last_login(since: date) -> None:
+        await background_db().execute_query(SEED_FROM_LAST_LOGIN_SQL, [since, settings.TZ])
+
+    @staticmethod
+    async def rollup(start: date, end: date) -> int:
+        """start ~ end(포함) 날짜 집계 갱신, 갱신한 날짜 수 반환"""
+        updated, _ = await background_db().execute_query(ROLLUP_SQL, [start, end, settings.TZ])
+        return int(updated)
+
+    @staticmethod
+    async def last_rolled_day() -> Optional[date]:
+        _, rows = await background_db().execute_query("SELECT max(day) AS day FROM activity_daily_stats")
+        return rows[0]["day"] if rows else None
+
+    @staticmethod
+    async def purge_activity(before: date) -> int:
+        deleted, _ = await background_db().execute_query(
+            "DELETE FROM user_daily_activity WHERE day < $1", [before]
+        )
+        return int(deleted)
+
+    # --------------------
+    # 조회 (관리자)
+    # --------------------
+    @staticmethod
+    async def get_latest_stat() -> Optional[dict]:
+        rows = await ActivityDailyStat.all().using_db(await read_db()).order_by("-day").limit(1).values(
+            *STAT_FIELDS
+        )
+        return rows[0] if rows else None
+
+    @staticmethod
+    async def get_daily_stats(start: date, end: date) -> List[dict]:
+        return await ActivityDailyStat.filter(day__gte=start, day__lte=end).using_db(
+            await read_db()
+        ).order_by("day").values(*STAT_FIELDS)
@@ -1,9 +1,28 @@
 from pyexpat.errors import messages
-from typing import List, Optional
+from typing import List, Optional, Tuple
 from datetime import datetime
 from tortoise.exceptions import DoesNotExist
+from core.db_router import read_db
+from core.export import Rows, stream_values
+from core.pagination import cached_count, fetch_page, invalidate_count
 from models.inquiries import Inquiry, InquiryStatus
 
+INQUIRY_COUNT_KEY = "count:inquiries:{user_id}"
+INQUIRY_TOTAL_COUNT_KEY = "count:inquiries:all"
+
+# 관리자 문의 내보내기 컬럼
+INQUIRY_EXPORT_FIELDS = (
+    "id",
+    "user_id",
+    "title",
+    "message",
+    "status",
+    "admin_reply",
+    "replied_at",
+    "created_at",
+    "updated_at",
+)
+
 
 class InquiryRepository:
     """
@@ -35,14 +54,41 @@ class InquiryRepository:
             return None
 
     @staticmethod
-    async def get_inquiries_by_user(user_id: int) -> List[Inquiry]:
-        """사용자별 문의 목록 조회"""
-        return await Inquiry.filter(user_id=user_id).order_by("-created_at")
+    async def get_inquiries_by_user(
+        user_id: int,
+        limit: int,
+        after: Optional[Tuple[datetime, int]] = None,
+    ) -> Tuple[List[Inquiry], Optional[str]]:
+        """사용자별 문의 목록 조회 (최신순 keyset 페이지)"""
+        queryset = Inquiry.filter(user_id=user_id).using_db(await read_db(user_id))
+        return await fetch_page(queryset, "created_at", limit, after, descending=True)
+
+    @staticmethod
+    async def get_all_inquiries(
+        limit: int,
+        after: Optional[Tuple[datetime, int]] = None,
+    ) -> Tuple[List[Inquiry], Optional[str]]:
+        """관리자 전용 전체 문의 목록 조회 (최신순 keyset 페이지)"""
+        queryset = Inquiry.all().using_db(await read_db())
+        return await fetch_page(queryset, "created_at", limit, after, descending=True)
+
+    @staticmethod
+    def export_inquiries() -> Rows:
+        """관리자 전체 문의 내보내기 (id 순, chunk 단위)"""
+        return stream_values(Inquiry.all().order_by("id").values(*INQUIRY_EXPORT_FIELDS))
+
+    @staticmethod
+    async def count_inquiries_by_user(user_id: int) -> int:
+        queryset = Inquiry.filter(user_id=user_id).using_db(await read_db(user_id))
+        return await cached_count(INQUIRY_COUNT_KEY.format(user_id=user_id), queryset)
+
+    @staticmethod
+    async def count_all_inquiries() -> int:
+        return await cached_count(INQUIRY_TOTAL_COUNT_KEY, Inquiry.all().using_db(await read_db()))
 
     @staticmethod
-    async def get_all_inquiries() -> List[Inquiry]:
-        """관리자 전용 전체 문의 목록 조회"""
-        return await Inquiry.all().order_by("-created_at")
+    async def invalidate_count(user_id: int) -> None:
+        await invalidate_count(INQUIRY_COUNT_KEY.format(user_id=user_id), INQUIRY_TOTAL_COUNT_KEY)
 
     # --------------------
     # UPDATE
@@ -1,8 +1,36 @@
-from typing import List, Optional, Any
+from typing import List, Optional, Any, Tuple
 from tortoise.exceptions import DoesNotExist
-from datetime import datetime, timezone
+from datetime import datetime
+from core.db_router import read_db
+from core.ownership import (
+    OwnedResult,
+    execute_owned,
+    owned_hard_delete_sql,
+    owned_soft_delete_sql,
+    owned_update_sql,
+)
+from core.pagination import cached_count, fetch_page, invalidate_count
 from models.schedules import Schedule
 
+SCHEDULE_COUNT_KEY = "count:schedules:{user_id}"
+
+# 단건 수정 / 삭제 (본인 소유일 때만, 1문장)
+SCHEDULE_COLUMNS = (
+    "id", "user_id", "title", "description", "start_time", "end_time",
+    "all_day", "location", "created_at", "updated_at",
+)
+UPDATABLE_COLUMNS = {
+    "title": "text",
+    "description": "text",
+    "start_time": "timestamptz",
+    "end_time": "timestamptz",
+    "all_day": "bool",
+    "location": "text",
+}
+OWNED_UPDATE_SQL = owned_update_sql("schedules", UPDATABLE_COLUMNS, SCHEDULE_COLUMNS)
+OWNED_SOFT_DELETE_SQL = owned_soft_delete_sql("schedules")
+OWNED_HARD_DELETE_SQL = owned_hard_delete_sql("schedules", live_only=False)
+
 
 class ScheduleRepository:
     """
@@ -45,9 +73,23 @@ class ScheduleRepository:
         return await Schedule.get_or_none(id=schedule_id)
 
     @staticmethod
-    async def get_schedules_by_user(user_id: int) -> List[Schedule]:
-        """특정 사용자의 전체 일정 조회"""
-        return await Schedule.filter(user_id=user_id)
+    async def get_schedules_by_user(
+        user_id: int,
+        limit: int,
+        after: Optional[Tuple[datetime, int]] = None,
+    ) -> Tuple[List[Schedule], Optional[str]]:
+        """특정 사용자의 일정 목록 조회 (Soft Delete 제외, 시작 시각 순 keyset 페이지)"""
+        queryset = Schedule.filter(user_id=user_id, deleted_at=None).using_db(await read_db(user_id))
+        return await fetch_page(queryset, "start_time", limit, after)
+
+    @staticmethod
+    async def count_schedules_by_user(user_id: int) -> int:
+        queryset = Schedule.filter(user_id=user_id, deleted_at=None).using_db(await read_db(user_id))
+        return await cached_count(SCHEDULE_COUNT_KEY.format(user_id=user_id), queryset)
+
+    @staticmethod
+    async def invalidate_count(user_id: int) -> None:
+        await invalidate_count(SCHEDULE_COUNT_KEY.format(user_id=user_id))
 
     @staticmethod
     async def get_schedules_by_date(user_id: int, date: datetime) -> List[Schedule]:
@@ -57,37 +99,32 @@ class ScheduleRepository:
             deleted_at=None,
             start_time__lte=date,
             end_time__gte=date
-        )
+        ).using_db(await read_db(user_id))
 
     # --------------------
     # UPDATE
     # --------------------
     @staticmethod
-    async def update_schedule(schedule_id: int, **kwargs: Any) -> Optional[Schedule]:
-        """일정 업데이트"""
-        schedule = await Schedule.get_or_none(id=schedule_id)
-        if schedule:
-            for field, value in kwargs.items():
-                if hasattr(schedule, field) and value is not None:
-                    setattr(schedule, field, value)
-            await schedule.save()
-        return schedule
+    async def update_schedule(schedule_id: int, user_id: int, **kwargs: Any) -> OwnedResult:
+        """
+        본인 일정 업데이트 (조회 없이 UPDATE ... RETURNING 1회, None 값은 기존 값 유지)
+        - 반환: (소유자 id, 반영된 행) → core.ownership 참고
+        """
+        return await execute_owned(
+            OWNED_UPDATE_SQL,
+            [schedule_id, user_id, *(kwargs.get(column) for column in UPDATABLE_COLUMNS)],
+        )
 
     # --------------------
     # DELETE
     # delete_at = None / soft delete
     # --------------------
     @staticmethod
-    async def delete_schedule(schedule_id: int) -> bool:
-        """Soft Delete (deleted_at만 기록)"""
-        schedule = await Schedule.get_or_none(id=schedule_id)
-        if schedule:
-            schedule.deleted_at = datetime.now(timezone.utc)  # ✅ UTC 권장
-            await schedule.save()
-            return True
-        return False
+    async def delete_schedule(schedule_id: int, user_id: int) -> OwnedResult:
+        """본인 일정 Soft Delete (deleted_at만 기록)"""
+        return await execute_owned(OWNED_SOFT_DELETE_SQL, [schedule_id, user_id])
 
     @staticmethod
-    async def hard_delete_schedule(schedule_id: int) -> int:
-        """실제 DB에서 삭제 (필요 시만 사용)"""
-        return await Schedule.filter(id=schedule_id).delete()
+    async def hard_delete_schedule(schedule_id: int, user_id: int) -> OwnedResult:
+        """본인 일정을 실제 DB에서 삭제 (Soft Delete 된 일정 포함)"""
+        return await execute_owned(OWNED_HARD_DELETE_SQL, [schedule_id, user_id])
@@ -1,7 +1,69 @@
-from typing import List, Optional, Any
-from datetime import datetime, timezone
+from typing import Dict, List, Optional, Any, Tuple
+from datetime import datetime
+from tortoise.transactions import in_transaction
+from core.db import DEFAULT_DB
+from core.db_router import read_db
+from core.ownership import (
+    OwnedResult,
+    execute_owned,
+    owned_hard_delete_sql,
+    owned_soft_delete_sql,
+    owned_update_sql,
+)
+from core.pagination import cached_count, fetch_page, invalidate_count
 from models.todo import Todo
 
+TODO_COUNT_KEY = "count:todos:{user_id}"
+
+# ========================
+# 일괄 처리용 SQL (모두 user_id 조건 포함 → 본인 것만 반영)
+# ========================
+TODO_COLUMNS = "id, user_id, title, description, is_completed, created_at, updated_at"
+
+BATCH_CREATE_SQL = f"""
+INSERT INTO todos (user_id, title, description, is_completed, created_at, updated_at)
+SELECT $1, v.title, v.description, v.is_completed, now(), now()
+FROM unnest($2::text[], $3::text[], $4::bool[]) WITH ORDINALITY AS v(title, description, is_completed, ord)
+ORDER BY v.ord
+RETURNING {TODO_COLUMNS}
+"""
+
+# None인 값은 기존 값 유지 (단건 update_todo와 동일)
+BATCH_UPDATE_SQL = f"""
+UPDATE todos AS t SET
+    title = COALESCE(v.title, t.title),
+    description = COALESCE(v.description, t.description),
+    is_completed = COALESCE(v.is_completed, t.is_completed),
+    updated_at = now()
+FROM unnest($2::bigint[], $3::text[], $4::text[], $5::bool[]) AS v(id, title, description, is_completed)
+WHERE t.id = v.id AND t.user_id = $1 AND t.deleted_at IS NULL
+RETURNING {", ".join("t." + c for c in TODO_COLUMNS.split(", "))}
+"""
+
+BATCH_COMPLETE_SQL = f"""
+UPDATE todos SET is_completed = TRUE, updated_at = now()
+WHERE id = ANY($2::bigint[]) AND user_id = $1 AND deleted_at IS NULL
+RETURNING {TODO_COLUMNS}
+"""
+
+BATCH_SOFT_DELETE_SQL = """
+UPDATE todos SET deleted_at = now(), updated_at = now()
+WHERE id = ANY($2::bigint[]) AND user_id = $1 AND deleted_at IS NULL
+RETURNING id
+"""
+
+# 단건 수정 / 삭제 (본인 소유일 때만, 1문장)
+UPDATABLE_COLUMNS = {"title": "text", "description": "text", "is_completed": "bool"}
+OWNED_UPDATE_SQL = owned_update_sql("todos", UPDATABLE_COLUMNS, TODO_COLUMNS.split(", "))
+OWNED_SOFT_DELETE_SQL = owned_soft_delete_sql("todos")
+OWNED_HARD_DELETE_SQL = owned_hard_delete_sql("todos", live_only=True)
+
+# 단건 hard delete(live_only=True)와 같이 이미 Soft Delete된 행은 대상에서 제외
+BATCH_HARD_DELETE_SQL = """
+DELETE FROM todos WHERE id = ANY($2::bigint[]) AND user_id = $1 AND deleted_at IS NULL
+RETURNING id
+"""
+
 
 class TodosRepository:
     """
@@ -40,56 +102,118 @@ class TodosRepository:
         return await Todo.get_or_none(id=todo_id, deleted_at=None)
 
     @staticmethod
-    async def get_todos_by_user(user_id: int) -> List[Todo]:
+    async def get_todos_by_user(
+        user_id: int,
+        limit: int,
+        after: Optional[Tuple[datetime, int]] = None,
+    ) -> Tuple[List[Todo], Optional[str]]:
         """
-        특정 사용자의 Todo 목록 조회
+        특정 사용자의 Todo 목록 조회 (최신순 keyset 페이지)
         - Soft Delete 된 데이터는 제외
         """
-        return await Todo.filter(user_id=user_id, deleted_at=None)
+        queryset = Todo.filter(user_id=user_id, deleted_at=None).using_db(await read_db(user_id))
+        return await fetch_page(queryset, "created_at", limit, after, descending=True)
+
+    @staticmethod
+    async def count_todos_by_user(user_id: int) -> int:
+        queryset = Todo.filter(user_id=user_id, deleted_at=None).using_db(await read_db(user_id))
+        return await cached_count(TODO_COUNT_KEY.format(user_id=user_id), queryset)
+
+    @staticmethod
+    async def invalidate_count(user_id: int) -> None:
+        await invalidate_count(TODO_COUNT_KEY.format(user_id=user_id))
 
     # --------------------
     # UPDATE
     # --------------------
     @staticmethod
-    async def update_todo(todo_id: int, **kwargs: Any) -> Optional[Todo]:
+    async def update_todo(todo_id: int, user_id: int, **kwargs: Any) -> OwnedResult:
         """
-        Todo 업데이트
-        - kwargs: title, description, is_completed, schedule_id 등
-        - schedule_id도 수정 가능 (None이면 일정과 연결 해제)
+        본인 Todo 업데이트 (조회 없이 UPDATE ... RETURNING 1회)
+        - kwargs: title, description, is_completed (None이면 기존 값 유지)
+        - 반환: (소유자 id, 반영된 행) → core.ownership 참고
         """
-        todo = await Todo.get_or_none(id=todo_id, deleted_at=None)
-        if not todo:
-            return None
+        return await execute_owned(
+            OWNED_UPDATE_SQL,
+            [todo_id, user_id, *(kwargs.get(column) for column in UPDATABLE_COLUMNS)],
+        )
 
-        for field, value in kwargs.items():
-            if hasattr(todo, field) and value is not None:  # ✅ 안전하게 필드 확인 후 반영
-                setattr(todo, field, value)
+    # --------------------
+    # BATCH (생성 / 수정 / 완료 / 삭제를 한 트랜잭션에서 종류별 1문장씩)
+    # --------------------
+    @staticmethod
+    async def apply_batch(
+        user_id: int,
+        creates: List[Dict[str, Any]],
+        updates: List[Dict[str, Any]],
+        complete_ids: List[int],
+        delete_ids: List[int],
+        hard_delete_ids: List[int],
+    ) -> Dict[str, Any]:
+        """
+        반환값
+        - created: 생성된 행 목록 (creates 순서)
+        - updated / completed: id → 반영된 행
+        - deleted: 삭제된 id 집합 (soft/hard)
+        """
+        result: Dict[str, Any] = {"created": [], "updated": {}, "completed": {}, "deleted": set()}
+        async with in_transaction(DEFAULT_DB) as conn:
+            if creates:
+                rows = await conn.execute_query_dict(
+                    BATCH_CREATE_SQL,
+                    [
+                        user_id,
+                        [c["title"] for c in creates],
+                        [c.get("description") for c in creates],
+                        [bool(c.get("is_completed")) for c in creates],
+                    ],
+                )
+                # 시퀀스는 입력 순서대로 발급되므로 id 순 = 요청 순
+                result["created"] = sorted(rows, key=lambda r: r["id"])
+            if updates:
+                rows = await conn.execute_query_dict(
+                    BATCH_UPDATE_SQL,
+                    [
+                        user_id,
+                        [u["id"] for u in updates],
+                        [u.get("title") for u in updates],
+                        [u.get("description") for u in updates],
+                        [u.get("is_completed") for u in updates],
+                    ],
+                )
+                result["updated"] = {r["id"]: r for r in rows}
+            if complete_ids:
+                rows = await conn.execute_query_dict(BATCH_COMPLETE_SQL, [user_id, complete_ids])
+                result["completed"] = {r["id"]: r for r in rows}
+            if delete_ids:
+                rows = await conn.execute_query_dict(BATCH_SOFT_DELETE_SQL, [user_id, delete_ids])
+                result["deleted"].update(r["id"] for r in rows)
+            if hard_delete_ids:
+                rows = await conn.execute_query_dict(BATCH_HARD_DELETE_SQL, [user_id, hard_delete_ids])
+                result["deleted"].update(r["id"] for r in rows)
+        return result
 
-        await todo.save()
-        return todo
+    @staticmethod
+    async def get_owners(todo_ids: List[int]) -> Dict[int, int]:
+        """삭제되지 않은 Todo의 id → user_id (실패 사유 404/403 구분용)"""
+        rows = await Todo.filter(id__in=todo_ids, deleted_at=None).values("id", "user_id")
+        return {r["id"]: r["user_id"] for r in rows}
 
     # --------------------
     # DELETE
     # --------------------
     @staticmethod
-    async def delete_todo(todo_id: int) -> bool:
+    async def delete_todo(todo_id: int, user_id: int) -> OwnedResult:
         """
-        Soft Delete (deleted_at만 기록)
-        - 실제 데이터는 남아있고 복구 가능
+        본인 Todo Soft Delete (deleted_at만 기록, 복구 가능)
+        - 반환: (소유자 id, 삭제된 행의 id) → core.ownership 참고
         """
-        todo = await Todo.get_or_none(id=todo_id, deleted_at=None)
-        if not todo:
-            return False
-
-        todo.deleted_at = datetime.now(timezone.utc)  # ✅ UTC 기준 시간 기록
-        await todo.save()
-        return True
+        return await execute_owned(OWNED_SOFT_DELETE_SQL, [todo_id, user_id])
 
     @staticmethod
-    async def hard_delete_todo(todo_id: int) -> int:
+    async def hard_delete_todo(todo_id: int, user_id: int) -> OwnedResult:
         """
-        실제 DB에서 완전히 삭제
+        본인 Todo를 실제 DB에서 완전히 삭제
         - 되돌릴 수 없음
-        - 주로 테스트/관리자 기능용
         """
-        return await Todo.filter(id=todo_id).delete()
+        return await execute_owned(OWNED_HARD_DELETE_SQL, [todo_id, user_id])
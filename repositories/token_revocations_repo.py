@@ -1,5 +1,9 @@
 from models.token_revocations import TokenRevocation
-from datetime import datetime
+from datetime import datetime, timezone
+from typing import Any, Optional
+
+from core.db import background_db
+from tortoise.expressions import Q
 
 
 class TokenRevocationsRepository:
@@ -7,32 +11,78 @@ class TokenRevocationsRepository:
     Repository for managing revoked (invalidated) JWT tokens.
     """
 
-    # ✅ Create (토큰 무효화 등록)
+    # ✅ Create (토큰 무효화 등록 – INSERT ... ON CONFLICT DO NOTHING 1회)
     @staticmethod
-    async def revoke_token(jti: str, user_id: int) -> TokenRevocation:
-        # 중복 방지
-        existing = await TokenRevocation.get_or_none(jti=jti)
-        if existing:
-            return existing
-
-        return await TokenRevocation.create(
-            jti=jti,
-            user_id=user_id,  # FK → user_id로 지정해야 함
+    async def revoke_token(
+        jti: str,
+        user_id: int,
+        expires_at: Optional[datetime] = None,
+        reason: Optional[str] = None,
+    ) -> None:
+        # 중복 jti는 무시 (조회 후 생성하는 왕복 없이 한 번에)
+        await TokenRevocation.bulk_create(
+            [
+                TokenRevocation(
+                    jti=jti,
+                    user_id=user_id,  # FK → user_id로 지정해야 함
+                    expires_at=expires_at,
+                    reason=reason,
+                )
+            ],
+            ignore_conflicts=True,
         )
 
-    # ✅ Read (특정 토큰 무효화 여부 확인)
+    # ✅ Read (특정 토큰 무효화 여부 확인 – Redis 장애 시 대체 경로)
     @staticmethod
     async def is_token_revoked(jti: str) -> bool:
         """
         토큰이 이미 무효화된 경우 True 반환
         """
-        return await TokenRevocation.filter(jti=jti).exists()
+        now = datetime.now(timezone.utc)
+        return await TokenRevocation.filter(
+            Q(expires_at__isnull=True) | Q(expires_at__gt=now), jti=jti
+        ).exists()
 
     # ✅ Read (사용자별 무효화 토큰 조회)
     @staticmethod
     async def get_revoked_tokens_by_user(user_id: int) -> list[TokenRevocation]:
         return await TokenRevocation.filter(user_id=user_id).all()
 
+    # ✅ Delete (만료된 기록 일괄 정리 – 한 번에 batch_size건까지)
+    @staticmethod
+    async def purge_expired(now: datetime, batch_size: int) -> int:
+        """expires_at이 지난 행을 expires_at 순으로 최대 batch_size건 삭제, 삭제 건수 반환"""
+        deleted, _ = await background_db().execute_query(
+            "DELETE FROM token_revocations WHERE id IN ("
+            " SELECT id FROM token_revocations"
+            " WHERE expires_at < $1 ORDER BY expires_at LIMIT $2"
+            ")",
+            [now, batch_size],
+        )
+        return int(deleted)
+
+    @staticmethod
+    async def purge_legacy(revoked_before: datetime, batch_size: int) -> int:
+        """expires_at 없이 저장된 예전 기록 중 토큰 최대 수명이 지난 행 삭제"""
+        deleted, _ = await background_db().execute_query(
+            "DELETE FROM token_revocations WHERE id IN ("
+            " SELECT id FROM token_revocations"
+            " WHERE expires_at IS NULL AND revoked_at < $1 LIMIT $2"
+            ")",
+            [revoked_before, batch_size],
+        )
+        return int(deleted)
+
+    # ✅ Read (테이블 / 인덱스 크기 – 모니터링용, 카탈로그 조회라 가벼움)
+    @staticmethod
+    async def table_stats() -> dict[str, Any]:
+        _, rows = await background_db().execute_query(
+            "SELECT pg_total_relation_size('token_revocations') AS total_bytes,"
+            " pg_indexes_size('token_revocations') AS index_bytes,"
+            " (SELECT reltuples::bigint FROM pg_class WHERE relname = 'token_revocations') AS approx_rows"
+        )
+        return dict(rows[0]) if rows else {}
+
     # ✅ Delete (무효화 토큰 기록 삭제 – 보통 유지하지만, 관리 차원에서 필요 시)
     @staticmethod
     async def delete_revoked_token(jti: str) -> bool:
@@ -1,10 +1,71 @@
-from typing import Optional, List
-from passlib.hash import bcrypt
+from typing import Optional, List, Tuple
 from tortoise.exceptions import DoesNotExist
-from tortoise.expressions import Q
-from datetime import date
+from datetime import date, datetime
+from core.config import settings
+from core.db_router import read_db
+from core.export import Rows, stream_values
+from core.pagination import cached_count, fetch_page
 from models.user import User
 
+USER_TOTAL_COUNT_KEY = "count:users:all"
+
+# 관리자 목록 응답(AdminUserOut)에 필요한 컬럼만 조회
+ADMIN_USER_FIELDS = (
+    "id",
+    "email",
+    "username",
+    "profile_image",
+    "is_active",
+    "is_email_verified",
+    "is_superuser",
+    "google_id",
+    "last_login_at",
+    "created_at",
+    "updated_at",
+)
+
+# 최근 로그인 내보내기 컬럼
+LAST_LOGIN_FIELDS = ("id", "email", "username", "google_id", "last_login_at")
+
+# trigram은 3글자 단위라 이보다 짧은 검색어는 GIN 인덱스를 쓸 수 없음
+TRGM_MIN_LENGTH = 3
+
+# 부분 일치(ILIKE)와 trigram 유사도(%)로 후보를 고르고 유사도 순으로 정렬
+# - 두 조건 모두 idx_users_username_trgm / idx_users_email_trgm (GIN) 사용
+# - 흔한 검색어도 매 페이지 전체 일치 행을 점수 계산 / 정렬하지 않도록 후보를 id 순 $6개로 제한
+SEARCH_USERS_SQL = """
+WITH hits AS MATERIALIZED (
+    SELECT id FROM users
+    WHERE username ILIKE $2 OR email ILIKE $2 OR username % $1 OR email % $1
+), candidates AS (
+    SELECT id FROM hits ORDER BY id LIMIT $6
+), matches AS (
+    SELECT u.id, u.email, u.username, u.profile_image, u.is_active, u.is_email_verified,
+           u.is_superuser, u.google_id, u.last_login_at, u.created_at, u.updated_at,
+           GREATEST(similarity(u.username, $1), similarity(u.email, $1))::float8 AS score
+    FROM candidates c JOIN users u ON u.id = c.id
+)
+SELECT * FROM matches
+WHERE $3::float8 IS NULL OR score < $3 OR (score = $3 AND id > $4::bigint)
+ORDER BY score DESC, id
+LIMIT $5
+"""
+
+# 짧은 검색어: 이름 / 이메일 앞부분 일치만, id 순으로 limit개 찾으면 멈춤
+# - score는 모두 1이라 (score DESC, id) 커서를 그대로 사용
+SEARCH_USERS_PREFIX_SQL = """
+SELECT id, email, username, profile_image, is_active, is_email_verified, is_superuser,
+       google_id, last_login_at, created_at, updated_at, 1::float8 AS score
+FROM users
+WHERE (username ILIKE $1 OR email ILIKE $1) AND ($2::bigint IS NULL OR id > $2)
+ORDER BY id
+LIMIT $3
+"""
+
+
+def _escape_like(keyword: str) -> str:
+    return keyword.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+
 
 class UserRepository:
     """
@@ -56,35 +117,66 @@ class UserRepository:
         return await User.filter(username=username).first()
 
     @staticmethod
-    async def get_all_users() -> List[User]:
-        """관리자 전용 전체 사용자 조회"""
-        return await User.all().order_by("-created_at")
+    async def get_all_users(
+        limit: int,
+        after: Optional[Tuple[datetime, int]] = None,
+    ) -> Tuple[List[dict], Optional[str]]:
+        """관리자 전용 사용자 목록 조회 (가입 최신순 keyset 페이지)"""
+        queryset = User.all().using_db(await read_db())
+        return await fetch_page(
+            queryset, "created_at", limit, after, descending=True, values=ADMIN_USER_FIELDS
+        )
 
     @staticmethod
-    async def search_users(keyword: str) -> list[dict]:
+    def export_users() -> Rows:
+        """관리자 사용자 목록 내보내기 (id 순, chunk 단위)"""
+        return stream_values(User.all().order_by("id").values(*ADMIN_USER_FIELDS))
+
+    @staticmethod
+    async def export_users_last_login() -> Rows:
+        """전체 유저 최근 로그인 시각 내보내기 (아직 DB 미반영 로그인 시각 병합)"""
+        from services.last_login_service import last_login_buffer
+        pending = await last_login_buffer.get_pending()
+        async for chunk in stream_values(User.all().order_by("id").values(*LAST_LOGIN_FIELDS)):
+            for u in chunk:
+                buffered = pending.get(u["id"])
+                if buffered and (not u["last_login_at"] or buffered > u["last_login_at"]):
+                    u["last_login_at"] = buffered
+                u["is_google_user"] = bool(u["google_id"])
+            yield chunk
+
+    @staticmethod
+    async def count_all_users() -> int:
+        return await cached_count(USER_TOTAL_COUNT_KEY, User.all().using_db(await read_db()))
+
+    @staticmethod
+    async def search_users(
+        keyword: str,
+        limit: int = 20,
+        after: Optional[Tuple[float, int]] = None,
+    ) -> list[dict]:
         """
-        유저 이름 또는 이메일 '부분 검색' (대소문자 무시)
-        ex) 'oh' → oh, ohna, ohnana 전부 조회
+        유저 이름 또는 이메일 검색 (대소문자 무시)
+        - 3글자 이상: 부분 일치 + 오타가 섞인 비슷한 이름 (pg_trgm GIN 인덱스), 유사도 높은 순 → id 순
+          후보가 USER_SEARCH_MAX_CANDIDATES를 넘으면 id 순 앞부분만 순위를 매김
+        - 2글자 이하: 이름 / 이메일 앞부분 일치, id 순
+          ex) 'oh' → oh, ohna, ohnana
+        - after = 이전 페이지 마지막 (score, id)
         """
-        users = await User.filter(
-            Q(username__icontains=keyword) | Q(email__icontains=keyword)
-        ).values(
-            "id",
-            "email",
-            "username",
-            "is_active",
-            "is_email_verified",
-            "is_superuser",
-            "google_id",
-            "last_login_at",
-            "created_at",
-            "updated_at",
-        )
-        #구글 아이디 존재 여부
-        for u in users:
-            u["is_googleuser"] = bool(u.get("social_id"))
+        score_after, id_after = after if after else (None, None)
+        db = await read_db()
+        if len(keyword) < TRGM_MIN_LENGTH:
+            _, rows = await db.execute_query(
+                SEARCH_USERS_PREFIX_SQL, [_escape_like(keyword) + "%", id_after, limit]
+            )
+        else:
+            pattern = "%" + _escape_like(keyword) + "%"
+            _, rows = await db.execute_query(
+                SEARCH_USERS_SQL,
+                [keyword, pattern, score_after, id_after, limit, settings.USER_SEARCH_MAX_CANDIDATES],
+            )
+        return [dict(row) for row in rows]
 
-        return users
     # --------------------
     # UPDATE
     # --------------------
@@ -99,7 +191,7 @@ class UserRepository:
         if not user:
             return None
         user.is_email_verified = True
-        await user.save()
+        await user.save(update_fields=["is_email_verified", "updated_at"])
         return user
 
     @staticmethod
@@ -121,16 +213,16 @@ class UserRepository:
         if profile_image is not None:
             user.profile_image = profile_image
 
-        await user.save()
+        await user.save(update_fields=["username", "profile_image", "updated_at"])
         return user
 
     @staticmethod
-    async def update_password(user: User, new_password: str) -> User:
+    async def update_password(user: User, password_hash: str) -> User:
         """
-        주어진 User 객체의 비밀번호를 새로운 값으로 해시 후 저장한다.
+        주어진 User 객체의 비밀번호 해시를 저장한다. (해싱은 서비스 계층에서)
         """
-        user.password_hash = bcrypt.hash(new_password)
-        await user.save()
+        user.password_hash = password_hash
+        await user.save(update_fields=["password_hash", "updated_at"])
         return user
 
     # --------------------
@@ -149,12 +241,18 @@ class UserRepository:
     @staticmethod
     async def get_all_users_last_login() -> list[dict]:
         from models.user import User
-        users = await User.all().values("id", "email", "username", "last_login_at")
+        from services.last_login_service import last_login_buffer
+        users = await User.all().values("id", "email", "username", "google_id", "last_login_at")
+        # 아직 DB에 반영되지 않은 로그인 시각 병합
+        pending = await last_login_buffer.get_pending()
         # 한국시간으로 포맷팅
         from datetime import timezone, timedelta
         KST = timezone(timedelta(hours=9))
         formatted = []
         for u in users:
+            buffered = pending.get(u["id"])
+            if buffered and (not u["last_login_at"] or buffered > u["last_login_at"]):
+                u["last_login_at"] = buffered
             if u["last_login_at"]:
                 u["last_login_at"] = u["last_login_at"].astimezone(KST).strftime("%Y-%m-%d %H:%M")
             formatted.append(u)
@@ -0,0 +1,25 @@
+from pydantic import BaseModel, Field
+from typing import List
+from datetime import date, datetime
+
+
+#  활성 사용자 수 (가장 최근 집계일 기준)
+class ActiveUsersOut(BaseModel):
+    day: date = Field(..., json_schema_extra={"example": "2025-10-17"})
+    dau: int = Field(..., json_schema_extra={"example": 120})
+    wau: int = Field(..., json_schema_extra={"example": 540})
+    mau: int = Field(..., json_schema_extra={"example": 1800})
+    updated_at: datetime = Field(..., json_schema_extra={"example": "2025-10-17T12:05:00Z"})
+
+
+#  날짜별 집계 (KST)
+class DailyActivityOut(BaseModel):
+    day: date = Field(..., json_schema_extra={"example": "2025-10-17"})
+    signups: int = Field(..., json_schema_extra={"example": 12})
+    dau: int = Field(..., json_schema_extra={"example": 120})
+    wau: int = Field(..., json_schema_extra={"example": 540})
+    mau: int = Field(..., json_schema_extra={"example": 1800})
+
+
+class DailyActivityListOut(BaseModel):
+    days: List[DailyActivityOut]
@@ -98,10 +98,14 @@ class InquiryOut(InquiryBase):
 #  목록 조회 응답
 class InquiryListOut(BaseModel):
     inquiries: List[InquiryOut]
-    total: int = Field(
-        ...,
+    total: Optional[int] = Field(
+        None,
         json_schema_extra={"example": 1},
-    )
+    )  # with_total=true일 때만 (캐시된 값)
+    next_cursor: Optional[str] = Field(
+        None,
+        json_schema_extra={"example": "WyIyMDI1LTA5LTE4VDEyOjM0OjU2KzAwOjAwIiw1XQ"},
+    )  # 다음 페이지 커서 (없으면 마지막 페이지)
 
     model_config = {"from_attributes": True}  #  v2 스타일
 
@@ -112,7 +112,8 @@ class ScheduleOut(BaseModel):
 class ScheduleListOut(BaseModel):
     """일정 목록 조회 응답"""
     schedules: List[ScheduleOut]
-    total: int = Field(default=1)
+    total: Optional[int] = Field(default=None, description="with_total=true일 때만 (캐시된 값)")
+    next_cursor: Optional[str] = Field(default=None, description="다음 페이지 커서 (없으면 마지막 페이지)")
 
     model_config = ConfigDict(
         json_schema_extra={
@@ -132,6 +133,7 @@ class ScheduleListOut(BaseModel):
                     }
                 ],
                 "total": 1,
+                "next_cursor": None,
             }
         },
     )
@@ -1,5 +1,5 @@
 from pydantic import BaseModel, Field
-from typing import Optional, List
+from typing import Literal, Optional, List
 from datetime import datetime
 
 
@@ -67,14 +67,81 @@ class TodoOut(TodoBase):
 
 class TodoListOut(BaseModel):
     todos: List[TodoOut]
-    total: int = Field(
-        ...,
+    total: Optional[int] = Field(
+        None,
         json_schema_extra={"example": 1},
-    )
+    )  # with_total=true일 때만 (캐시된 값)
+    next_cursor: Optional[str] = Field(
+        None,
+        json_schema_extra={"example": "WyIyMDI1LTA5LTE4VDEyOjM0OjU2KzAwOjAwIiw1XQ"},
+    )  # 다음 페이지 커서 (없으면 마지막 페이지)
 
 
 class TodoDeleteResponse(BaseModel):
     message: str = Field(
         "Todo deleted successfully",
         json_schema_extra={"example": "Todo deleted successfully"},
-    )
\ No newline at end of file
+    )
+
+
+# -----------------------------
+# 일괄 처리 (POST /todos/batch)
+# -----------------------------
+class TodoBatchOperation(BaseModel):
+    op: Literal["create", "update", "complete", "delete"] = Field(
+        ...,
+        json_schema_extra={"example": "complete"},
+    )
+    id: Optional[int] = Field(
+        None,
+        json_schema_extra={"example": 5},
+    )  # update / complete / delete 대상
+    title: Optional[str] = Field(
+        None,
+        max_length=255,  # todos.title VARCHAR(255), 넘으면 일괄 처리 전체가 DB 오류로 롤백되므로 미리 422
+        json_schema_extra={"example": "장보기"},
+    )  # create 필수, update 선택
+    description: Optional[str] = Field(
+        None,
+        json_schema_extra={"example": "우유, 계란, 빵 사오기"},
+    )
+    is_completed: Optional[bool] = Field(
+        None,
+        json_schema_extra={"example": True},
+    )
+    hard: bool = Field(
+        False,
+        json_schema_extra={"example": False},
+    )  # delete 전용: True면 완전 삭제
+
+
+class TodoBatchRequest(BaseModel):
+    operations: List[TodoBatchOperation] = Field(..., min_length=1)
+
+
+class TodoBatchItemResult(BaseModel):
+    index: int = Field(
+        ...,
+        json_schema_extra={"example": 0},
+    )  # 요청 operations 내 순서
+    op: str = Field(
+        ...,
+        json_schema_extra={"example": "complete"},
+    )
+    success: bool = Field(
+        ...,
+        json_schema_extra={"example": True},
+    )
+    id: Optional[int] = Field(
+        None,
+        json_schema_extra={"example": 5},
+    )
+    todo: Optional[TodoOut] = None  # create / update / complete 성공 시
+    error: Optional[str] = Field(
+        None,
+        json_schema_extra={"example": "TODO_NOT_FOUND"},
+    )
+
+
+class TodoBatchResponse(BaseModel):
+    results: List[TodoBatchItemResult]
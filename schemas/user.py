@@ -221,7 +221,8 @@ class AdminUserOut(BaseModel):
 
 class AdminUserListResponse(BaseModel):
     users: List[AdminUserOut]
-    total: int
+    total: Optional[int] = None          # with_total=true일 때만 (캐시된 값)
+    next_cursor: Optional[str] = None    # 다음 페이지 커서 (없으면 마지막 페이지)
 
 model_config = {
             "json_schema_extra": {
@@ -244,6 +245,12 @@ model_config = {
         }
 
 
+
+class AdminUserSearchResponse(BaseModel):
+    users: List[AdminUserOut]
+    next_cursor: Optional[str] = Field(None, description="다음 페이지 커서 (없으면 마지막 페이지)")
+
+
 #  비밀번호 재설정 요청
 class PasswordResetConfirm(BaseModel):
     email: EmailStr
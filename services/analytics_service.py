@@ -0,0 +1,96 @@
+import asyncio
+from datetime import date, datetime, timedelta
+from typing import List, Optional
+from zoneinfo import ZoneInfo
+
+from core.config import settings
+from core.redis_client import redis_client
+from repositories.analytics_repo import AnalyticsRepository
+
+
+def _today() -> date:
+    return datetime.now(ZoneInfo(settings.TZ)).date()
+
+
+class AnalyticsService:
+    """
+    관리자 활동 통계 조회 (미리 집계된 activity_daily_stats만 읽음).
+    """
+
+    @staticmethod
+    async def get_active_users() -> Optional[dict]:
+        """가장 최근 집계일의 DAU / WAU / MAU"""
+        return await AnalyticsRepository.get_latest_stat()
+
+    @staticmethod
+    async def get_daily_stats(days: int) -> List[dict]:
+        """최근 days일의 날짜별 가입자 수 / 로그인 사용자 수 (KST)"""
+        end = _today()
+        return await AnalyticsRepository.get_daily_stats(end - timedelta(days=days - 1), end)
+
+
+class ActivityRollup:
+    """
+    로그인 활동 집계 작업.
+    - 로그인 시각 일괄 반영 때 user_daily_activity에 (KST 날짜, 사용자)가 쌓임
+    - ACTIVITY_ROLLUP_INTERVAL마다 마지막 집계일 전날 ~ 오늘만 다시 계산해 activity_daily_stats에 upsert
+    - 집계가 비어 있으면 users.last_login_at으로 시드 후 ACTIVITY_BACKFILL_DAYS일치 계산
+    - 워커 중 하나만 Redis 락을 잡고 실행
+    """
+
+    LOCK_KEY = "analytics:activity:rollup:lock"
+
+    def __init__(self) -> None:
+        self._task: Optional[asyncio.Task] = None
+        self._purged_on: Optional[date] = None
+
+    async def run(self) -> int:
+        """집계 갱신, 갱신한 날짜 수 반환"""
+        today = _today()
+        last = await AnalyticsRepository.last_rolled_day()
+        if last is None:
+            start = today - timedelta(days=settings.ACTIVITY_BACKFILL_DAYS)
+            await AnalyticsRepository.seed_from_last_login(start)
+        else:
+            # 전날은 늦게 반영된 로그인(버퍼 flush)까지 포함해 한 번 더 계산
+            start = min(last, today) - timedelta(days=1)
+
+        updated = await AnalyticsRepository.rollup(start, today)
+
+        # 오래된 활동 기록 정리 (하루 한 번)
+        if self._purged_on != today:
+            await AnalyticsRepository.purge_activity(today - timedelta(days=settings.ACTIVITY_RETENTION_DAYS))
+            self._purged_on = today
+        return updated
+
+    async def _loop(self) -> None:
+        while True:
+            try:
+                acquired = await redis_client.set(
+                    self.LOCK_KEY, "1", nx=True,
+                    ex=max(settings.ACTIVITY_ROLLUP_INTERVAL - 5, 1),
+                )
+            except Exception as e:
+                print(f"⚠️ 활동 집계 락 실패: {e}")
+                acquired = False
+
+            if acquired:
+                try:
+                    await self.run()
+                except Exception as e:
+                    print(f"⚠️ 활동 집계 실패: {e}")
+
+            await asyncio.sleep(settings.ACTIVITY_ROLLUP_INTERVAL)
+
+    def start(self) -> None:
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._loop())
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+            self._task = None
+
+
+activity_rollup = ActivityRollup()
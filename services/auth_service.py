@@ -1,25 +1,24 @@
-from datetime import datetime, timedelta, timezone
+from datetime import datetime, timezone
 from typing import Optional, Dict, Any
 from fastapi import Request
 
 import jwt
 import random   # ✅ 인증번호 생성용
-import redis.asyncio as redis
-from passlib.hash import bcrypt
+from services.password_service import password_hasher
 import httpx
 
+from core import security
 from core.config import settings
-from models.token_revocations import TokenRevocation
+from core.principal import invalidate_user_principal
+from core.session_version import bump_session_version, get_session_version
+from core.redis_client import redis_client
 from repositories.user_repo import UserRepository
 from core.verify_mail import send_verification_email   # ✅ 메일 발송 함수
-from repositories.token_revocations_repo import TokenRevocationsRepository
+from services.last_login_service import last_login_buffer
+from services.token_revocation_service import token_revocation_store
 from models.user import User
 from schemas.user import UserCreateRequest
 
-# ✅ Redis 연결
-REDIS_URL = "redis://redis:6379/0"
-redis_client = redis.from_url(REDIS_URL, decode_responses=True)
-
 
 class AuthService:
     """
@@ -30,16 +29,26 @@ class AuthService:
     # JWT 토큰 발급
     # ---------------------------
     @staticmethod
-    def create_access_token(user_id: int) -> str:
-        expire = datetime.utcnow() + timedelta(minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES)
-        payload = {"sub": str(user_id), "exp": expire}
-        return jwt.encode(payload, settings.SECRET_KEY, algorithm=settings.ALGORITHM)
+    def create_access_token(user_id: int, session_version: int = 0) -> str:
+        return security.create_access_token(user_id, session_version)
+
+    @staticmethod
+    def create_refresh_token(user_id: int, session_version: int = 0) -> str:
+        return security.create_refresh_token(user_id, session_version)
+
+    @staticmethod
+    async def issue_tokens(user_id: int) -> Dict[str, str]:
+        """현재 세션 버전을 담은 access / refresh 토큰 쌍 발급"""
+        session_version = await get_session_version(user_id)
+        return {
+            "access_token": AuthService.create_access_token(user_id, session_version),
+            "refresh_token": AuthService.create_refresh_token(user_id, session_version),
+        }
 
     @staticmethod
-    def create_refresh_token(user_id: int) -> str:
-        expire = datetime.utcnow() + timedelta(days=settings.REFRESH_TOKEN_EXPIRE_DAYS)
-        payload = {"sub": str(user_id), "exp": expire}
-        return jwt.encode(payload, settings.SECRET_KEY, algorithm=settings.ALGORITHM)
+    async def revoke_all_sessions(user_id: int) -> None:
+        """세션 버전 증가 → 지금까지 발급된 이 사용자의 모든 토큰 무효화"""
+        await bump_session_version(user_id)
 
     # ---------------------------
     # 이메일 인증 메일 발송 (/auth/email/verify_code)
@@ -101,7 +110,7 @@ class AuthService:
         if existing:
             return None  # 이미 가입된 이메일
 
-        password_hash = bcrypt.hash(request.password)
+        password_hash = await password_hasher.hash(request.password)
 
         user = await UserRepository.create_user(
             email=request.email,
@@ -141,8 +150,10 @@ class AuthService:
             return {"success": False, "error": "USER_NOT_FOUND"}  # 등록되지 않은 이메일
 
         # 비밀번호 해싱 후 저장
-        user.password_hash = bcrypt.hash(new_password)
-        await user.save()
+        password_hash = await password_hasher.hash(new_password)
+        await UserRepository.update_password(user, password_hash)
+        await invalidate_user_principal(user.id)
+        await bump_session_version(user.id)
 
         return {"success": True}
 
@@ -156,7 +167,7 @@ class AuthService:
         if not user:
             return {"error": "USER_NOT_FOUND"}  # 등록되지 않은 이메일
 
-        if not bcrypt.verify(password, user.password_hash):
+        if not await password_hasher.verify(password, user.password_hash):
             return {"error": "INVALID_CREDENTIALS"}  # 비밀번호 불일치
 
         if not user.is_email_verified:
@@ -165,25 +176,41 @@ class AuthService:
         if not user.is_active:
             return {"error": "ACCOUNT_DISABLED"}  # 계정 비활성화 상태
 
-        access_token = AuthService.create_access_token(user.id)
-        refresh_token = AuthService.create_refresh_token(user.id)
+        tokens = await AuthService.issue_tokens(user.id)
 
-        user.last_login_at = datetime.now(timezone.utc)
-        await user.save(update_fields=["last_login_at"])
+        # 로그인 시각은 버퍼에 기록 → 주기적으로 일괄 UPDATE
+        logged_in_at = await last_login_buffer.record(user.id)
 
-        return {"access_token": access_token, "refresh_token": refresh_token}
+        return {**tokens, "last_login_at": logged_in_at.isoformat()}
 
     # ---------------------------
     # 로그아웃 (/auth/logout)
     # ---------------------------
     @staticmethod
-    async def logout(token: str) -> Optional[TokenRevocation]:
-        """리프레시 토큰 블랙리스트 처리"""
+    async def logout(token: str, access_token: Optional[str] = None) -> bool:
+        """리프레시 토큰 (+ 아직 유효한 액세스 토큰) 블랙리스트 처리"""
         try:
             payload = jwt.decode(token, settings.SECRET_KEY, algorithms=[settings.ALGORITHM])
             user_id = int(payload.get("sub"))
-            jti = token
-            return await TokenRevocationsRepository.revoke_token(jti, user_id)
-        except jwt.InvalidTokenError:
-            return None
+        except (jwt.InvalidTokenError, TypeError, ValueError):
+            return False
+
+        await token_revocation_store.revoke(
+            security.token_jti(payload, token), user_id, security.token_expires_at(payload), reason="logout"
+        )
+
+        if access_token:
+            try:
+                access_payload = jwt.decode(
+                    access_token, settings.SECRET_KEY, algorithms=[settings.ALGORITHM]
+                )
+            except jwt.InvalidTokenError:
+                return True  # 이미 만료된 액세스 토큰은 무효화할 필요 없음
+            await token_revocation_store.revoke(
+                security.token_jti(access_payload, access_token),
+                user_id,
+                security.token_expires_at(access_payload),
+                reason="logout",
+            )
+        return True
 
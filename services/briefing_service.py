@@ -0,0 +1,215 @@
+import asyncio
+from collections import defaultdict
+from datetime import date, datetime, timedelta, timezone
+from typing import Any, Dict, List, Optional
+
+from core.cache import redis_delete, redis_get_json, redis_set_json
+from core.config import settings
+from core.db import background_db
+from core.redis_client import redis_client
+from models.schedules import Schedule
+from models.todo import Todo
+from models.user import User
+from services import gemini_service
+from services.gemini_client import gemini_request
+
+KST = timezone(timedelta(hours=9))
+
+BRIEFING_KEY = "briefing:{user_id}:{date}:{period}"
+
+# 시간대 시작 시각 → (시간대, 유효 종료 시각(시), 종료가 다음날인지)
+BRIEFING_BOUNDARIES = (
+    (6, "아침", 12, False),
+    (12, "점심", 18, False),
+    (18, "저녁", 5, True),
+)
+
+
+# ==================================================
+# (user, date, period) 브리핑 저장소
+# ==================================================
+class BriefingStore:
+    """미리 생성한 브리핑을 Redis에 (user, date, period) 단위로 보관"""
+
+    @staticmethod
+    async def get(user_id: int, target_date: date, period: str) -> Optional[dict[str, Any]]:
+        key = BRIEFING_KEY.format(user_id=user_id, date=target_date, period=period)
+        cached = await redis_get_json(key)
+        return cached if isinstance(cached, dict) else None
+
+    @staticmethod
+    async def set(
+        user_id: int, target_date: date, period: str, briefing: str, ttl: int
+    ) -> None:
+        key = BRIEFING_KEY.format(user_id=user_id, date=target_date, period=period)
+        await redis_set_json(
+            key,
+            {"briefing": briefing, "generated_at": datetime.now(KST).isoformat()},
+            ttl,
+        )
+
+    @staticmethod
+    async def invalidate(user_id: int) -> None:
+        """일정/투두 변경 시 현재 브리핑 날짜의 저장본 삭제 (다음 조회 때 새로 생성)"""
+        target_date = gemini_service.get_briefing_date()
+        await redis_delete(
+            *(
+                BRIEFING_KEY.format(user_id=user_id, date=target_date, period=period)
+                for _, period, _, _ in BRIEFING_BOUNDARIES
+            )
+        )
+
+
+# ==================================================
+# 시간대 경계 전 일괄 생성 작업
+# ==================================================
+def _day_range_utc(target: date, days: int = 1) -> tuple[datetime, datetime]:
+    start_kst = datetime.combine(target, datetime.min.time(), tzinfo=KST)
+    end_kst = datetime.combine(target + timedelta(days=days - 1), datetime.max.time(), tzinfo=KST)
+    return start_kst.astimezone(timezone.utc), end_kst.astimezone(timezone.utc)
+
+
+def next_briefing_run(now: datetime) -> tuple[datetime, str, date, datetime]:
+    """
+    다음 실행 정보 반환: (실행 시각, 시간대, 브리핑 날짜, 유효 종료 시각)
+    실행 시각 = 시간대 시작 - BRIEFING_PREFETCH_LEAD_MINUTES
+    """
+    lead = timedelta(minutes=settings.BRIEFING_PREFETCH_LEAD_MINUTES)
+    now = now.astimezone(KST)
+    for day_offset in (0, 1):
+        day = now.date() + timedelta(days=day_offset)
+        for start_hour, period, end_hour, ends_next_day in BRIEFING_BOUNDARIES:
+            starts_at = datetime.combine(day, datetime.min.time(), tzinfo=KST).replace(hour=start_hour)
+            run_at = starts_at - lead
+            if run_at > now:
+                end_day = day + timedelta(days=1) if ends_next_day else day
+                ends_at = datetime.combine(end_day, datetime.min.time(), tzinfo=KST).replace(hour=end_hour)
+                return run_at, period, day, ends_at
+    raise RuntimeError("next briefing run not found")
+
+
+class BriefingPrefetcher:
+    """
+    최근 활동 사용자의 브리핑을 시간대 시작 전에 미리 생성.
+    - 사용자 / 일정 / 투두를 청크 단위 IN 쿼리로 한 번에 조회
+    - Gemini 호출은 세마포어로 동시 실행 수 제한
+    - 워커 중 하나만 Redis 락을 잡고 실행
+    """
+
+    CHUNK_SIZE = 500
+
+    def __init__(self) -> None:
+        self._task: Optional[asyncio.Task] = None
+
+    async def _active_user_ids(self) -> List[int]:
+        since = datetime.now(timezone.utc) - timedelta(days=settings.BRIEFING_ACTIVE_DAYS)
+        rows = await User.filter(is_active=True, last_login_at__gte=since).using_db(
+            background_db()
+        ).values("id")
+        return [int(row["id"]) for row in rows]
+
+    async def _build_prompts(self, user_ids: List[int], period: str, target_date: date) -> Dict[int, str]:
+        """청크 사용자 전체의 일정/투두를 조회해 사용자별 프롬프트 생성"""
+        start_utc, end_utc = _day_range_utc(target_date)
+        days = 2 if period == "저녁" else 1
+        _, schedule_end_utc = _day_range_utc(target_date, days=days)
+
+        schedules = await Schedule.filter(
+            user_id__in=user_ids,
+            deleted_at=None,
+            start_time__gte=start_utc,
+            start_time__lte=schedule_end_utc,
+        ).using_db(background_db()).order_by("id").values("user_id", "title", "start_time")
+
+        todos = await Todo.filter(
+            user_id__in=user_ids,
+            deleted_at=None,
+            created_at__gte=start_utc,
+            created_at__lte=end_utc,
+        ).using_db(background_db()).order_by("id").values("user_id", "title", "is_completed")
+
+        today_schedules: Dict[int, list] = defaultdict(list)
+        next_schedules: Dict[int, list] = defaultdict(list)
+        for s in schedules:
+            bucket = today_schedules if s["start_time"] <= end_utc else next_schedules
+            bucket[s["user_id"]].append((s["start_time"], s["title"]))
+
+        user_todos: Dict[int, list] = defaultdict(list)
+        for t in todos:
+            user_todos[t["user_id"]].append((t["is_completed"], t["title"]))
+
+        prompts: Dict[int, str] = {}
+        for user_id in user_ids:
+            prompts[user_id] = await gemini_service.get_briefing_prompt(
+                period=period,
+                schedules=gemini_service.format_schedule_lines(today_schedules[user_id]),
+                todos=gemini_service.format_todo_lines(user_todos[user_id]),
+                target_date=target_date,
+                next_day_schedules=(
+                    gemini_service.format_schedule_lines(next_schedules[user_id], empty="내일 일정 없음")
+                    if period == "저녁"
+                    else None
+                ),
+            )
+        return prompts
+
+    async def run(self, period: str, target_date: date, ends_at: datetime) -> int:
+        """해당 시간대 브리핑 일괄 생성, 생성 건수 반환"""
+        ttl = max(int((ends_at - datetime.now(KST)).total_seconds()), 1)
+        semaphore = asyncio.Semaphore(settings.BRIEFING_PREFETCH_CONCURRENCY)
+        generated = 0
+
+        async def _generate(user_id: int, prompt: str) -> None:
+            nonlocal generated
+            async with semaphore:
+                try:
+                    briefing = await gemini_request(
+                        prompt, cache_ttl=ttl, cache_scope=f"{target_date}:{period}"
+                    )
+                except Exception as e:
+                    print(f"⚠️ 브리핑 미리 생성 실패 (user={user_id}): {e}")
+                    return
+            await BriefingStore.set(user_id, target_date, period, briefing, ttl)
+            generated += 1
+
+        user_ids = await self._active_user_ids()
+        for i in range(0, len(user_ids), self.CHUNK_SIZE):
+            chunk = user_ids[i : i + self.CHUNK_SIZE]
+            prompts = await self._build_prompts(chunk, period, target_date)
+            await asyncio.gather(*(_generate(uid, prompt) for uid, prompt in prompts.items()))
+
+        print(f"🗞 브리핑 미리 생성 완료: {target_date} {period} {generated}/{len(user_ids)}건")
+        return generated
+
+    async def _loop(self) -> None:
+        while True:
+            run_at, period, target_date, ends_at = next_briefing_run(datetime.now(KST))
+            await asyncio.sleep(max((run_at - datetime.now(KST)).total_seconds(), 0))
+
+            try:
+                acquired = await redis_client.set(
+                    f"briefing:prefetch:lock:{target_date}:{period}", "1", nx=True, ex=3600
+                )
+            except Exception as e:
+                print(f"⚠️ 브리핑 미리 생성 락 실패: {e}")
+                continue
+            if not acquired:
+                continue
+
+            try:
+                await self.run(period, target_date, ends_at)
+            except Exception as e:
+                print(f"⚠️ 브리핑 미리 생성 작업 실패: {e}")
+
+    def start(self) -> None:
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._loop())
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+            self._task = None
+
+
+briefing_prefetcher = BriefingPrefetcher()
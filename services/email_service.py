@@ -1,21 +1,4 @@
-from fastapi_mail import FastMail, MessageSchema, MessageType, ConnectionConfig
-from core.config import settings
-from pydantic import SecretStr
-
-
-# config에서 mail 사용하는 값 묶기
-
-conf = ConnectionConfig(
-    MAIL_USERNAME=settings.MAIL_USERNAME,
-    MAIL_PASSWORD=SecretStr(settings.MAIL_PASSWORD),
-    MAIL_FROM=settings.MAIL_FROM or settings.MAIL_USERNAME,
-    MAIL_PORT=settings.MAIL_PORT,
-    MAIL_SERVER=settings.MAIL_SERVER,
-    MAIL_STARTTLS=settings.MAIL_STARTTLS,
-    MAIL_SSL_TLS=settings.MAIL_SSL_TLS,
-    USE_CREDENTIALS=settings.USE_CREDENTIALS,
-    VALIDATE_CERTS=settings.VALIDATE_CERTS,
-)
+from core.mail_outbox import mail_outbox
 
 
 async def send_verification_email(email: str, code: str) -> None:
@@ -30,11 +13,5 @@ async def send_verification_email(email: str, code: str) -> None:
 10분 안에 인증하지 않으면 만료됩니다.
 """
 
-    message = MessageSchema(
-        subject="이메일 인증 요청",
-        recipients=[email],
-        body=text_body,
-        subtype=MessageType.plain,
-    )
-    fm = FastMail(conf)
-    await fm.send_message(message)
\ No newline at end of file
+    # ✅ 대기열에 넣고 바로 반환 (실제 발송은 mail_outbox 워커)
+    await mail_outbox.enqueue(to=email, subject="이메일 인증 요청", body=text_body)
\ No newline at end of file
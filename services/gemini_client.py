@@ -1,11 +1,102 @@
-from typing import Any, cast
+import asyncio
+import hashlib
+import json
+import re
+from typing import Any, AsyncIterator, Dict, Optional, cast
 import httpx
 from fastapi import HTTPException
 from core.config import settings
+from core.http_client import get_http_client
+from core.redis_client import redis_client
 
+GEMINI_MODEL = "gemini-2.5-flash"
+GEMINI_BASE_URL = "https://generativelanguage.googleapis.com/v1/models"
 
-async def gemini_request(prompt: str) -> str:
-    """Gemini API 호출 담당"""
+# 동일 프롬프트 동시 요청 → 워커 내에서는 하나의 Task만 Gemini 호출
+_inflight: Dict[str, "asyncio.Task[str]"] = {}
+
+# 다른 워커가 생성 중일 때 결과를 기다리는 최대 시간 (초)
+_LOCK_TTL = 30
+_WAIT_TIMEOUT = 20.0
+_WAIT_INTERVAL = 0.2
+
+
+def prompt_fingerprint(prompt: str, scope: str = "") -> str:
+    """공백 정규화한 프롬프트 + 모델 + scope(날짜 등) 해시"""
+    normalized = re.sub(r"\s+", " ", prompt).strip()
+    return hashlib.sha256(f"{GEMINI_MODEL}\n{scope}\n{normalized}".encode()).hexdigest()
+
+
+async def gemini_request(
+    prompt: str,
+    cache_ttl: Optional[int] = None,
+    cache_scope: str = "",
+) -> str:
+    """
+    Gemini API 호출 담당
+    - cache_ttl 지정 시 Redis 생성 캐시 사용 (동일 프롬프트는 TTL 동안 재사용)
+    - cache_scope: 프롬프트에 드러나지 않는 구분값 (예: 기준 날짜)
+    """
+    if not cache_ttl:
+        return await _generate(prompt)
+
+    key = prompt_fingerprint(prompt, cache_scope)
+    task = _inflight.get(key)
+    if task is None:
+        task = asyncio.create_task(_generate_cached(key, prompt, cache_ttl))
+        _inflight[key] = task
+        task.add_done_callback(lambda _: _inflight.pop(key, None))
+
+    # 한 요청이 취소되어도 같은 Task를 기다리는 다른 요청에는 영향 없음
+    return await asyncio.shield(task)
+
+
+async def _cache_get(key: str) -> Optional[str]:
+    try:
+        cached = await redis_client.get(f"gemini:cache:{key}")
+        return str(cached) if cached is not None else None
+    except Exception as e:
+        print(f"⚠️ Gemini 캐시 조회 실패: {e}")
+        return None
+
+
+async def _generate_cached(key: str, prompt: str, ttl: int) -> str:
+    cached = await _cache_get(key)
+    if cached is not None:
+        return cached
+
+    # 워커 간 single-flight: 락을 못 잡으면 다른 워커의 결과를 잠시 기다림
+    lock_key = f"gemini:lock:{key}"
+    try:
+        acquired = await redis_client.set(lock_key, "1", nx=True, ex=_LOCK_TTL)
+    except Exception:
+        acquired = True
+
+    if not acquired:
+        waited = 0.0
+        while waited < _WAIT_TIMEOUT:
+            await asyncio.sleep(_WAIT_INTERVAL)
+            waited += _WAIT_INTERVAL
+            cached = await _cache_get(key)
+            if cached is not None:
+                return cached
+
+    try:
+        text = await _generate(prompt)
+        try:
+            await redis_client.set(f"gemini:cache:{key}", text, ex=ttl)
+        except Exception as e:
+            print(f"⚠️ Gemini 캐시 저장 실패: {e}")
+        return text
+    finally:
+        if acquired:
+            try:
+                await redis_client.delete(lock_key)
+            except Exception:
+                pass
+
+
+def _check_api_key() -> None:
     if not settings.GEMINI_API_KEY:
         raise HTTPException(
             status_code=500,
@@ -15,17 +106,86 @@ async def gemini_request(prompt: str) -> str:
             }
         )
 
-    GEMINI_URL = (
-        "https://generativelanguage.googleapis.com/v1/models/"
-        f"gemini-2.5-flash:generateContent?key={settings.GEMINI_API_KEY}"
-    )
 
+async def gemini_stream(
+    prompt: str,
+    cache_ttl: Optional[int] = None,
+    cache_scope: str = "",
+) -> AsyncIterator[str]:
+    """
+    Gemini streamGenerateContent(SSE) 호출 → 텍스트 조각을 도착하는 대로 반환
+    - 캐시에 있으면 전체 텍스트를 한 번에 반환
+    - 스트림이 끝까지 성공하면 전체 텍스트를 캐시에 저장 (gemini_request와 같은 키)
+    """
+    key = prompt_fingerprint(prompt, cache_scope) if cache_ttl else None
+    if key is not None:
+        cached = await _cache_get(key)
+        if cached is not None:
+            yield cached
+            return
+
+    _check_api_key()
+    url = f"{GEMINI_BASE_URL}/{GEMINI_MODEL}:streamGenerateContent?alt=sse&key={settings.GEMINI_API_KEY}"
+
+    chunks: list[str] = []
     try:
-        async with httpx.AsyncClient(timeout=15) as client:
-            res = await client.post(
-                GEMINI_URL,
-                json={"contents": [{"parts": [{"text": prompt}]}]},
-            )
+        async with get_http_client("gemini").stream(
+            "POST",
+            url,
+            json={"contents": [{"parts": [{"text": prompt}]}]},
+        ) as res:
+            if res.status_code != 200:
+                body = await res.aread()
+                raise HTTPException(
+                    status_code=res.status_code,
+                    detail={
+                        "error_code": "GEMINI_RESPONSE_ERROR",
+                        "message": f"Gemini API 응답 실패: {body.decode(errors='replace')}"
+                    }
+                )
+
+            async for line in res.aiter_lines():
+                if not line.startswith("data:"):
+                    continue
+                payload = line[len("data:"):].strip()
+                if not payload:
+                    continue
+                try:
+                    data = json.loads(payload)
+                    parts = data["candidates"][0]["content"]["parts"]
+                except (ValueError, KeyError, IndexError):
+                    continue
+                text = "".join(str(p.get("text", "")) for p in parts)
+                if text:
+                    chunks.append(text)
+                    yield text
+    except httpx.RequestError as e:
+        raise HTTPException(
+            status_code=500,
+            detail={
+                "error_code": "GEMINI_REQUEST_ERROR",
+                "message": f"Gemini API 요청 실패: {e}"
+            }
+        )
+
+    if key is not None and cache_ttl and chunks:
+        try:
+            await redis_client.set(f"gemini:cache:{key}", "".join(chunks), ex=cache_ttl)
+        except Exception as e:
+            print(f"⚠️ Gemini 캐시 저장 실패: {e}")
+
+
+async def _generate(prompt: str) -> str:
+    """Gemini generateContent 실제 호출"""
+    _check_api_key()
+
+    GEMINI_URL = f"{GEMINI_BASE_URL}/{GEMINI_MODEL}:generateContent?key={settings.GEMINI_API_KEY}"
+
+    try:
+        res = await get_http_client("gemini").post(
+            GEMINI_URL,
+            json={"contents": [{"parts": [{"text": prompt}]}]},
+        )
     except httpx.RequestError as e:
         raise HTTPException(
             status_code=500,
@@ -1,5 +1,15 @@
 from datetime import datetime, date, timedelta, timezone
-from typing import Optional, List
+from typing import Iterable, Optional, List
+
+
+# ✅ 한국 표준시 (KST)
+KST = timezone(timedelta(hours=9))
+
+# 이 시각(KST) 전까지는 전날을 브리핑 기준 날짜로 사용
+BRIEFING_DATE_START_HOUR = 5
+
+# (시간대, 시작 시각) — 마지막 시간대는 다음날 첫 시간대 시작 전까지
+BRIEFING_PERIODS = (("아침", 6), ("점심", 12), ("저녁", 18))
 
 
 # ==================================================
@@ -10,15 +20,80 @@ def get_briefing_date() -> date:
     자정~05시 사이는 전날 날짜를 반환,
     그 외 시간은 오늘 날짜를 반환.
     """
-    KST = timezone(timedelta(hours=9))
     now = datetime.now(KST)
-    if 0 <= now.hour < 5:
+    if 0 <= now.hour < BRIEFING_DATE_START_HOUR:
         target_date = now - timedelta(days=1)
     else:
         target_date = now
     return target_date.date()
 
 
+# ==================================================
+# 🕕 브리핑 시간대 / 캐시 만료 시각 계산
+# ==================================================
+def get_briefing_period(now: Optional[datetime] = None) -> str:
+    """06~12시 아침, 12~18시 점심, 그 외 저녁 (BRIEFING_PERIODS 기준)"""
+    hour = (now or datetime.now(KST)).astimezone(KST).hour
+    period = BRIEFING_PERIODS[-1][0]
+    for name, start_hour in BRIEFING_PERIODS:
+        if hour >= start_hour:
+            period = name
+    return period
+
+
+def seconds_until_next_day(now: Optional[datetime] = None) -> int:
+    """KST 자정까지 남은 시간 (초)"""
+    now = (now or datetime.now(KST)).astimezone(KST)
+    midnight = datetime.combine(now.date() + timedelta(days=1), datetime.min.time(), tzinfo=KST)
+    return max(int((midnight - now).total_seconds()), 1)
+
+
+def seconds_until_next_briefing_date(now: Optional[datetime] = None) -> int:
+    """get_briefing_date()가 바뀌는 다음 KST 05시까지 남은 시간 (초)"""
+    now = (now or datetime.now(KST)).astimezone(KST)
+    boundary = now.replace(hour=BRIEFING_DATE_START_HOUR, minute=0, second=0, microsecond=0)
+    if boundary <= now:
+        boundary += timedelta(days=1)
+    return max(int((boundary - now).total_seconds()), 1)
+
+
+def seconds_until_briefing_boundary(now: Optional[datetime] = None) -> int:
+    """
+    다음 브리핑 경계까지 남은 시간 (초).
+    경계: 05시(브리핑 기준 날짜 변경), 06시/12시/18시(시간대 변경)
+    """
+    now = (now or datetime.now(KST)).astimezone(KST)
+    hours = sorted({BRIEFING_DATE_START_HOUR, *(start_hour for _, start_hour in BRIEFING_PERIODS)})
+    for hour in hours:
+        boundary = now.replace(hour=hour, minute=0, second=0, microsecond=0)
+        if boundary > now:
+            return max(int((boundary - now).total_seconds()), 1)
+    next_boundary = datetime.combine(
+        now.date() + timedelta(days=1), datetime.min.time(), tzinfo=KST
+    ).replace(hour=hours[0])
+    return max(int((next_boundary - now).total_seconds()), 1)
+
+
+# ==================================================
+# 📝 일정 / 투두 → 프롬프트용 문자열
+# ==================================================
+def format_schedule_lines(
+    schedules: Iterable[tuple[datetime, str]], empty: str = "일정 없음"
+) -> list[str]:
+    """(start_time, title) 목록 → 'HH:MM 제목' (KST)"""
+    return [
+        f"{start_time.astimezone(KST).strftime('%H:%M')} {title}"
+        for start_time, title in schedules
+    ] or [empty]
+
+
+def format_todo_lines(todos: Iterable[tuple[bool, str]]) -> list[str]:
+    """(is_completed, title) 목록 → '- [x] 제목'"""
+    return [
+        f"- [{'x' if is_completed else ' '}] {title}" for is_completed, title in todos
+    ] or ["투두 없음"]
+
+
 # ==================================================
 # 1️⃣ 오늘의 운세 프롬프트
 # ==================================================
@@ -79,6 +154,7 @@ async def get_briefing_prompt(
     schedules: Optional[List[str]] = None,
     todos: Optional[List[str]] = None,
     target_date: Optional[date] = None,
+    next_day_schedules: Optional[List[str]] = None,
 ) -> str:
     target_date = target_date or get_briefing_date()
 
@@ -134,4 +210,11 @@ async def get_briefing_prompt(
 - 허구의 내용은 절대 생성하지 마세요.
         """
 
-    return f"{content}\n\n{base_notice}\n"
+    prompt = f"{content}\n\n{base_notice}\n"
+
+    # ✅ 저녁 프롬프트에는 내일 일정도 포함
+    if period == "저녁" and next_day_schedules is not None:
+        next_text = "\n".join(next_day_schedules)
+        prompt += f"\n\n# 내일 일정 미리보기\n{next_text}\n"
+
+    return prompt
@@ -1,20 +1,101 @@
+import asyncio
+import hashlib
+import re
+import time
 import httpx
 from datetime import date, datetime, timezone
+from typing import Any, Optional
+
+from google.auth import jwt as google_jwt
 
 from core.config import settings
 from repositories.user_repo import UserRepository
 from .auth_service import AuthService
 from core import google_handler
+from core.http_client import get_http_client
+from core.redis_client import redis_client
+from services.last_login_service import last_login_buffer
+
+GOOGLE_CERTS_URL = "https://www.googleapis.com/oauth2/v1/certs"
+GOOGLE_ISSUERS = ("accounts.google.com", "https://accounts.google.com")
+
+
+# ---------------------------
+# 구글 서명 인증서 캐시 (id_token 로컬 검증용)
+# ---------------------------
+class GoogleCertCache:
+    """
+    구글 공개 인증서(kid → PEM)를 Cache-Control max-age 동안 워커 메모리에 보관.
+    모르는 kid가 오면(키 교체) 한 번 새로 받음.
+    """
+
+    DEFAULT_MAX_AGE = 3600
+
+    def __init__(self) -> None:
+        self._certs: dict[str, str] = {}
+        self._expires_at = 0.0
+        self._lock = asyncio.Lock()
+
+    async def _fetch(self) -> None:
+        resp = await get_http_client("google").get(GOOGLE_CERTS_URL)
+        resp.raise_for_status()
+        match = re.search(r"max-age=(\d+)", resp.headers.get("cache-control", ""))
+        max_age = int(match.group(1)) if match else self.DEFAULT_MAX_AGE
+        self._certs = dict(resp.json())
+        self._expires_at = time.monotonic() + max_age
+
+    async def get(self, kid: Optional[str] = None) -> dict[str, str]:
+        if time.monotonic() < self._expires_at and (kid is None or kid in self._certs):
+            return self._certs
+        async with self._lock:
+            # 락을 기다리는 동안 다른 요청이 이미 갱신했으면 그대로 사용
+            if time.monotonic() >= self._expires_at or (kid is not None and kid not in self._certs):
+                await self._fetch()
+        return self._certs
+
+
+google_certs = GoogleCertCache()
+
+
+async def verify_google_id_token(token: str) -> dict[str, Any]:
+    """id_token 서명 / aud / iss / exp 로컬 검증 후 클레임 반환 (userinfo 호출 불필요)"""
+    kid = google_jwt.decode_header(token).get("kid")
+    certs = await google_certs.get(kid)
+    claims: dict[str, Any] = google_jwt.decode(
+        token,
+        certs=certs,
+        audience=google_handler.GOOGLE_CLIENT_ID,
+        clock_skew_in_seconds=10,
+    )
+    if claims.get("iss") not in GOOGLE_ISSUERS:
+        raise ValueError(f"invalid id_token issuer: {claims.get('iss')}")
+    if not claims.get("email_verified", False):
+        raise ValueError("google email not verified")
+    return claims
+
 
 # ---------------------------
 # 구글 로그인 (/auth/google/callback)
 # ---------------------------
 class GoogleAuthService(AuthService):
 
+    CODE_TTL = 600  # 구글 authorization code 유효 시간보다 길게
+
+    @staticmethod
+    async def claim_code(code: str) -> bool:
+        """
+        authorization code 1회 사용 처리 (워커 간 공유, TTL 후 자동 삭제).
+        이미 사용된 code면 False
+        """
+        key = f"google:oauth:code:{hashlib.sha256(code.encode()).hexdigest()}"
+        try:
+            return bool(await redis_client.set(key, "1", nx=True, ex=GoogleAuthService.CODE_TTL))
+        except Exception as e:
+            print(f"⚠️ Google code 중복 확인 실패: {e}")
+            return True  # Redis 장애 시 구글 쪽 code 재사용 거부에 맡김
 
     @staticmethod
     async def google_callback(code: str) -> dict[str, str]:
-        _used_codes: set[str]
         print(f"=== AuthService.google_callback 시작: code={code[:30]}...")  # ⭕
         try:
             token_url = "https://oauth2.googleapis.com/token"
@@ -27,37 +108,25 @@ class GoogleAuthService(AuthService):
             }
             print("Google token request data:", data)
 
-            print(">>> httpx.AsyncClient 생성 중...")  # ⭕
-            async with httpx.AsyncClient(timeout=30.0) as client:
-                print(">>> POST 요청 시작...")  # ⭕
-                resp = await client.post(token_url, data=data)
-                print(f">>> 응답 받음! status_code={resp.status_code}")  # ⭕
-                print("Google token raw response:", resp.text)
-
-                token_data = resp.json()
-                if "error" in token_data:
-                    print(f">>> 구글 토큰 오류: {token_data}")  # ⭕
-                    raise Exception(f"Google token error: {token_data}")
-
-                access_token = token_data["access_token"]
-                print(f">>> access_token 획득 성공: {access_token[:20]}...")  # ⭕
-
-                # (2) userinfo 가져오기
-                userinfo_url = "https://openidconnect.googleapis.com/v1/userinfo"
-                headers = {"Authorization": f"Bearer {access_token}"}
-                print(">>> userinfo 요청 중...")  # ⭕
-                user_response = await client.get(userinfo_url, headers=headers)
-                print(f">>> userinfo 응답: status={user_response.status_code}")  # ⭕
+            client = get_http_client("google")
+            print(">>> POST 요청 시작...")  # ⭕
+            resp = await client.post(token_url, data=data)
+            print(f">>> 응답 받음! status_code={resp.status_code}")  # ⭕
+            print("Google token raw response:", resp.text)
 
-                if user_response.status_code != 200:
-                    raise Exception(f"userinfo error: {user_response.text}")
+            token_data = resp.json()
+            if "error" in token_data:
+                print(f">>> 구글 토큰 오류: {token_data}")  # ⭕
+                raise Exception(f"Google token error: {token_data}")
 
-                info = user_response.json()
-                print("Google userinfo response:", info)
+            # (2) id_token 로컬 검증으로 사용자 정보 획득 (userinfo 왕복 없음)
+            info = await verify_google_id_token(token_data["id_token"])
+            print(">>> id_token 검증 완료")  # ⭕
 
-                name = info.get("name")
-                email = info.get("email")
-                google_id = info.get("sub")
+            # email_verified를 확인했으므로 email / sub는 항상 있음
+            name: str | None = info.get("name")
+            email: str = info["email"]
+            google_id: str = info["sub"]
 
             print(">>> DB 작업 시작...")  # ⭕
             # (3) DB 조회 또는 신규 생성
@@ -72,17 +141,15 @@ class GoogleAuthService(AuthService):
                 )
                 user.google_id = google_id
                 user.is_email_verified = True
-                await user.save()
+                await user.save(update_fields=["google_id", "is_email_verified", "updated_at"])
 
             print(">>> JWT 발급 중...")  # ⭕
             # (4) JWT 발급
-            access_token = AuthService.create_access_token(user.id)
-            refresh_token = AuthService.create_refresh_token(user.id)
-            user.last_login_at = datetime.now(timezone.utc)
+            tokens = await AuthService.issue_tokens(user.id)
+            await last_login_buffer.record(user.id)
 
             result = {
-                "access_token": access_token,
-                "refresh_token": refresh_token,
+                **tokens,
                 "token_type": "bearer",
             }
             print(f">>> 완료! 반환값: {result.keys()}")  # ⭕
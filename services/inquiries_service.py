@@ -1,4 +1,4 @@
-from typing import List, Optional
+from typing import List, Optional, Tuple
 from repositories.inquiries_repo import InquiryRepository
 from models.inquiries import Inquiry, InquiryStatus
 from datetime import datetime
@@ -30,14 +30,33 @@ class InquiryService:
         return await InquiryRepository.get_inquiry_by_id(inquiry_id)
 
     @staticmethod
-    async def get_inquiries_by_user(user_id: int) -> List[Inquiry]:
-        """사용자별 문의 목록"""
-        return await InquiryRepository.get_inquiries_by_user(user_id)
+    async def get_inquiries_by_user(
+        user_id: int,
+        limit: int,
+        after: Optional[Tuple[datetime, int]] = None,
+    ) -> Tuple[List[Inquiry], Optional[str]]:
+        """사용자별 문의 목록 (최신순 페이지)"""
+        return await InquiryRepository.get_inquiries_by_user(user_id, limit, after)
 
     @staticmethod
-    async def get_all_inquiries() -> List[Inquiry]:
-        """관리자 전용 전체 문의 목록"""
-        return await InquiryRepository.get_all_inquiries()
+    async def get_all_inquiries(
+        limit: int,
+        after: Optional[Tuple[datetime, int]] = None,
+    ) -> Tuple[List[Inquiry], Optional[str]]:
+        """관리자 전용 전체 문의 목록 (최신순 페이지)"""
+        return await InquiryRepository.get_all_inquiries(limit, after)
+
+    @staticmethod
+    async def count_inquiries_by_user(user_id: int) -> int:
+        return await InquiryRepository.count_inquiries_by_user(user_id)
+
+    @staticmethod
+    async def count_all_inquiries() -> int:
+        return await InquiryRepository.count_all_inquiries()
+
+    @staticmethod
+    async def invalidate_count(user_id: int) -> None:
+        await InquiryRepository.invalidate_count(user_id)
 
     # --------------------
     # UPDATE
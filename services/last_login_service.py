@@ -0,0 +1,129 @@
+import asyncio
+from datetime import datetime, timezone
+from typing import Dict, Optional
+
+from redis.exceptions import LockError
+
+from core.config import settings
+from core.db import background_db
+from core.redis_client import redis_client
+from repositories.analytics_repo import AnalyticsRepository
+
+PENDING_KEY = "user:last_login:pending"     # user_id → epoch 초 (아직 DB 미반영)
+FLUSHING_KEY = "user:last_login:flushing"   # 반영 중인 묶음 (실패 시 다음 주기에 재시도)
+FLUSH_LOCK_KEY = "user:last_login:flush:lock"
+
+BULK_UPDATE_SQL = (
+    "UPDATE users SET last_login_at = to_timestamp(v.ts)"
+    " FROM (SELECT unnest($1::bigint[]) AS id, unnest($2::double precision[]) AS ts) AS v"
+    " WHERE users.id = v.id"
+    " AND (users.last_login_at IS NULL OR users.last_login_at < to_timestamp(v.ts))"
+)
+
+
+class LastLoginBuffer:
+    """
+    로그인 시각 write-behind 버퍼.
+    - 로그인 시에는 Redis hash에 기록만 (사용자당 최신 값 1개)
+    - LAST_LOGIN_FLUSH_INTERVAL마다 한 워커가 모아서 UPDATE 1회로 users에 반영
+    - 관리자 조회는 get_pending()으로 DB 값과 병합
+    """
+
+    def __init__(self) -> None:
+        self._task: Optional[asyncio.Task] = None
+
+    async def record(self, user_id: int, at: Optional[datetime] = None) -> datetime:
+        at = at or datetime.now(timezone.utc)
+        try:
+            await redis_client.hset(PENDING_KEY, str(user_id), str(at.timestamp()))
+        except Exception as e:
+            # Redis 장애 시 바로 반영
+            print(f"⚠️ 로그인 시각 버퍼 저장 실패, 직접 저장: {e}")
+            await self._write({user_id: at.timestamp()})
+        return at
+
+    async def get_pending(self) -> Dict[int, datetime]:
+        """아직 DB에 반영되지 않은 로그인 시각 (반영 중인 묶음 포함)"""
+        try:
+            async with redis_client.pipeline(transaction=False) as pipe:
+                pipe.hgetall(FLUSHING_KEY)
+                pipe.hgetall(PENDING_KEY)
+                flushing, pending = await pipe.execute()
+        except Exception as e:
+            print(f"⚠️ 로그인 시각 버퍼 조회 실패: {e}")
+            return {}
+
+        merged: Dict[int, float] = {}
+        for batch in (flushing, pending):
+            for user_id, ts in batch.items():
+                merged[int(user_id)] = max(merged.get(int(user_id), 0.0), float(ts))
+        return {
+            user_id: datetime.fromtimestamp(ts, tz=timezone.utc)
+            for user_id, ts in merged.items()
+        }
+
+    @staticmethod
+    async def _write(entries: Dict[int, float]) -> int:
+        ids = list(entries)
+        updated, _ = await background_db().execute_query(
+            BULK_UPDATE_SQL, [ids, [entries[i] for i in ids]]
+        )
+        # 일별 활동 기록 (DAU/WAU/MAU 집계용)
+        await AnalyticsRepository.record_logins(entries)
+        return int(updated)
+
+    async def flush(self) -> int:
+        """버퍼 내용을 users에 일괄 반영, 반영 건수 반환"""
+        # 토큰 기반 락: 반영이 길어져 TTL이 지난 뒤 다른 워커가 잡은 락을 지우지 않음 (compare-and-delete)
+        lock = redis_client.lock(
+            FLUSH_LOCK_KEY,
+            timeout=max(settings.LAST_LOGIN_FLUSH_INTERVAL * 6, 30),
+            blocking=False,
+            thread_local=False,
+        )
+        if not await lock.acquire():
+            return 0
+
+        try:
+            # 이전 주기에 실패한 묶음이 없을 때만 새 묶음을 떼어냄 (RENAME은 원자적)
+            if not await redis_client.exists(FLUSHING_KEY):
+                if not await redis_client.exists(PENDING_KEY):
+                    return 0
+                await redis_client.rename(PENDING_KEY, FLUSHING_KEY)
+
+            raw = await redis_client.hgetall(FLUSHING_KEY)
+            entries = {int(user_id): float(ts) for user_id, ts in raw.items()}
+            updated = await self._write(entries) if entries else 0
+            await redis_client.delete(FLUSHING_KEY)
+            return updated
+        finally:
+            try:
+                await lock.release()
+            except LockError as e:
+                print(f"⚠️ 로그인 시각 반영 락이 이미 만료됨: {e}")
+
+    async def _loop(self) -> None:
+        while True:
+            await asyncio.sleep(settings.LAST_LOGIN_FLUSH_INTERVAL)
+            try:
+                await self.flush()
+            except Exception as e:
+                print(f"⚠️ 로그인 시각 일괄 반영 실패: {e}")
+
+    def start(self) -> None:
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._loop())
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+            self._task = None
+        # 종료 전 남은 기록 반영
+        try:
+            await self.flush()
+        except Exception as e:
+            print(f"⚠️ 종료 시 로그인 시각 반영 실패: {e}")
+
+
+last_login_buffer = LastLoginBuffer()
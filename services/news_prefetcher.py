@@ -0,0 +1,164 @@
+import asyncio
+import json
+import time
+from dataclasses import dataclass
+from typing import Dict, Optional
+
+from core.config import settings
+from core.redis_client import redis_client
+from schemas.news import NewsItem, NewsResponse
+from services.news_service import NAVER_NEWS_SECTIONS, scrape_naver_news
+
+NEWS_SNAPSHOT_LIMIT = 6
+SNAPSHOT_KEY = "news:snapshot:{category}"
+REFRESH_LOCK_KEY = "news:refresh:lock"
+
+
+@dataclass(frozen=True, slots=True)
+class NewsSnapshot:
+    """카테고리별 직렬화된 NewsResponse (그대로 응답 본문으로 사용)"""
+    body: str
+    fetched_at: float
+
+    @property
+    def age(self) -> float:
+        return time.time() - self.fetched_at
+
+
+class NewsPrefetcher:
+    """
+    네이버 뉴스 섹션을 백그라운드에서 주기적으로 스크래핑해 두는 저장소.
+    - 워커 중 하나만 Redis 락을 잡고 스크래핑, 나머지는 Redis 스냅샷을 가져옴
+    - 요청 경로에서는 메모리 스냅샷만 읽음 (오래된 경우 응답 후 백그라운드 갱신)
+    - 스크래핑 실패 시 직전 정상 스냅샷 유지
+    """
+
+    def __init__(self) -> None:
+        self._snapshots: Dict[str, NewsSnapshot] = {}
+        self._refreshing: Dict[str, "asyncio.Task[Optional[NewsSnapshot]]"] = {}
+        self._task: Optional[asyncio.Task] = None
+
+    # --------------------
+    # 스냅샷 생성 / 저장
+    # --------------------
+    async def refresh_category(self, category: str) -> Optional[NewsSnapshot]:
+        """카테고리 1개 스크래핑 → 스냅샷 저장 (결과가 비면 기존 스냅샷 유지)"""
+        raw_items = await scrape_naver_news(NAVER_NEWS_SECTIONS[category], limit=NEWS_SNAPSHOT_LIMIT)
+        if not raw_items:
+            return None
+
+        news_items = [NewsItem(**item) for item in raw_items]
+        response = NewsResponse(
+            success=True,
+            category=category,
+            count=len(news_items),
+            data=news_items,
+        )
+        snapshot = NewsSnapshot(body=response.model_dump_json(), fetched_at=time.time())
+        self._snapshots[category] = snapshot
+
+        try:
+            await redis_client.set(
+                SNAPSHOT_KEY.format(category=category),
+                json.dumps({"body": snapshot.body, "fetched_at": snapshot.fetched_at}),
+                ex=settings.NEWS_SNAPSHOT_TTL,
+            )
+        except Exception as e:
+            print(f"⚠️ 뉴스 스냅샷 Redis 저장 실패 ({category}): {e}")
+        return snapshot
+
+    async def _load_from_redis(self, category: str) -> Optional[NewsSnapshot]:
+        """다른 워커가 만든 스냅샷이 더 최신이면 가져옴"""
+        try:
+            raw = await redis_client.get(SNAPSHOT_KEY.format(category=category))
+        except Exception as e:
+            print(f"⚠️ 뉴스 스냅샷 Redis 조회 실패 ({category}): {e}")
+            return None
+        if not raw:
+            return None
+
+        data = json.loads(raw)
+        remote = NewsSnapshot(body=data["body"], fetched_at=float(data["fetched_at"]))
+        local = self._snapshots.get(category)
+        if local is None or remote.fetched_at > local.fetched_at:
+            self._snapshots[category] = remote
+            return remote
+        return local
+
+    async def refresh_all(self) -> None:
+        """전체 섹션 갱신 (락을 못 잡으면 Redis 스냅샷 동기화만)"""
+        try:
+            acquired = await redis_client.set(
+                REFRESH_LOCK_KEY, "1", nx=True, ex=max(settings.NEWS_REFRESH_INTERVAL - 5, 1)
+            )
+        except Exception:
+            acquired = True  # Redis 장애 시 각 워커가 직접 갱신
+
+        for category in NAVER_NEWS_SECTIONS:
+            try:
+                if acquired:
+                    await self.refresh_category(category)
+                else:
+                    await self._load_from_redis(category)
+            except Exception as e:
+                print(f"⚠️ 뉴스 갱신 실패 ({category}): {e}")
+
+    def _refresh_task(self, category: str) -> "asyncio.Task[Optional[NewsSnapshot]]":
+        """카테고리당 스크래핑은 동시에 하나만 (콜드 스타트 요청 / 백그라운드 갱신이 같은 Task 공유)"""
+        task = self._refreshing.get(category)
+        if task is None or task.done():
+            task = asyncio.create_task(self.refresh_category(category))
+            self._refreshing[category] = task
+            task.add_done_callback(lambda t: self._refresh_done(category, t))
+        return task
+
+    def _refresh_done(self, category: str, task: "asyncio.Task[Optional[NewsSnapshot]]") -> None:
+        if self._refreshing.get(category) is task:
+            self._refreshing.pop(category, None)
+        if not task.cancelled() and task.exception() is not None:
+            print(f"⚠️ 뉴스 갱신 실패 ({category}): {task.exception()}")
+
+    def _refresh_in_background(self, category: str) -> None:
+        """stale-while-revalidate: 응답은 기존 스냅샷으로, 갱신은 뒤에서"""
+        self._refresh_task(category)
+
+    # --------------------
+    # 조회 (요청 경로)
+    # --------------------
+    async def get_snapshot(self, category: str) -> Optional[NewsSnapshot]:
+        snapshot = self._snapshots.get(category)
+
+        if snapshot is None:
+            snapshot = await self._load_from_redis(category)
+
+        if snapshot is None:
+            # 콜드 스타트: 동시 요청은 진행 중인 스크래핑 하나를 같이 기다림
+            # (한 요청이 취소되어도 다른 요청이 기다리는 Task는 계속 진행)
+            return await asyncio.shield(self._refresh_task(category))
+
+        if snapshot.age > settings.NEWS_STALE_AFTER:
+            self._refresh_in_background(category)
+        return snapshot
+
+    # --------------------
+    # 백그라운드 루프 (lifespan)
+    # --------------------
+    async def _loop(self) -> None:
+        while True:
+            await self.refresh_all()
+            await asyncio.sleep(settings.NEWS_REFRESH_INTERVAL)
+
+    def start(self) -> None:
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._loop())
+
+    async def stop(self) -> None:
+        tasks = [t for t in [self._task, *self._refreshing.values()] if t is not None]
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        self._task = None
+        self._refreshing.clear()
+
+
+news_prefetcher = NewsPrefetcher()
@@ -1,13 +1,32 @@
-import httpx
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
 from typing import List, Optional
-from bs4 import BeautifulSoup, Tag
+from bs4 import BeautifulSoup, SoupStrainer, Tag
 from datetime import datetime
 from fastapi import HTTPException
 
+from core.config import settings
+from core.http_client import get_http_client
+
+# 내장 파서 (컨테이너만 파싱하므로 별도 C 파서 의존성 없이 사용)
+HTML_PARSER = "html.parser"
+
 # ✅ 더 이상 api.v1.news.NewsItem 불러오지 않음 (순환참조 방지)
 # 서비스 계층에서는 dict만 다루고, 스키마 변환은 라우터에서
 # from schemas.news import NewsItem   # ❌ 빼기
 
+# ==============================
+# 네이버 뉴스 섹션 URL
+# ==============================
+NAVER_NEWS_SECTIONS = {
+    "politics": "https://news.naver.com/section/100",
+    "economy": "https://news.naver.com/section/101",
+    "society": "https://news.naver.com/section/102",
+    "life_culture": "https://news.naver.com/section/103",
+    "world": "https://news.naver.com/section/104",
+    "it_science": "https://news.naver.com/section/105",
+}
+
 # ==============================
 # 기사 목록 추출 (섹션 뉴스)
 # ==============================
@@ -20,6 +39,15 @@ ARTICLE_SELECTORS = [
 ]
 
 
+# 기사 목록을 감싸는 컨테이너 (ARTICLE_SELECTORS 앞 3개의 상위 요소)
+# 이 부분만 트리로 만들어 트리 크기와 셀렉터 탐색 범위를 줄임 (토큰화 비용은 html.parser 그대로)
+ARTICLE_CONTAINER_STRAINER = SoupStrainer(class_=["sa_list", "list_body", "newsnow_wrap"])
+
+# 파싱 전용 스레드 풀 (이벤트 루프 블로킹 방지, 동시 파싱 수 제한)
+# lifespan에서 생성 / 종료 (재시작 시 새로 생성)
+_parse_executor: Optional[ThreadPoolExecutor] = None
+
+
 def extract_articles(soup: BeautifulSoup, limit: int) -> List[Tag]:
     """네이버 뉴스 기사 태그들을 추출하는 범용 함수"""
     for selector in ARTICLE_SELECTORS:
@@ -77,21 +105,53 @@ async def scrape_naver_news(section_url: str, limit: int = 6) -> List[dict]:
     """네이버 뉴스 목록 스크래핑"""
     headers = {"User-Agent": "Mozilla/5.0"}
     try:
-        async with httpx.AsyncClient(timeout=15) as client:
-            response = await client.get(section_url, headers=headers)
-            response.raise_for_status()
+        response = await get_http_client("naver").get(section_url, headers=headers)
+        response.raise_for_status()
+
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(_get_parse_executor(), parse_news_html, response.text, limit)
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"뉴스 스크래핑 실패: {str(e)}")
 
-        soup = BeautifulSoup(response.text, "html.parser")
+
+def parse_news_html(html: str, limit: int = 6) -> List[dict]:
+    """
+    섹션 HTML → 기사 dict 목록 (동기 함수, 스레드 풀에서 실행)
+    - 먼저 기사 컨테이너만 파싱하고, 못 찾으면 전체 페이지로 다시 시도
+    """
+    soup = BeautifulSoup(html, HTML_PARSER, parse_only=ARTICLE_CONTAINER_STRAINER)
+    articles = extract_articles(soup, limit)
+    if not articles:
+        soup = BeautifulSoup(html, HTML_PARSER)
         articles = extract_articles(soup, limit)
 
-        news_items: List[dict] = []
-        for article in articles:
-            if len(news_items) >= limit:
-                break
-            parsed = parse_article(article)
-            if parsed:
-                news_items.append(parsed)
+    news_items: List[dict] = []
+    for article in articles:
+        if len(news_items) >= limit:
+            break
+        parsed = parse_article(article)
+        if parsed:
+            news_items.append(parsed)
 
-        return news_items
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=f"뉴스 스크래핑 실패: {str(e)}")
+    return news_items
+
+
+def _get_parse_executor() -> ThreadPoolExecutor:
+    # lifespan 밖(스크립트 / 테스트)에서 호출돼도 동작하도록 없으면 생성
+    global _parse_executor
+    if _parse_executor is None:
+        _parse_executor = ThreadPoolExecutor(
+            max_workers=settings.NEWS_PARSE_WORKERS, thread_name_prefix="news-parse"
+        )
+    return _parse_executor
+
+
+def init_parse_executor() -> None:
+    _get_parse_executor()
+
+
+def shutdown_parse_executor() -> None:
+    global _parse_executor
+    if _parse_executor is not None:
+        _parse_executor.shutdown(wait=False, cancel_futures=True)
+        _parse_executor = None
@@ -0,0 +1,107 @@
+import asyncio
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Callable, TypeVar
+
+from fastapi import HTTPException
+from passlib.hash import bcrypt
+
+from core.config import settings
+
+T = TypeVar("T")
+
+
+class PasswordHasher:
+    """
+    bcrypt 해싱/검증을 전용 스레드 풀에서 실행 (이벤트 루프 블로킹 방지).
+    - 대기 + 실행 중 작업 수를 max_pending으로 제한 (초과 시 잠시 대기 후 503)
+    - 자리는 스레드 작업이 끝날 때 반납 (요청이 끊겨도 실행 중인 작업 수는 제한 안에 있음)
+    - 큐 깊이 / 처리량 / 대기 시간 지표 제공
+    """
+
+    def __init__(self, workers: int, max_pending: int, acquire_timeout: float, rounds: int):
+        self._executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="bcrypt")
+        self._slots = asyncio.Semaphore(max_pending)
+        self._workers = workers
+        self._max_pending = max_pending
+        self._acquire_timeout = acquire_timeout
+        self._bcrypt = bcrypt.using(rounds=rounds)
+
+        self._pending = 0
+        self._running = 0
+        self._completed = 0
+        self._rejected = 0
+        self._max_wait = 0.0
+        self._total_wait = 0.0
+
+    async def _run(self, func: Callable[..., T], *args: Any) -> T:
+        try:
+            await asyncio.wait_for(self._slots.acquire(), timeout=self._acquire_timeout)
+        except asyncio.TimeoutError:
+            self._rejected += 1
+            raise HTTPException(status_code=503, detail="SERVER_BUSY")
+
+        self._pending += 1
+        queued_at = time.perf_counter()
+        loop = asyncio.get_running_loop()
+
+        def _job() -> T:
+            wait = time.perf_counter() - queued_at
+            self._total_wait += wait
+            self._max_wait = max(self._max_wait, wait)
+            self._running += 1
+            try:
+                return func(*args)
+            finally:
+                self._running -= 1
+
+        def _done(future: "Future[T]") -> None:
+            # 자리 반납은 작업이 실제로 끝났을 때 (요청이 취소되어도 스레드의 bcrypt는 계속 돌기 때문)
+            try:
+                loop.call_soon_threadsafe(self._release, not future.cancelled())
+            except RuntimeError:
+                pass  # 종료 중 (루프가 이미 닫힘)
+
+        try:
+            future = self._executor.submit(_job)
+        except RuntimeError:
+            self._release(completed=False)  # 종료 후 제출 (executor shutdown)
+            raise
+        future.add_done_callback(_done)
+        return await asyncio.wrap_future(future)
+
+    def _release(self, completed: bool) -> None:
+        self._pending -= 1
+        if completed:
+            self._completed += 1
+        self._slots.release()
+
+    async def hash(self, password: str) -> str:
+        return await self._run(self._bcrypt.hash, password)
+
+    async def verify(self, password: str, password_hash: str) -> bool:
+        return await self._run(self._bcrypt.verify, password, password_hash)
+
+    def metrics(self) -> dict[str, Any]:
+        return {
+            "workers": self._workers,
+            "max_pending": self._max_pending,
+            "pending": self._pending,
+            "running": self._running,
+            "queue_depth": max(self._pending - self._running, 0),
+            "completed": self._completed,
+            "rejected": self._rejected,
+            "avg_wait_ms": round(self._total_wait / self._completed * 1000, 2) if self._completed else 0.0,
+            "max_wait_ms": round(self._max_wait * 1000, 2),
+        }
+
+    def shutdown(self) -> None:
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+
+password_hasher = PasswordHasher(
+    workers=settings.PASSWORD_HASH_WORKERS,
+    max_pending=settings.PASSWORD_HASH_MAX_PENDING,
+    acquire_timeout=settings.PASSWORD_HASH_ACQUIRE_TIMEOUT,
+    rounds=settings.BCRYPT_ROUNDS,
+)
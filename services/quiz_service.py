@@ -0,0 +1,101 @@
+import os
+import random
+from dataclasses import dataclass
+from typing import Any, Optional
+
+import pandas as pd
+
+#  환경변수에서 엑셀 경로 불러오기 (없으면 기본값 quiz.xlsx)
+EXCEL_FILE = os.getenv("QUIZ_FILE", "quiz.xlsx")
+
+
+@dataclass(frozen=True, slots=True)
+class Quiz:
+    """퀴즈 1문항 (엑셀 한 행)"""
+    id: int
+    question: Any
+    options: tuple[Any, ...]
+    answer: Any
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "id": self.id,
+            "question": self.question,
+            "options": list(self.options),
+            "answer": self.answer,
+        }
+
+
+def _cell(value: Any) -> Any:
+    """pandas 셀 값 → 파이썬 기본 타입 (NaN → None)"""
+    if value is None or pd.isna(value):
+        return None
+    if hasattr(value, "item"):  # numpy 스칼라
+        return value.item()
+    return value
+
+
+def _to_quiz(row: dict[str, Any]) -> Quiz:
+    options = tuple(
+        option
+        for option in (_cell(row.get(f"option{i}")) for i in range(1, 5))
+        if option not in (None, "", " ")
+    )
+    raw_id = _cell(row.get("id"))
+    return Quiz(
+        id=int(raw_id) if raw_id is not None else 0,
+        question=_cell(row.get("question")),
+        options=options,
+        answer=_cell(row.get("answer")),
+    )
+
+
+class QuizBank:
+    """
+    엑셀 퀴즈를 메모리에 한 번만 올려두고 재사용하는 저장소.
+    - 파일 mtime이 바뀌면 다음 조회 때 자동으로 다시 읽음
+    - 랜덤 조회는 tuple 인덱싱이라 O(1)
+    """
+
+    def __init__(self, path: str = EXCEL_FILE):
+        self.path = path
+        self._quizzes: tuple[Quiz, ...] = ()
+        self._mtime: Optional[float] = None
+
+    def _read(self) -> tuple[Quiz, ...]:
+        df = pd.read_excel(self.path)
+        return tuple(_to_quiz(row) for row in df.to_dict(orient="records"))
+
+    def load(self) -> tuple[Quiz, ...]:
+        """엑셀 전체를 읽어 메모리에 적재"""
+        mtime = os.stat(self.path).st_mtime
+        self._quizzes = self._read()
+        self._mtime = mtime
+        return self._quizzes
+
+    def reload_if_changed(self) -> tuple[Quiz, ...]:
+        """
+        파일이 바뀌었거나 아직 안 읽었으면 다시 적재.
+        - 파일 삭제 / 교체 도중 등 실패 시 직전 데이터 유지 (적재된 데이터가 없으면 예외)
+        - 실패한 파일의 mtime도 기록 → 파일이 다시 바뀔 때까지 매 요청마다 다시 읽지 않음
+        """
+        try:
+            mtime = os.stat(self.path).st_mtime
+            if mtime == self._mtime:
+                return self._quizzes
+            self._mtime = mtime
+            self._quizzes = self._read()
+        except Exception as e:
+            if not self._quizzes:
+                raise
+            print(f"⚠️ 퀴즈 다시 읽기 실패, 직전 데이터 유지 ({self.path}): {e}")
+        return self._quizzes
+
+    def random_quiz(self) -> Optional[Quiz]:
+        quizzes = self.reload_if_changed()
+        if not quizzes:
+            return None
+        return random.choice(quizzes)
+
+
+quiz_bank = QuizBank()
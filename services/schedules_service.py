@@ -1,5 +1,5 @@
 from datetime import datetime, timedelta, timezone
-from typing import List, Optional, Any
+from typing import List, Optional, Any, Tuple
 
 from repositories.schedules_repo import ScheduleRepository
 from schemas.schedules import ScheduleOut
@@ -59,8 +59,12 @@ class ScheduleService:
     # 🧩 3️⃣ Read (사용자별 일정 목록)
     # ==========================================================
     @staticmethod
-    async def get_schedules_by_user(user_id: int) -> List[ScheduleOut]:
-        schedules = await ScheduleRepository.get_schedules_by_user(user_id)
+    async def get_schedules_by_user(
+        user_id: int,
+        limit: int,
+        after: Optional[Tuple[datetime, int]] = None,
+    ) -> Tuple[List[ScheduleOut], Optional[str]]:
+        schedules, next_cursor = await ScheduleRepository.get_schedules_by_user(user_id, limit, after)
 
         # ✅ 전체 일정 UTC → KST 변환 후 반환
         for s in schedules:
@@ -69,13 +73,27 @@ class ScheduleService:
             if s.end_time:
                 s.end_time = s.end_time.astimezone(KST)
 
-        return [ScheduleOut.model_validate(s, from_attributes=True) for s in schedules]
+        return [ScheduleOut.model_validate(s, from_attributes=True) for s in schedules], next_cursor
+
+    @staticmethod
+    async def count_schedules_by_user(user_id: int) -> int:
+        return await ScheduleRepository.count_schedules_by_user(user_id)
+
+    @staticmethod
+    async def invalidate_count(user_id: int) -> None:
+        await ScheduleRepository.invalidate_count(user_id)
 
     # ==========================================================
     # 🧩 4️⃣ Update
     # ==========================================================
     @staticmethod
-    async def update_schedule(schedule_id: int, **kwargs: Any) -> Optional[ScheduleOut]:
+    async def update_schedule(
+        schedule_id: int, user_id: int, **kwargs: Any
+    ) -> Tuple[Optional[int], Optional[ScheduleOut]]:
+        """
+        본인 일정 수정 → (소유자 id, 수정된 일정)
+        - 소유자 None → 없음(404), 일정 None → 다른 사용자 것(403)
+        """
         start_time = kwargs.get("start_time")
         end_time = kwargs.get("end_time")
 
@@ -90,27 +108,29 @@ class ScheduleService:
                 end_time = end_time.replace(tzinfo=KST)
             kwargs["end_time"] = end_time.astimezone(timezone.utc)
 
-        updated = await ScheduleRepository.update_schedule(schedule_id, **kwargs)
+        owner_id, updated = await ScheduleRepository.update_schedule(schedule_id, user_id, **kwargs)
         if not updated:
-            return None
+            return owner_id, None
 
         # ✅ UTC → KST 변환 후 반환
-        updated.start_time = updated.start_time.astimezone(KST)
-        updated.end_time = updated.end_time.astimezone(KST)
+        updated["start_time"] = updated["start_time"].astimezone(KST)
+        updated["end_time"] = updated["end_time"].astimezone(KST)
 
-        return ScheduleOut.model_validate(updated, from_attributes=True)
+        return owner_id, ScheduleOut.model_validate(updated)
 
     # ==========================================================
     # 🧩 5️⃣ Delete (soft/hard 분기)
     # ==========================================================
     @staticmethod
-    async def delete_schedule(schedule_id: int, hard: bool = False) -> bool:
+    async def delete_schedule(schedule_id: int, user_id: int, hard: bool = False) -> Tuple[Optional[int], bool]:
         """
-        삭제 기능 (soft/hard 분기)
+        본인 일정 삭제 (soft/hard 분기) → (소유자 id, 삭제 여부)
         - hard=False → Soft Delete (deleted_at 기록)
         - hard=True  → Hard Delete (DB에서 완전 삭제)
+        - 소유자 None → 없음(404), 삭제 안 됨 → 다른 사용자 것(403)
         """
         if hard:
-            deleted_count = await ScheduleRepository.hard_delete_schedule(schedule_id)
-            return deleted_count > 0
-        return await ScheduleRepository.delete_schedule(schedule_id)
+            owner_id, row = await ScheduleRepository.hard_delete_schedule(schedule_id, user_id)
+        else:
+            owner_id, row = await ScheduleRepository.delete_schedule(schedule_id, user_id)
+        return owner_id, row is not None
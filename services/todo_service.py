@@ -1,6 +1,7 @@
-from typing import List, Optional, Any
+from datetime import datetime
+from typing import Dict, List, Optional, Any, Tuple
 from repositories.todos_repo import TodosRepository
-from schemas.todos import TodoOut
+from schemas.todos import TodoBatchItemResult, TodoBatchOperation, TodoOut
 from models.todo import Todo
 
 
@@ -37,31 +38,133 @@ class TodoService:
         return TodoOut.model_validate(todo, from_attributes=True)
 
     @staticmethod
-    async def get_todos_by_user(user_id: int) -> List[TodoOut]:
-        todos = await TodosRepository.get_todos_by_user(user_id)
-        return [TodoOut.model_validate(t, from_attributes=True) for t in todos]
+    async def get_todos_by_user(
+        user_id: int,
+        limit: int,
+        after: Optional[Tuple[datetime, int]] = None,
+    ) -> Tuple[List[TodoOut], Optional[str]]:
+        todos, next_cursor = await TodosRepository.get_todos_by_user(user_id, limit, after)
+        return [TodoOut.model_validate(t, from_attributes=True) for t in todos], next_cursor
+
+    @staticmethod
+    async def count_todos_by_user(user_id: int) -> int:
+        return await TodosRepository.count_todos_by_user(user_id)
+
+    @staticmethod
+    async def invalidate_count(user_id: int) -> None:
+        await TodosRepository.invalidate_count(user_id)
 
     # --------------------
     # UPDATE
     # --------------------
     @staticmethod
-    async def update_todo(todo_id: int, **kwargs: Any) -> Optional[TodoOut]:
-        updated = await TodosRepository.update_todo(todo_id, **kwargs)
-        if not updated:
-            return None
-        return TodoOut.model_validate(updated, from_attributes=True)
+    async def update_todo(todo_id: int, user_id: int, **kwargs: Any) -> Tuple[Optional[int], Optional[TodoOut]]:
+        """
+        본인 Todo 수정 → (소유자 id, 수정된 Todo)
+        - 소유자 None → 없음(404), Todo None → 다른 사용자 것(403)
+        """
+        owner_id, row = await TodosRepository.update_todo(todo_id, user_id, **kwargs)
+        return owner_id, TodoOut.model_validate(row) if row else None
+
+    # --------------------
+    # BATCH (생성 / 수정 / 완료 / 삭제 혼합, 한 트랜잭션)
+    # --------------------
+    @staticmethod
+    async def apply_batch(user_id: int, operations: List[TodoBatchOperation]) -> List[TodoBatchItemResult]:
+        """
+        요청을 종류별로 모아 종류마다 SQL 1문장으로 반영하고, 요청 순서대로 결과 반환
+        - 같은 id에 대한 두 번째 이후 작업은 DUPLICATE_TODO_ID로 실패 처리
+        - 반영되지 않은 id만 한 번 더 조회해 TODO_NOT_FOUND / NOT_ALLOWED 구분
+        """
+        results: List[Optional[TodoBatchItemResult]] = [None] * len(operations)
+
+        def done(index: int, todo_id: Optional[int] = None, row: Optional[dict] = None,
+                 error: Optional[str] = None) -> None:
+            results[index] = TodoBatchItemResult(
+                index=index,
+                op=operations[index].op,
+                success=error is None,
+                id=todo_id,
+                todo=TodoOut.model_validate(row) if row else None,
+                error=error,
+            )
+
+        creates: List[Dict[str, Any]] = []
+        create_indexes: List[int] = []
+        updates: List[Dict[str, Any]] = []
+        targets: Dict[str, Dict[int, int]] = {"update": {}, "complete": {}, "delete": {}, "hard_delete": {}}
+
+        for index, operation in enumerate(operations):
+            if operation.op == "create":
+                if not operation.title:
+                    done(index, error="TITLE_REQUIRED")
+                    continue
+                creates.append(operation.model_dump(include={"title", "description", "is_completed"}))
+                create_indexes.append(index)
+                continue
+
+            todo_id = operation.id
+            if todo_id is None:
+                done(index, error="ID_REQUIRED")
+                continue
+            if any(todo_id in ids for ids in targets.values()):
+                done(index, todo_id, error="DUPLICATE_TODO_ID")
+                continue
+
+            kind = "hard_delete" if operation.op == "delete" and operation.hard else operation.op
+            targets[kind][todo_id] = index
+            if kind == "update":
+                updates.append(operation.model_dump(include={"id", "title", "description", "is_completed"}))
+
+        applied = await TodosRepository.apply_batch(
+            user_id,
+            creates,
+            updates,
+            list(targets["complete"]),
+            list(targets["delete"]),
+            list(targets["hard_delete"]),
+        )
+
+        for index, row in zip(create_indexes, applied["created"]):
+            done(index, row["id"], row)
+
+        missing: List[int] = []
+        for kind, rows in (("update", applied["updated"]), ("complete", applied["completed"])):
+            for todo_id, index in targets[kind].items():
+                if todo_id in rows:
+                    done(index, todo_id, rows[todo_id])
+                else:
+                    missing.append(todo_id)
+        for kind in ("delete", "hard_delete"):
+            for todo_id, index in targets[kind].items():
+                if todo_id in applied["deleted"]:
+                    done(index, todo_id)
+                else:
+                    missing.append(todo_id)
+
+        if missing:
+            owners = await TodosRepository.get_owners(missing)
+            for todo_id in missing:
+                index = next(ids[todo_id] for ids in targets.values() if todo_id in ids)
+                owner = owners.get(todo_id)
+                error = "NOT_ALLOWED" if owner is not None and owner != user_id else "TODO_NOT_FOUND"
+                done(index, todo_id, error=error)
+
+        return [r for r in results if r is not None]
 
     # --------------------
     # DELETE (soft/hard 분기)
     # --------------------
     @staticmethod
-    async def delete_todo(todo_id: int, hard: bool = False) -> bool:
+    async def delete_todo(todo_id: int, user_id: int, hard: bool = False) -> Tuple[Optional[int], bool]:
         """
-        삭제 기능 (soft/hard 분기)
+        본인 Todo 삭제 (soft/hard 분기) → (소유자 id, 삭제 여부)
         - hard=False → Soft Delete (deleted_at 기록)
         - hard=True  → Hard Delete (DB에서 완전 삭제)
+        - 소유자 None → 없음(404), 삭제 안 됨 → 다른 사용자 것(403)
         """
         if hard:
-            deleted_count = await TodosRepository.hard_delete_todo(todo_id)
-            return deleted_count > 0
-        return await TodosRepository.delete_todo(todo_id)
+            owner_id, row = await TodosRepository.hard_delete_todo(todo_id, user_id)
+        else:
+            owner_id, row = await TodosRepository.delete_todo(todo_id, user_id)
+        return owner_id, row is not None
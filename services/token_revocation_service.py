@@ -0,0 +1,263 @@
+import asyncio
+import time
+from datetime import datetime, timedelta, timezone
+from typing import Any, Optional, Set
+
+from core.bloom import BloomFilter
+from core.config import settings
+from core.redis_client import redis_client
+from repositories.token_revocations_repo import TokenRevocationsRepository
+
+REVOKED_KEY = "token:revoked:{jti}"          # 토큰별 키 (TTL = 토큰 남은 수명)
+REVOKED_INDEX_KEY = "token:revoked:index"    # jti → 만료 시각(score), Bloom filter 재구성용
+REVOKED_CHANNEL = "token:revoked"            # 다른 워커에 즉시 전파
+
+
+class TokenRevocationStore:
+    """
+    로그아웃 등으로 무효화된 토큰(jti) 저장소.
+    - 원본: Redis (토큰 남은 수명만큼 TTL), Postgres는 감사 기록용
+    - 요청 경로: 워커 내부 Bloom filter가 "확실히 무효화되지 않음"을 바로 판정
+      → 걸린 경우에만 Redis 확인 (Redis 장애 시 Postgres)
+    - Bloom filter는 pub/sub로 즉시 갱신, 주기적으로 Redis 인덱스에서 재구성
+      (동기화 전이거나 구독이 끊긴 동안에는 Bloom filter를 믿지 않고 Redis 확인)
+    """
+
+    def __init__(self) -> None:
+        self._bloom = self._new_bloom()
+        self._synced = False
+        self._rebuilding: Optional[Set[str]] = None
+        self._tasks: list[asyncio.Task] = []
+
+        self._bloom_negatives = 0
+        self._remote_checks = 0
+        self._false_positives = 0
+
+    @staticmethod
+    def _new_bloom() -> BloomFilter:
+        return BloomFilter(
+            capacity=settings.TOKEN_REVOCATION_BLOOM_CAPACITY,
+            error_rate=settings.TOKEN_REVOCATION_BLOOM_ERROR_RATE,
+        )
+
+    def _remember(self, jti: str) -> None:
+        self._bloom.add(jti)
+        if self._rebuilding is not None:
+            self._rebuilding.add(jti)
+
+    # --------------------
+    # 무효화 등록
+    # --------------------
+    async def revoke(
+        self, jti: str, user_id: int, expires_at: datetime, reason: Optional[str] = None
+    ) -> None:
+        ttl = int(expires_at.timestamp() - time.time())
+        if ttl <= 0:
+            return  # 이미 만료된 토큰은 기록할 필요 없음
+
+        self._remember(jti)
+
+        async def _write_redis() -> None:
+            try:
+                async with redis_client.pipeline(transaction=False) as pipe:
+                    pipe.set(REVOKED_KEY.format(jti=jti), str(user_id), ex=ttl)
+                    pipe.zadd(REVOKED_INDEX_KEY, {jti: expires_at.timestamp()})
+                    pipe.publish(REVOKED_CHANNEL, jti)
+                    await pipe.execute()
+            except Exception as e:
+                print(f"⚠️ 토큰 무효화 Redis 저장 실패: {e}")
+
+        # Redis 저장과 감사 기록(INSERT ... ON CONFLICT DO NOTHING 1회)을 동시에
+        await asyncio.gather(
+            _write_redis(),
+            TokenRevocationsRepository.revoke_token(jti, user_id, expires_at, reason),
+        )
+
+    # --------------------
+    # 조회 (요청 경로)
+    # --------------------
+    async def is_revoked(self, jti: str) -> bool:
+        if self._synced and jti not in self._bloom:
+            self._bloom_negatives += 1
+            return False
+
+        self._remote_checks += 1
+        try:
+            revoked = bool(await redis_client.exists(REVOKED_KEY.format(jti=jti)))
+        except Exception as e:
+            print(f"⚠️ 토큰 무효화 Redis 조회 실패: {e}")
+            revoked = await TokenRevocationsRepository.is_token_revoked(jti)
+
+        if not revoked and self._synced:
+            self._false_positives += 1
+        return revoked
+
+    # --------------------
+    # Bloom filter 동기화 (lifespan)
+    # --------------------
+    async def rebuild(self) -> None:
+        """Redis 인덱스에서 만료되지 않은 jti로 Bloom filter 재구성 (만료분 제거 효과)"""
+        self._rebuilding = set()
+        try:
+            now = time.time()
+            await redis_client.zremrangebyscore(REVOKED_INDEX_KEY, "-inf", now)
+            jtis = await redis_client.zrangebyscore(REVOKED_INDEX_KEY, now, "+inf")
+
+            bloom = self._new_bloom()
+            for jti in jtis:
+                bloom.add(jti)
+            # 재구성 도중 들어온 무효화도 빠뜨리지 않도록 반영
+            for jti in self._rebuilding:
+                bloom.add(jti)
+
+            self._bloom = bloom
+            self._synced = True
+        except Exception as e:
+            print(f"⚠️ 토큰 무효화 Bloom filter 재구성 실패: {e}")
+        finally:
+            self._rebuilding = None
+
+    async def _sync_loop(self) -> None:
+        # 첫 재구성은 구독 직후 _listen_loop에서 수행
+        while True:
+            await asyncio.sleep(settings.TOKEN_REVOCATION_RESYNC_INTERVAL)
+            await self.rebuild()
+
+    async def _listen_loop(self) -> None:
+        while True:
+            pubsub = redis_client.pubsub()
+            try:
+                await pubsub.subscribe(REVOKED_CHANNEL)
+                # 구독 전에 놓친 무효화가 있을 수 있으므로 다시 맞춤
+                await self.rebuild()
+                async for message in pubsub.listen():
+                    if message.get("type") == "message":
+                        self._remember(str(message["data"]))
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                print(f"⚠️ 토큰 무효화 구독 끊김: {e}")
+                self._synced = False
+                await asyncio.sleep(1)
+            finally:
+                try:
+                    await pubsub.aclose()
+                except Exception:
+                    pass
+
+    def metrics(self) -> dict[str, Any]:
+        return {
+            "synced": self._synced,
+            "bloom_entries": len(self._bloom),
+            "bloom_negatives": self._bloom_negatives,
+            "remote_checks": self._remote_checks,
+            "false_positives": self._false_positives,
+        }
+
+    def start(self) -> None:
+        if not self._tasks:
+            self._tasks = [
+                asyncio.create_task(self._listen_loop()),
+                asyncio.create_task(self._sync_loop()),
+            ]
+
+    async def stop(self) -> None:
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks = []
+        self._synced = False
+
+
+class TokenRevocationPurger:
+    """
+    만료된 token_revocations 행을 주기적으로 삭제 (테이블 / jti 인덱스가 무한히 커지지 않도록).
+    - 한 번에 PURGE_BATCH건씩 나눠 삭제해 긴 락 / 큰 트랜잭션 방지
+    - 워커 중 하나만 Redis 락을 잡고 실행
+    """
+
+    LOCK_KEY = "token:revocations:purge:lock"
+
+    def __init__(self) -> None:
+        self._task: Optional[asyncio.Task] = None
+        self.last_run_at: Optional[datetime] = None
+        self.last_deleted = 0
+        # 테이블 크기 조회는 DB 쿼리라 TOKEN_REVOCATION_STATS_TTL초 동안 재사용
+        self._table_stats: dict[str, Any] = {}
+        self._table_stats_at: Optional[float] = None
+
+    async def run(self) -> int:
+        """만료 기록 전체 정리, 삭제 건수 반환"""
+        batch = settings.TOKEN_REVOCATION_PURGE_BATCH
+        now = datetime.now(timezone.utc)
+        legacy_cutoff = now - timedelta(days=settings.REFRESH_TOKEN_EXPIRE_DAYS)
+        total = 0
+
+        for purge, cutoff in (
+            (TokenRevocationsRepository.purge_expired, now),
+            (TokenRevocationsRepository.purge_legacy, legacy_cutoff),
+        ):
+            while True:
+                deleted = await purge(cutoff, batch)
+                total += deleted
+                if deleted < batch:
+                    break
+                await asyncio.sleep(0)  # 배치 사이에 다른 요청 처리
+
+        self.last_run_at = now
+        self.last_deleted = total
+        if total:
+            print(f"🧹 만료된 토큰 무효화 기록 {total}건 삭제")
+        return total
+
+    async def _loop(self) -> None:
+        while True:
+            try:
+                acquired = await redis_client.set(
+                    self.LOCK_KEY, "1", nx=True,
+                    ex=max(settings.TOKEN_REVOCATION_PURGE_INTERVAL - 5, 1),
+                )
+            except Exception as e:
+                print(f"⚠️ 토큰 무효화 정리 락 실패: {e}")
+                acquired = False
+
+            if acquired:
+                try:
+                    await self.run()
+                except Exception as e:
+                    print(f"⚠️ 토큰 무효화 정리 실패: {e}")
+
+            await asyncio.sleep(settings.TOKEN_REVOCATION_PURGE_INTERVAL)
+
+    async def _cached_table_stats(self) -> dict[str, Any]:
+        now = time.monotonic()
+        if self._table_stats_at is not None and now - self._table_stats_at < settings.TOKEN_REVOCATION_STATS_TTL:
+            return self._table_stats
+        # 실패해도 TTL 동안은 다시 조회하지 않음 (직전 값 유지)
+        self._table_stats_at = now
+        try:
+            self._table_stats = await TokenRevocationsRepository.table_stats()
+        except Exception as e:
+            print(f"⚠️ token_revocations 크기 조회 실패: {e}")
+        return self._table_stats
+
+    async def metrics(self) -> dict[str, Any]:
+        return {
+            **await self._cached_table_stats(),
+            "last_purge_at": self.last_run_at.isoformat() if self.last_run_at else None,
+            "last_purge_deleted": self.last_deleted,
+        }
+
+    def start(self) -> None:
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._loop())
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+            self._task = None
+
+
+token_revocation_store = TokenRevocationStore()
+token_revocation_purger = TokenRevocationPurger()
@@ -1,6 +1,8 @@
-from typing import Optional, List
+from typing import Optional, List, Tuple
 from datetime import date, datetime
-from passlib.hash import bcrypt
+from services.password_service import password_hasher
+from core.principal import invalidate_user_principal
+from core.session_version import bump_session_version
 from repositories.user_repo import UserRepository
 from models.user import User
 from schemas.user import UserOut
@@ -42,9 +44,16 @@ class UserService:
         return await UserRepository.get_user_by_username(username)
 
     @staticmethod
-    async def get_all_users() -> List[User]:
-        """전체 유저 목록 (관리자 전용)"""
-        return await UserRepository.get_all_users()
+    async def get_all_users(
+        limit: int,
+        after: Optional[Tuple[datetime, int]] = None,
+    ) -> Tuple[List[dict], Optional[str]]:
+        """유저 목록 페이지 (관리자 전용)"""
+        return await UserRepository.get_all_users(limit, after)
+
+    @staticmethod
+    async def count_all_users() -> int:
+        return await UserRepository.count_all_users()
 
     # --------------------
     # UPDATE
@@ -71,7 +80,9 @@ class UserService:
         if birthday is not None:
             user.birthday = birthday
 
-        await user.save()
+        # 바꾼 컬럼만 저장 (동시에 올라간 session_version을 예전 값으로 덮지 않도록)
+        await user.save(update_fields=["username", "profile_image", "birthday", "updated_at"])
+        await invalidate_user_principal(user_id)
         return user
 
     @staticmethod
@@ -81,14 +92,16 @@ class UserService:
         new_password: str,
         new_password_check: str,
     ) -> dict[str, bool | str]:
-        if not bcrypt.verify(old_password, user.password_hash):
+        if not await password_hasher.verify(old_password, user.password_hash):
             return {"success": False, "error": "WRONG_OLD_PASSWORD"}
 
         if new_password != new_password_check:
             return {"success": False, "error": "PASSWORD_MISMATCH"}
 
-        user.password_hash = bcrypt.hash(new_password)
-        await user.save()
+        password_hash = await password_hasher.hash(new_password)
+        await UserRepository.update_password(user, password_hash)
+        await invalidate_user_principal(user.id)
+        await bump_session_version(user.id)
         return {"success": True}
     # --------------------
     # DELETE
@@ -96,7 +109,10 @@ class UserService:
     @staticmethod
     async def delete_user(user_id: int) -> bool:
         """회원 탈퇴"""
-        return await UserRepository.delete_user(user_id)
+        deleted = await UserRepository.delete_user(user_id)
+        await invalidate_user_principal(user_id)
+        await bump_session_version(user_id)
+        return deleted
 
     # ---------------------------
     # 관리자(Admin) 전용 메서드
@@ -107,7 +123,10 @@ class UserService:
         user = await User.get_or_none(id=user_id)
         if user:
             user.is_active = is_active
-            await user.save()
+            await user.save(update_fields=["is_active", "updated_at"])
+            await invalidate_user_principal(user_id)
+            if not is_active:
+                await bump_session_version(user_id)  # 비활성화 즉시 모든 세션 종료
         return user
 
     @staticmethod
@@ -1,43 +1,109 @@
-import httpx, os
+import asyncio
+import os
 from datetime import datetime
+from typing import Any, Awaitable, Callable
+
+from core.cache import TTLCache, redis_get_json, redis_set_json
+from core.config import settings
+from core.http_client import get_http_client
 
 OPENWEATHER_API_KEY = os.getenv("OPENWEATHER_API_KEY")
+BASE_URL = "https://api.openweathermap.org/data/2.5"
+
+# 워커 내부 LRU (Redis 왕복도 생략하기 위한 1차 캐시)
+_local_cache = TTLCache(maxsize=2048)
+
+
+def _grid_key(kind: str, lat: float, lon: float) -> tuple[str, float, float]:
+    """
+    좌표를 격자(WEATHER_CACHE_GRID)에 맞춰 반올림해 캐시 키 생성.
+    같은 격자 안의 사용자는 같은 캐시를 공유함 (기본 0.01도 ≈ 1km).
+    """
+    grid = settings.WEATHER_CACHE_GRID
+    grid_lat = round(round(lat / grid) * grid, 6)
+    grid_lon = round(round(lon / grid) * grid, 6)
+    return f"weather:{kind}:{grid_lat}:{grid_lon}", grid_lat, grid_lon
+
+
+async def _cached(
+    kind: str,
+    lat: float,
+    lon: float,
+    ttl: int,
+    fetch: Callable[[float, float], Awaitable[dict | None]],
+) -> dict | None:
+    """로컬 LRU → Redis → OpenWeather 순서로 조회, 성공 응답만 캐시"""
+    key, grid_lat, grid_lon = _grid_key(kind, lat, lon)
+
+    cached = _local_cache.get(key)
+    if cached is not None:
+        return dict(cached)
+
+    cached = await redis_get_json(key)
+    if cached is not None:
+        _local_cache.set(key, cached, ttl=ttl)
+        return dict(cached)
+
+    data = await fetch(grid_lat, grid_lon)
+    if data is not None:
+        _local_cache.set(key, data, ttl=ttl)
+        await redis_set_json(key, data, ttl)
+    return data
+
 
 class WeatherService:
     #  현재 날씨
     @staticmethod
     async def fetch_weather(lat: float, lon: float) -> dict | None:
-        """현재 날씨 + 최고/최저/강수량/미세먼지"""
-        base_url = "https://api.openweathermap.org/data/2.5"
-        weather_url = f"{base_url}/weather"
-        air_url = f"{base_url}/air_pollution"
-
-        async with httpx.AsyncClient(timeout=10) as client:
-            # 현재 날씨
-            res_weather = await client.get(weather_url, params={
+        """현재 날씨 + 최고/최저/강수량/미세먼지 (좌표 격자 단위 캐시)"""
+        return await _cached(
+            "current", lat, lon, settings.WEATHER_CACHE_TTL, WeatherService._request_weather
+        )
+
+    #  5일치 예보
+    @staticmethod
+    async def fetch_forecast(lat: float, lon: float) -> dict | None:
+        """5일치 (3시간 간격) 예보 + 강수량/적설량 (좌표 격자 단위 캐시)"""
+        return await _cached(
+            "forecast", lat, lon, settings.FORECAST_CACHE_TTL, WeatherService._request_forecast
+        )
+
+    @staticmethod
+    async def _request_weather(lat: float, lon: float) -> dict | None:
+        """OpenWeather 현재 날씨 + 대기오염 동시 요청"""
+        client = get_http_client("openweather")
+
+        # 현재 날씨 / 미세먼지 동시 요청
+        res_weather, res_air = await asyncio.gather(
+            client.get(f"{BASE_URL}/weather", params={
                 "lat": lat,
                 "lon": lon,
                 "appid": OPENWEATHER_API_KEY,
                 "units": "metric",
                 "lang": "kr",
-            })
-            if res_weather.status_code != 200:
-                return None
-            weather = res_weather.json()
-
-            # 미세먼지
-            res_air = await client.get(air_url, params={
+            }),
+            client.get(f"{BASE_URL}/air_pollution", params={
                 "lat": lat,
                 "lon": lon,
                 "appid": OPENWEATHER_API_KEY,
-            })
-            air_data = None
-            if res_air.status_code == 200:
-                components = res_air.json().get("list", [{}])[0].get("components", {})
-                air_data = {
-                    "pm2_5": components.get("pm2_5"),
-                    "pm10": components.get("pm10"),
-                }
+            }),
+            return_exceptions=True,
+        )
+
+        if isinstance(res_weather, BaseException):
+            raise res_weather
+        if res_weather.status_code != 200:
+            return None
+        weather: dict[str, Any] = res_weather.json()
+
+        # 미세먼지 실패는 무시 (pm 값만 None)
+        air_data = None
+        if not isinstance(res_air, BaseException) and res_air.status_code == 200:
+            components = res_air.json().get("list", [{}])[0].get("components", {})
+            air_data = {
+                "pm2_5": components.get("pm2_5"),
+                "pm10": components.get("pm10"),
+            }
 
         return {
             "city": weather.get("name"),
@@ -54,11 +120,9 @@ class WeatherService:
             "updated_at": datetime.now().isoformat(),
         }
 
-    #  5일치 예보
     @staticmethod
-    async def fetch_forecast(lat: float, lon: float) -> dict | None:
-        """5일치 (3시간 간격) 예보 + 강수량/적설량"""
-        url = "https://api.openweathermap.org/data/2.5/forecast"
+    async def _request_forecast(lat: float, lon: float) -> dict | None:
+        """OpenWeather 5일 예보 요청"""
         params = {
             "lat": lat,
             "lon": lon,
@@ -67,8 +131,7 @@ class WeatherService:
             "lang": "kr",
         }
 
-        async with httpx.AsyncClient(timeout=10) as client:
-            res = await client.get(url, params=params)
+        res = await get_http_client("openweather").get(f"{BASE_URL}/forecast", params=params)
 
         if res.status_code != 200:
             return None
@@ -0,0 +1,75 @@
+from typing import AsyncIterator
+
+import pytest
+from tortoise import Tortoise, connections
+from tortoise.backends.base.executor import EXECUTOR_CACHE
+
+from core.db import DEFAULT_DB
+from core.redis_client import redis_client
+from tests.fakes import FAKE_REDIS_COMMANDS, FakeRedis
+from tests.postgres import TEST_DATABASE_URL, manual_migrations
+
+# core.db.TORTOISE_ORM과 같은 모델 (aerich 제외)
+APP_MODELS = [
+    "models.user",
+    "models.schedules",
+    "models.todo",
+    "models.notifications",
+    "models.inquiries",
+    "models.user_locations",
+    "models.token_revocations",
+    "models.user_activity",
+]
+
+
+@pytest.fixture
+def fake_redis(monkeypatch: pytest.MonkeyPatch) -> FakeRedis:
+    """앱 전역 redis_client의 명령을 메모리 구현으로 교체"""
+    fake = FakeRedis()
+    for name in FAKE_REDIS_COMMANDS:
+        monkeypatch.setattr(redis_client, name, getattr(fake, name))
+    return fake
+
+
+async def _close_db() -> None:
+    await Tortoise.close_connections()
+    # INSERT 문 캐시 키가 커넥션 이름뿐이라 sqlite / Postgres를 오가면 다른 방언의 SQL이 재사용됨
+    EXECUTOR_CACHE.clear()
+
+
+@pytest.fixture
+async def sqlite_db() -> AsyncIterator[None]:
+    """메모리 sqlite에 전체 스키마 생성 (Postgres 전용 SQL이 없는 경로용)"""
+    await Tortoise.init(
+        config={
+            "connections": {DEFAULT_DB: "sqlite://:memory:"},
+            "apps": {"models": {"models": APP_MODELS, "default_connection": DEFAULT_DB}},
+        }
+    )
+    await Tortoise.generate_schemas()
+    yield
+    await _close_db()
+
+
+@pytest.fixture
+async def postgres_db() -> AsyncIterator[None]:
+    """
+    TEST_DATABASE_URL의 Postgres에 스키마 + 수동 마이그레이션 적용, 테스트마다 앱 테이블 비움
+    (Postgres 전용 SQL 경로용, 테스트 데이터를 쓰고 지우므로 전용 DB를 지정)
+    """
+    if not TEST_DATABASE_URL:
+        pytest.skip("TEST_DATABASE_URL 미설정")
+    await Tortoise.init(
+        config={
+            "connections": {DEFAULT_DB: TEST_DATABASE_URL},
+            "apps": {"models": {"models": APP_MODELS, "default_connection": DEFAULT_DB}},
+        }
+    )
+    await Tortoise.generate_schemas(safe=True)
+    db = connections.get(DEFAULT_DB)
+    for module in manual_migrations():
+        await module.upgrade(db)
+    tables = ", ".join(f'"{model._meta.db_table}"' for model in Tortoise.apps["models"].values())
+    await db.execute_script(f"TRUNCATE {tables} RESTART IDENTITY CASCADE;")
+    yield
+    await _close_db()
@@ -0,0 +1,166 @@
+"""테스트용 가짜 외부 의존성"""
+import time
+import uuid
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from redis.exceptions import LockNotOwnedError, ResponseError
+
+
+class FakePipeline:
+    """명령을 모아 두었다가 execute()에서 순서대로 실행 (단일 이벤트 루프라 중간에 끼어드는 명령 없음)"""
+
+    def __init__(self, redis: "FakeRedis") -> None:
+        self._redis = redis
+        self._commands: List[Tuple[Callable[..., Any], tuple, dict]] = []
+
+    def __getattr__(self, name: str) -> Callable[..., "FakePipeline"]:
+        method = getattr(self._redis, name)
+
+        def queue(*args: Any, **kwargs: Any) -> "FakePipeline":
+            self._commands.append((method, args, kwargs))
+            return self
+
+        return queue
+
+    async def execute(self) -> List[Any]:
+        commands, self._commands = self._commands, []
+        return [await method(*args, **kwargs) for method, args, kwargs in commands]
+
+    async def __aenter__(self) -> "FakePipeline":
+        return self
+
+    async def __aexit__(self, *exc: Any) -> None:
+        self._commands = []
+
+
+class FakeLock:
+    """redis-py Lock과 같은 토큰 방식 (release는 내 토큰일 때만 삭제)"""
+
+    def __init__(self, redis: "FakeRedis", name: str, timeout: Optional[float] = None) -> None:
+        self._redis = redis
+        self.name = name
+        self.timeout = timeout
+        self.token: Optional[str] = None
+
+    async def acquire(self) -> bool:
+        token = uuid.uuid4().hex
+        if await self._redis.set(self.name, token, ex=self.timeout, nx=True):
+            self.token = token
+            return True
+        return False
+
+    async def release(self) -> None:
+        token, self.token = self.token, None
+        if token is None or await self._redis.get(self.name) != token:
+            raise LockNotOwnedError("Cannot release a lock that's no longer owned")
+        await self._redis.delete(self.name)
+
+
+class FakeRedis:
+    """테스트용 메모리 Redis (앱에서 쓰는 명령만)"""
+
+    def __init__(self) -> None:
+        self.data: Dict[str, Tuple[Any, Optional[float]]] = {}
+        self.published: List[Tuple[str, Any]] = []
+
+    def _alive(self, key: str) -> bool:
+        entry = self.data.get(key)
+        if entry is None:
+            return False
+        if entry[1] is not None and entry[1] <= time.monotonic():
+            del self.data[key]
+            return False
+        return True
+
+    def _zset(self, key: str) -> Dict[str, float]:
+        if not self._alive(key):
+            self.data[key] = ({}, None)
+        value: Dict[str, float] = self.data[key][0]
+        return value
+
+    def _hash(self, key: str) -> Dict[str, str]:
+        if not self._alive(key):
+            self.data[key] = ({}, None)
+        value: Dict[str, str] = self.data[key][0]
+        return value
+
+    async def get(self, key: str) -> Any:
+        return self.data[key][0] if self._alive(key) else None
+
+    async def set(
+        self, key: str, value: Any, ex: Optional[float] = None, nx: bool = False
+    ) -> Optional[bool]:
+        if nx and self._alive(key):
+            return None
+        self.data[key] = (str(value), time.monotonic() + ex if ex else None)
+        return True
+
+    async def delete(self, *keys: str) -> int:
+        return sum(1 for key in keys if self._alive(key) and self.data.pop(key, None) is not None)
+
+    async def exists(self, *keys: str) -> int:
+        return sum(1 for key in keys if self._alive(key))
+
+    async def incr(self, key: str) -> int:
+        value = int(self.data[key][0]) + 1 if self._alive(key) else 1
+        expires = self.data[key][1] if key in self.data else None
+        self.data[key] = (str(value), expires)
+        return value
+
+    async def rename(self, src: str, dst: str) -> bool:
+        if not self._alive(src):
+            raise ResponseError("no such key")
+        self.data[dst] = self.data.pop(src)
+        return True
+
+    def lock(self, name: str, timeout: Optional[float] = None, **kwargs: Any) -> FakeLock:
+        return FakeLock(self, name, timeout)
+
+    # --------------------
+    # hash
+    # --------------------
+    async def hset(self, key: str, field: str, value: Any) -> int:
+        h = self._hash(key)
+        added = int(field not in h)
+        h[field] = str(value)
+        return added
+
+    async def hgetall(self, key: str) -> Dict[str, str]:
+        return dict(self.data[key][0]) if self._alive(key) else {}
+
+    # --------------------
+    # sorted set / pub-sub
+    # --------------------
+    async def zadd(self, key: str, mapping: Dict[str, float]) -> int:
+        zset = self._zset(key)
+        added = sum(1 for member in mapping if member not in zset)
+        zset.update({str(m): float(s) for m, s in mapping.items()})
+        return added
+
+    async def zrem(self, key: str, *members: str) -> int:
+        zset = self._zset(key)
+        return sum(1 for m in members if zset.pop(m, None) is not None)
+
+    async def zrangebyscore(self, key: str, min: Any, max: Any) -> List[str]:
+        lo, hi = float(min), float(max)
+        zset = self._zset(key)
+        return [m for m, s in sorted(zset.items(), key=lambda i: (i[1], i[0])) if lo <= s <= hi]
+
+    async def zremrangebyscore(self, key: str, min: Any, max: Any) -> int:
+        members = await self.zrangebyscore(key, min, max)
+        return await self.zrem(key, *members)
+
+    async def publish(self, channel: str, message: Any) -> int:
+        self.published.append((channel, message))
+        return 0
+
+    def pipeline(self, transaction: bool = True) -> FakePipeline:
+        return FakePipeline(self)
+
+
+# conftest의 fake_redis가 redis_client에서 교체하는 명령
+FAKE_REDIS_COMMANDS = (
+    "get", "set", "delete", "exists", "incr", "rename", "lock",
+    "hset", "hgetall",
+    "zadd", "zrem", "zrangebyscore", "zremrangebyscore", "publish", "pipeline",
+)
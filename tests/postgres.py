@@ -0,0 +1,23 @@
+"""실제 Postgres가 필요한 테스트용 (TEST_DATABASE_URL이 없으면 건너뜀)"""
+import importlib.util
+import os
+from pathlib import Path
+from types import ModuleType
+from typing import List, Optional
+
+TEST_DATABASE_URL: Optional[str] = os.getenv("TEST_DATABASE_URL")
+
+MANUAL_MIGRATIONS = Path(__file__).resolve().parent.parent / "migrations" / "manual"
+
+
+def _load(path: Path) -> ModuleType:
+    spec = importlib.util.spec_from_file_location(f"manual_migration_{path.stem}", path)
+    assert spec is not None and spec.loader is not None
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def manual_migrations() -> List[ModuleType]:
+    """migrations/manual 파일을 번호 순으로 불러옴"""
+    return [_load(path) for path in sorted(MANUAL_MIGRATIONS.glob("[0-9]*_*.py"))]
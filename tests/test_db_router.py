@@ -0,0 +1,103 @@
+"""
+읽기 라우팅 (user-018)
+replica 상태와 Redis 쓰기 마커에 따라 read_db가 primary / replica 중 어디를 고르는지
+"""
+from typing import Any, List, Tuple
+
+import pytest
+from tortoise import connections
+
+from core import db_router
+from core.config import settings
+from core.db import DEFAULT_DB, REPLICA_DB
+from core.db_router import RECENT_WRITE_KEY, ReplicaRouter, current_user_id
+from core.redis_client import redis_client
+from tests.fakes import FakeRedis
+
+
+class FakeReplica:
+    def __init__(self, lag: float) -> None:
+        self.lag = lag
+
+    async def execute_query(self, sql: str) -> Tuple[int, List[dict]]:
+        return 1, [{"lag": self.lag}]
+
+
+@pytest.fixture
+def router(monkeypatch: pytest.MonkeyPatch) -> ReplicaRouter:
+    """replica 설정 + 지연 정상 상태, 커넥션 대신 alias 문자열 반환"""
+    monkeypatch.setattr(db_router, "replica_configured", lambda: True)
+    monkeypatch.setattr(connections, "get", lambda alias: alias)
+    r = ReplicaRouter()
+    r._healthy = True
+    return r
+
+
+async def _redis_down(*args: Any, **kwargs: Any) -> None:
+    raise ConnectionError("redis down")
+
+
+async def test_reads_go_to_replica_without_recent_write(router: ReplicaRouter, fake_redis: FakeRedis) -> None:
+    assert await router.read_db(user_id=1) == REPLICA_DB
+    assert await router.read_db() == REPLICA_DB
+    assert router.metrics()["replica_reads"] == 2
+
+
+async def test_recent_write_marker_routes_to_primary(router: ReplicaRouter, fake_redis: FakeRedis) -> None:
+    await router.mark_write(1)
+
+    assert await fake_redis.exists(RECENT_WRITE_KEY.format(user_id=1))
+    assert await router.read_db(user_id=1) == DEFAULT_DB
+    # 다른 사용자는 그대로 replica
+    assert await router.read_db(user_id=2) == REPLICA_DB
+
+
+async def test_marker_uses_current_request_user(router: ReplicaRouter, fake_redis: FakeRedis) -> None:
+    await router.mark_write(7)
+
+    token = current_user_id.set(7)
+    try:
+        assert await router.read_db() == DEFAULT_DB
+    finally:
+        current_user_id.reset(token)
+    assert await router.read_db() == REPLICA_DB
+
+
+async def test_marker_expires_after_ttl(router: ReplicaRouter, fake_redis: FakeRedis) -> None:
+    await router.mark_write(1)
+    key = RECENT_WRITE_KEY.format(user_id=1)
+    value, _ = fake_redis.data[key]
+    fake_redis.data[key] = (value, 0.0)  # 만료 시각 경과
+
+    assert await router.read_db(user_id=1) == REPLICA_DB
+
+
+async def test_redis_error_falls_back_to_primary(router: ReplicaRouter, monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(redis_client, "exists", _redis_down)
+
+    assert await router.read_db(user_id=1) == DEFAULT_DB
+
+
+async def test_unhealthy_or_unconfigured_replica_uses_primary(
+    router: ReplicaRouter, fake_redis: FakeRedis, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    router._healthy = False
+    assert await router.read_db(user_id=1) == DEFAULT_DB
+
+    router._healthy = True
+    monkeypatch.setattr(db_router, "replica_configured", lambda: False)
+    assert await router.read_db(user_id=1) == DEFAULT_DB
+    assert router.metrics()["primary_reads"] == 2
+
+
+async def test_check_lag_marks_replica_unhealthy(router: ReplicaRouter, monkeypatch: pytest.MonkeyPatch) -> None:
+    replica = FakeReplica(lag=settings.DB_REPLICA_MAX_LAG + 1)
+    monkeypatch.setattr(connections, "get", lambda alias: replica if alias == REPLICA_DB else alias)
+
+    await router.check_lag()
+    assert router.metrics()["healthy"] is False
+    assert await router.read_db(user_id=1) == DEFAULT_DB
+
+    replica.lag = 0
+    await router.check_lag()
+    assert router.metrics()["healthy"] is True
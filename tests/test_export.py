@@ -0,0 +1,138 @@
+"""
+스트리밍 내보내기 (user-022)
+- NDJSON / CSV 인코딩
+- 워커당 동시 내보내기 수 제한 (초과 시 503, 커넥션을 잡기 전에 거절)
+- 다운로드가 끝나거나 클라이언트가 끊기면 행 제너레이터(커서 커넥션)와 슬롯을 바로 반환
+"""
+import asyncio
+from typing import Any, Dict, List
+
+import pytest
+from fastapi import HTTPException
+from starlette.requests import ClientDisconnect
+
+from core import export
+from core.export import Rows, export_response
+
+
+class Source:
+    """stream_values 대신 쓰는 행 제너레이터 (닫혔는지 기록)"""
+
+    def __init__(self, chunks: int, chunk_size: int = 2) -> None:
+        self.chunks = chunks
+        self.chunk_size = chunk_size
+        self.started = False
+        self.closed = False
+
+    async def rows(self) -> Rows:
+        self.started = True
+        try:
+            for c in range(self.chunks):
+                await asyncio.sleep(0)
+                yield [{"id": c * self.chunk_size + i, "name": f"이름{i}"} for i in range(self.chunk_size)]
+        finally:
+            self.closed = True
+
+
+@pytest.fixture
+def slots(monkeypatch: pytest.MonkeyPatch) -> asyncio.Semaphore:
+    semaphore = asyncio.Semaphore(1)
+    monkeypatch.setattr(export, "_export_slots", semaphore)
+    return semaphore
+
+
+async def _download(response: Any, disconnect_after: int = 0) -> List[bytes]:
+    """ASGI로 응답 실행, disconnect_after > 0이면 body를 그만큼 받은 뒤 클라이언트가 끊김"""
+    bodies: List[bytes] = []
+    got_enough = asyncio.Event()
+
+    async def receive() -> Dict[str, Any]:
+        await got_enough.wait()
+        return {"type": "http.disconnect"}
+
+    async def send(message: Dict[str, Any]) -> None:
+        if message["type"] == "http.response.body" and message["body"]:
+            bodies.append(message["body"])
+            if disconnect_after and len(bodies) >= disconnect_after:
+                got_enough.set()
+                await asyncio.sleep(1)  # 느린 클라이언트: 전송 도중 끊김
+
+    await response({"type": "http", "asgi": {"spec_version": "2.3"}}, receive, send)
+    got_enough.set()
+    return bodies
+
+
+async def test_ndjson_download_closes_rows_and_frees_slot(slots: asyncio.Semaphore) -> None:
+    source = Source(chunks=3)
+
+    response = await export_response(source.rows(), ("id", "name"), "ndjson", "users")
+    assert response.headers["content-disposition"] == 'attachment; filename="users.ndjson"'
+    bodies = await _download(response)
+
+    lines = b"".join(bodies).decode().splitlines()
+    assert len(lines) == 6
+    assert lines[0] == '{"id": 0, "name": "이름0"}'
+    assert source.closed
+    assert not slots.locked()
+
+
+async def test_csv_has_bom_and_header(slots: asyncio.Semaphore) -> None:
+    response = await export_response(Source(chunks=1).rows(), ("id", "name"), "csv", "users")
+
+    text = b"".join(await _download(response)).decode()
+
+    assert text.startswith("\ufeffid,name\r\n0,이름0\r\n")
+
+
+async def test_second_export_is_rejected_while_slot_is_held(slots: asyncio.Semaphore) -> None:
+    first = await export_response(Source(chunks=3).rows(), ("id",), "ndjson", "a")
+    second = Source(chunks=3)
+
+    with pytest.raises(HTTPException) as exc:
+        await export_response(second.rows(), ("id",), "ndjson", "b")
+    assert exc.value.status_code == 503
+    assert exc.value.detail == "EXPORT_BUSY"
+    assert not second.started  # 커넥션을 잡기 전에 거절
+
+    await _download(first)
+    again = await export_response(Source(chunks=1).rows(), ("id",), "ndjson", "c")
+    await _download(again)
+
+
+async def test_client_disconnect_closes_rows(slots: asyncio.Semaphore) -> None:
+    source = Source(chunks=1000)
+
+    response = await export_response(source.rows(), ("id",), "ndjson", "users")
+    bodies = await _download(response, disconnect_after=2)
+
+    assert len(bodies) < 1000
+    assert source.closed
+    assert not slots.locked()
+
+
+async def test_response_never_sent_still_frees_slot(slots: asyncio.Semaphore) -> None:
+    source = Source(chunks=3)
+    response = await export_response(source.rows(), ("id",), "ndjson", "users")
+
+    async def receive() -> Dict[str, Any]:
+        return {"type": "http.disconnect"}
+
+    async def send(message: Dict[str, Any]) -> None:
+        raise OSError("client gone")
+
+    with pytest.raises(ClientDisconnect):
+        await response({"type": "http", "asgi": {"spec_version": "2.4"}}, receive, send)
+
+    assert source.closed
+    assert not slots.locked()
+
+
+async def test_failure_before_first_chunk_frees_slot(slots: asyncio.Semaphore) -> None:
+    async def failing_rows() -> Rows:
+        raise ConnectionError("db down")
+        yield []
+
+    with pytest.raises(ConnectionError):
+        await export_response(failing_rows(), ("id",), "ndjson", "users")
+
+    assert not slots.locked()
@@ -0,0 +1,151 @@
+"""
+Gemini 스트리밍 (user-007)
+httpx MockTransport로 streamGenerateContent(SSE) 응답을 흉내 내서 확인
+"""
+import asyncio
+import json
+from typing import AsyncIterator, Callable, List
+
+import httpx
+import pytest
+from fastapi import HTTPException
+
+from api.v1.gemini import GeminiJob, _stream_job
+from core import http_client
+from core.config import settings
+from services.gemini_client import gemini_stream, prompt_fingerprint
+from tests.fakes import FakeRedis
+
+
+def _sse_chunk(text: str) -> bytes:
+    payload = {"candidates": [{"content": {"parts": [{"text": text}], "role": "model"}}]}
+    return f"data: {json.dumps(payload, ensure_ascii=False)}\r\n\r\n".encode()
+
+
+@pytest.fixture
+def gemini_stub(monkeypatch: pytest.MonkeyPatch) -> Callable[[httpx.MockTransport], None]:
+    """gemini 공용 클라이언트를 MockTransport 클라이언트로 교체"""
+    monkeypatch.setattr(settings, "GEMINI_API_KEY", "test-key")
+
+    def install(transport: httpx.MockTransport) -> None:
+        monkeypatch.setitem(http_client._clients, "gemini", httpx.AsyncClient(transport=transport))
+
+    return install
+
+
+def _stream_of(*texts: str) -> httpx.MockTransport:
+    def handler(request: httpx.Request) -> httpx.Response:
+        assert ":streamGenerateContent" in request.url.path
+        assert request.url.params["alt"] == "sse"
+        return httpx.Response(
+            200,
+            headers={"content-type": "text/event-stream"},
+            content=b"".join(_sse_chunk(t) for t in texts),
+        )
+
+    return httpx.MockTransport(handler)
+
+
+async def _collect(stream: AsyncIterator[str]) -> List[str]:
+    return [chunk async for chunk in stream]
+
+
+async def test_tokens_forwarded_in_order_and_cached(
+    gemini_stub: Callable[[httpx.MockTransport], None], fake_redis: FakeRedis
+) -> None:
+    gemini_stub(_stream_of("오늘은 ", "맑고 ", "좋은 날"))
+
+    chunks = await _collect(gemini_stream("운세", cache_ttl=60, cache_scope="2026-10-17"))
+
+    assert chunks == ["오늘은 ", "맑고 ", "좋은 날"]
+    key = prompt_fingerprint("운세", "2026-10-17")
+    assert await fake_redis.get(f"gemini:cache:{key}") == "오늘은 맑고 좋은 날"
+
+
+async def test_cached_text_served_without_calling_gemini(
+    gemini_stub: Callable[[httpx.MockTransport], None], fake_redis: FakeRedis
+) -> None:
+    def fail(request: httpx.Request) -> httpx.Response:
+        raise AssertionError("Gemini should not be called on a cache hit")
+
+    gemini_stub(httpx.MockTransport(fail))
+    key = prompt_fingerprint("운세", "2026-10-17")
+    await fake_redis.set(f"gemini:cache:{key}", "저장된 운세", ex=60)
+
+    assert await _collect(gemini_stream("운세", cache_ttl=60, cache_scope="2026-10-17")) == ["저장된 운세"]
+
+
+async def test_first_token_arrives_before_stream_finishes(
+    gemini_stub: Callable[[httpx.MockTransport], None], fake_redis: FakeRedis
+) -> None:
+    release = asyncio.Event()
+
+    async def body() -> AsyncIterator[bytes]:
+        yield _sse_chunk("첫 ")
+        await release.wait()
+        yield _sse_chunk("조각")
+
+    gemini_stub(httpx.MockTransport(lambda request: httpx.Response(200, content=body())))
+
+    stream = gemini_stream("브리핑", cache_ttl=60)
+    first = await asyncio.wait_for(stream.__anext__(), timeout=1.0)
+    assert first == "첫 "
+    # 스트림이 끝나기 전에는 캐시에 쓰지 않음
+    assert fake_redis.data == {}
+
+    release.set()
+    assert await _collect(stream) == ["조각"]
+    assert await fake_redis.get(f"gemini:cache:{prompt_fingerprint('브리핑')}") == "첫 조각"
+
+
+async def test_ignores_keepalive_and_malformed_events(
+    gemini_stub: Callable[[httpx.MockTransport], None], fake_redis: FakeRedis
+) -> None:
+    content = b": keep-alive\r\n\r\n" + b"data: not-json\r\n\r\n" + b"data:\r\n\r\n" + _sse_chunk("본문")
+    gemini_stub(httpx.MockTransport(lambda request: httpx.Response(200, content=content)))
+
+    assert await _collect(gemini_stream("대화")) == ["본문"]
+
+
+async def test_error_status_raises_and_skips_cache(
+    gemini_stub: Callable[[httpx.MockTransport], None], fake_redis: FakeRedis
+) -> None:
+    gemini_stub(httpx.MockTransport(lambda request: httpx.Response(429, text="quota exceeded")))
+
+    with pytest.raises(HTTPException) as exc:
+        await _collect(gemini_stream("운세", cache_ttl=60))
+
+    assert exc.value.status_code == 429
+    assert isinstance(exc.value.detail, dict)
+    assert exc.value.detail["error_code"] == "GEMINI_RESPONSE_ERROR"
+    assert fake_redis.data == {}
+
+
+async def test_stream_job_emits_sse_events(
+    gemini_stub: Callable[[httpx.MockTransport], None], fake_redis: FakeRedis
+) -> None:
+    gemini_stub(_stream_of("안녕", "하세요"))
+    job = GeminiJob(prompt="대화", cache_ttl=60, cache_scope="", result_field="summary", meta={"period": "아침"})
+
+    events = await _collect(_stream_job(job))
+
+    assert events[:2] == [
+        'event: token\ndata: {"text": "안녕"}\n\n',
+        'event: token\ndata: {"text": "하세요"}\n\n',
+    ]
+    assert events[2].startswith("event: done\n")
+    done = json.loads(events[2].split("data: ", 1)[1])
+    assert done["period"] == "아침" and "generated_at" in done
+
+
+async def test_stream_job_reports_upstream_error_as_event(
+    gemini_stub: Callable[[httpx.MockTransport], None], fake_redis: FakeRedis
+) -> None:
+    gemini_stub(httpx.MockTransport(lambda request: httpx.Response(500, text="boom")))
+    job = GeminiJob(prompt="대화", cache_ttl=60, cache_scope="", result_field="summary")
+
+    events = await _collect(_stream_job(job))
+
+    assert len(events) == 1
+    assert events[0].startswith("event: error\n")
+    assert json.loads(events[0].split("data: ", 1)[1])["status_code"] == 500
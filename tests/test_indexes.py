@@ -0,0 +1,161 @@
+"""
+조회 조건용 인덱스 (user-019)
+- migrations/manual의 인덱스를 모델 Meta에 다시 선언하지 않았는지 / 마이그레이션 커넥션에 타임아웃이 없는지 (DB 없이)
+- 수동 마이그레이션의 인덱스가 실제 테이블 / 컬럼을 가리키는지
+- 자주 실행되는 조회가 해당 인덱스를 쓰는지 EXPLAIN으로 확인 (TEST_DATABASE_URL 필요)
+"""
+import re
+from datetime import datetime, timezone
+from typing import Any, Dict, List, Tuple, Type
+
+import pytest
+from tortoise import Model, Tortoise
+from tortoise.indexes import Index
+from tortoise.transactions import in_transaction
+
+from core.concurrent_index import ensure_migration_db
+from core.db import DEFAULT_DB, MIGRATION_TORTOISE_ORM, TORTOISE_ORM
+from core.db_pool import client_class
+from models.inquiries import Inquiry, InquiryStatus
+from models.notifications import Notification
+from models.schedules import Schedule
+from models.todo import Todo
+from models.token_revocations import TokenRevocation
+from models.user import User
+from models.user_activity import ActivityDailyStat, UserDailyActivity
+from models.user_locations import UserLocation
+from tests.postgres import manual_migrations
+
+MODELS: List[Type[Model]] = [
+    User, Schedule, Todo, Notification, Inquiry, UserLocation, TokenRevocation,
+    UserDailyActivity, ActivityDailyStat,
+]
+
+# "ON table [USING method] (col [opclass], ...) [WHERE ...]"
+DEFINITION_RE = re.compile(r"^ON (\w+)(?: USING \w+)? \(([^)]*)\)(?: WHERE (.+))?$")
+
+MODEL_MODULES = sorted({m.__module__ for m in MODELS})
+
+
+@pytest.fixture
+def models_ready() -> None:
+    """FK 컬럼(user_id 등)은 관계 초기화 후에 fields_db_projection에 들어감"""
+    Tortoise.init_models(MODEL_MODULES, "models")
+
+
+def _migration_indexes() -> Dict[str, str]:
+    indexes: Dict[str, str] = {}
+    for module in manual_migrations():
+        for name, definition in getattr(module, "INDEXES", {}).items():
+            assert name not in indexes, f"{name}이(가) 여러 마이그레이션에 정의됨"
+            indexes[name] = definition
+    return indexes
+
+
+def _parse(definition: str) -> Tuple[str, List[str], str]:
+    match = DEFINITION_RE.match(definition)
+    assert match, f"해석할 수 없는 인덱스 정의: {definition}"
+    table, columns, where = match.groups()
+    return table, [c.split()[0] for c in columns.split(",")], where or ""
+
+
+def _columns(model: Type[Model]) -> List[str]:
+    return list(model._meta.fields_db_projection.values())
+
+
+def _model_indexes(model: Type[Model]) -> List[Tuple[str, List[str]]]:
+    """Meta.indexes → (이름, 컬럼 목록)"""
+    projection = model._meta.fields_db_projection
+    result = []
+    for index in model._meta.indexes:
+        fields = index.fields if isinstance(index, Index) else index
+        name = index.name if isinstance(index, Index) else ""
+        result.append((name or "", [projection.get(f, f) for f in fields]))
+    return result
+
+
+def test_manual_migration_indexes_not_declared_in_models(models_ready: None) -> None:
+    # Meta에 있으면 aerich migrate가 CONCURRENTLY 없이 (쓰기를 막으며) 먼저 만듦
+    tables = {model._meta.db_table: model for model in MODELS}
+
+    for name, definition in _migration_indexes().items():
+        table, columns, _ = _parse(definition)
+        for model_index, model_columns in _model_indexes(tables[table]):
+            assert model_index != name, f"{name}이(가) {table} Meta에도 선언됨"
+            assert model_columns != columns, f"{name}과 같은 컬럼 인덱스가 {table} Meta에 선언됨"
+
+
+def test_migration_connection_has_no_command_timeout() -> None:
+    app_client = client_class(connection_name=DEFAULT_DB, **TORTOISE_ORM["connections"][DEFAULT_DB]["credentials"])
+    migration_client = client_class(
+        connection_name=DEFAULT_DB, **MIGRATION_TORTOISE_ORM["connections"][DEFAULT_DB]["credentials"]
+    )
+
+    with pytest.raises(RuntimeError, match="MIGRATION_TORTOISE_ORM"):
+        ensure_migration_db(app_client)
+    ensure_migration_db(migration_client)
+    assert migration_client.server_settings["statement_timeout"] == "0"
+
+
+def test_manual_migration_indexes_reference_model_columns(models_ready: None) -> None:
+    tables = {model._meta.db_table: model for model in MODELS}
+
+    for name, definition in _migration_indexes().items():
+        table, columns, where = _parse(definition)
+        assert table in tables, f"{name}: 모델에 없는 테이블 {table}"
+        known = _columns(tables[table])
+        assert set(columns) <= set(known), f"{name}: {table}에 없는 컬럼 {columns}"
+        for column in re.findall(r"(\w+) IS (?:NOT )?NULL", where):
+            assert column in known, f"{name}: {table}에 없는 컬럼 {column}"
+
+
+# --------------------
+# PostgreSQL EXPLAIN (TEST_DATABASE_URL이 있을 때만)
+# --------------------
+async def _plan(sql: str) -> str:
+    # 빈 테이블에서는 순차 스캔이 더 싸므로 끄고, 인덱스를 쓸 수 있는 조건인지만 확인
+    async with in_transaction(DEFAULT_DB) as conn:
+        await conn.execute_script("SET LOCAL enable_seqscan = off;")
+        rows = await conn.execute_query_dict(f"EXPLAIN {sql}")
+    return "\n".join(row["QUERY PLAN"] for row in rows)
+
+
+NOW = datetime(2026, 10, 17, tzinfo=timezone.utc)
+
+HOT_QUERIES = [
+    (
+        "idx_todos_user_created_live",
+        lambda: Todo.filter(user_id=1, deleted_at=None).order_by("-created_at", "-id").limit(20),
+    ),
+    (
+        "idx_schedules_user_start_live",
+        lambda: Schedule.filter(user_id=1, deleted_at=None, start_time__gte=NOW).order_by("start_time"),
+    ),
+    (
+        "idx_inquiries_user_created",
+        lambda: Inquiry.filter(user_id=1).order_by("-created_at").limit(20),
+    ),
+    (
+        "idx_inquiries_status_created",
+        lambda: Inquiry.filter(status=InquiryStatus.pending).order_by("-created_at").limit(20),
+    ),
+    (
+        "idx_notifications_user_read_notify",
+        lambda: Notification.filter(user_id=1, is_read=False, notify_at__lte=NOW),
+    ),
+    (
+        "idx_token_revocations_expires",
+        lambda: TokenRevocation.filter(expires_at__lt=NOW).limit(5000),
+    ),
+]
+
+
+@pytest.mark.parametrize("index_name, queryset", HOT_QUERIES, ids=[name for name, _ in HOT_QUERIES])
+async def test_hot_queries_use_index(postgres_db: None, index_name: str, queryset: Any) -> None:
+    plan = await _plan(queryset().sql(params_inline=True))
+    assert index_name in plan, plan
+
+
+async def test_user_search_uses_trigram_index(postgres_db: None) -> None:
+    plan = await _plan("SELECT id FROM users WHERE username ILIKE '%ohn%'")
+    assert "idx_users_username_trgm" in plan, plan
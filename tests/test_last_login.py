@@ -0,0 +1,160 @@
+"""
+로그인 시각 write-behind 버퍼 (user-016)
+- flush는 PENDING을 FLUSHING으로 RENAME해 떼어내고 반영
+- 반영 실패 시 FLUSHING 묶음을 다음 주기에 그대로 재시도 (새 묶음은 그 다음)
+- 락은 토큰 기반이라 TTL이 지난 뒤 다른 워커가 잡은 락을 지우지 않음
+- 관리자 조회는 DB 값과 버퍼 값 중 최신을 사용
+"""
+from datetime import datetime, timedelta, timezone
+from typing import Dict, List
+
+import pytest
+
+from models.user import User
+from repositories.user_repo import UserRepository
+from services.last_login_service import (
+    FLUSH_LOCK_KEY,
+    FLUSHING_KEY,
+    PENDING_KEY,
+    LastLoginBuffer,
+    last_login_buffer,
+)
+from tests.fakes import FakeRedis
+
+T0 = datetime(2026, 10, 1, 3, 0, tzinfo=timezone.utc)
+
+
+@pytest.fixture
+def written(fake_redis: FakeRedis, monkeypatch: pytest.MonkeyPatch) -> List[Dict[int, float]]:
+    """DB 반영 대신 반영된 묶음을 기록"""
+    batches: List[Dict[int, float]] = []
+
+    async def write(entries: Dict[int, float]) -> int:
+        batches.append(entries)
+        return len(entries)
+
+    monkeypatch.setattr(LastLoginBuffer, "_write", staticmethod(write))
+    return batches
+
+
+async def test_flush_moves_pending_batch(written: List[Dict[int, float]], fake_redis: FakeRedis) -> None:
+    buffer = LastLoginBuffer()
+    await buffer.record(1, T0)
+    await buffer.record(2, T0)
+    await buffer.record(1, T0 + timedelta(minutes=5))  # 사용자당 최신 값 1개
+
+    assert await buffer.flush() == 2
+    assert written == [{1: (T0 + timedelta(minutes=5)).timestamp(), 2: T0.timestamp()}]
+    assert not await fake_redis.exists(PENDING_KEY, FLUSHING_KEY, FLUSH_LOCK_KEY)
+
+    # 비어 있으면 반영하지 않음
+    assert await buffer.flush() == 0
+    assert len(written) == 1
+
+
+async def test_login_during_flush_goes_to_next_batch(
+    fake_redis: FakeRedis, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    buffer = LastLoginBuffer()
+    batches: List[Dict[int, float]] = []
+
+    async def write(entries: Dict[int, float]) -> int:
+        batches.append(entries)
+        if len(batches) == 1:
+            await buffer.record(3, T0)  # 반영 도중 로그인
+        return len(entries)
+
+    monkeypatch.setattr(LastLoginBuffer, "_write", staticmethod(write))
+    await buffer.record(1, T0)
+
+    await buffer.flush()
+    await buffer.flush()
+
+    assert [sorted(b) for b in batches] == [[1], [3]]
+
+
+async def test_failed_write_retries_same_batch_first(
+    fake_redis: FakeRedis, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    buffer = LastLoginBuffer()
+    batches: List[Dict[int, float]] = []
+
+    async def failing_write(entries: Dict[int, float]) -> int:
+        raise ConnectionError("db down")
+
+    monkeypatch.setattr(LastLoginBuffer, "_write", staticmethod(failing_write))
+    await buffer.record(1, T0)
+    with pytest.raises(ConnectionError):
+        await buffer.flush()
+    assert await fake_redis.hgetall(FLUSHING_KEY) == {"1": str(T0.timestamp())}
+    assert not await fake_redis.exists(FLUSH_LOCK_KEY)
+
+    # 실패 후 들어온 로그인은 PENDING에 쌓이고, 재시도는 실패한 묶음만
+    await buffer.record(2, T0)
+
+    async def write(entries: Dict[int, float]) -> int:
+        batches.append(entries)
+        return len(entries)
+
+    monkeypatch.setattr(LastLoginBuffer, "_write", staticmethod(write))
+    await buffer.flush()
+    await buffer.flush()
+
+    assert [sorted(b) for b in batches] == [[1], [2]]
+    assert not await fake_redis.exists(PENDING_KEY, FLUSHING_KEY)
+
+
+async def test_flush_skips_while_another_worker_holds_lock(
+    written: List[Dict[int, float]], fake_redis: FakeRedis
+) -> None:
+    await fake_redis.set(FLUSH_LOCK_KEY, "other-worker", ex=60, nx=True)
+    await last_login_buffer.record(1, T0)
+
+    assert await LastLoginBuffer().flush() == 0
+    assert written == []
+    assert await fake_redis.get(FLUSH_LOCK_KEY) == "other-worker"
+
+
+async def test_expired_lock_taken_by_another_worker_is_not_released(
+    fake_redis: FakeRedis, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    buffer = LastLoginBuffer()
+
+    async def slow_write(entries: Dict[int, float]) -> int:
+        # 반영이 TTL보다 오래 걸려 락이 만료되고 다른 워커가 새로 잡음
+        del fake_redis.data[FLUSH_LOCK_KEY]
+        await fake_redis.set(FLUSH_LOCK_KEY, "other-worker", ex=60, nx=True)
+        return len(entries)
+
+    monkeypatch.setattr(LastLoginBuffer, "_write", staticmethod(slow_write))
+    await buffer.record(1, T0)
+
+    assert await buffer.flush() == 1
+    assert await fake_redis.get(FLUSH_LOCK_KEY) == "other-worker"
+
+
+async def test_get_pending_merges_flushing_and_pending(fake_redis: FakeRedis) -> None:
+    await fake_redis.hset(FLUSHING_KEY, "1", str((T0 + timedelta(minutes=5)).timestamp()))
+    await fake_redis.hset(FLUSHING_KEY, "2", str(T0.timestamp()))
+    await fake_redis.hset(PENDING_KEY, "1", str(T0.timestamp()))
+    await fake_redis.hset(PENDING_KEY, "2", str((T0 + timedelta(minutes=5)).timestamp()))
+
+    assert await LastLoginBuffer().get_pending() == {
+        1: T0 + timedelta(minutes=5),
+        2: T0 + timedelta(minutes=5),
+    }
+
+
+async def test_admin_list_uses_latest_of_db_and_buffer(sqlite_db: None, fake_redis: FakeRedis) -> None:
+    stale = await User.create(email="stale@example.com", username="stale", last_login_at=T0)
+    fresh = await User.create(
+        email="fresh@example.com", username="fresh", last_login_at=T0 + timedelta(hours=1)
+    )
+    await last_login_buffer.record(stale.id, T0 + timedelta(minutes=30))
+    await last_login_buffer.record(fresh.id, T0)  # DB 값이 더 최신
+
+    rows = {u["id"]: u["last_login_at"] for u in await UserRepository.get_all_users_last_login()}
+
+    # KST 표기
+    assert rows[stale.id] == "2026-10-01 12:30"
+    assert rows[fresh.id] == "2026-10-01 13:00"
@@ -0,0 +1,151 @@
+"""
+SMTP 연결 풀 / 메일 대기열 (user-014)
+- 발송이 모두 실패해도 대기 중인 발송이 멈추지 않는지, 메시지 단위 오류에 연결을 재사용하는지
+- 재시도 메일을 stream으로 옮기다 실패해도 잃어버리지 않는지 (Lua 스크립트, TEST_REDIS_URL 필요)
+"""
+import asyncio
+import os
+import time
+from email.message import EmailMessage
+from typing import AsyncIterator, List, Optional
+
+import aiosmtplib
+import pytest
+import redis.asyncio as redis
+
+from core import mail_outbox
+from core.mail_outbox import OUTBOX_STREAM, RETRY_KEY, MailOutbox, SMTPPool
+
+TEST_REDIS_URL = os.getenv("TEST_REDIS_URL")
+
+
+class FakeSMTP:
+    def __init__(self, error: Optional[Exception] = None) -> None:
+        self.error = error
+        self.is_connected = True
+        self.sent = 0
+        self.closed = False
+
+    async def send_message(self, message: EmailMessage) -> None:
+        await asyncio.sleep(0)
+        if self.error is not None:
+            raise self.error
+        self.sent += 1
+
+    def close(self) -> None:
+        self.is_connected = False
+        self.closed = True
+
+    async def quit(self) -> None:
+        self.close()
+
+
+def _pool(size: int, error: Optional[Exception] = None) -> "tuple[SMTPPool, List[FakeSMTP]]":
+    pool = SMTPPool(size)
+    created: List[FakeSMTP] = []
+
+    async def connect() -> FakeSMTP:
+        smtp = FakeSMTP(error)
+        created.append(smtp)
+        return smtp
+
+    pool._connect = connect  # type: ignore[method-assign]
+    return pool, created
+
+
+def _message() -> EmailMessage:
+    message = EmailMessage()
+    message["To"] = "user@example.com"
+    message.set_content("hi")
+    return message
+
+
+async def test_waiters_proceed_when_every_send_fails() -> None:
+    pool, created = _pool(size=2, error=ConnectionResetError("smtp blip"))
+
+    results = await asyncio.wait_for(
+        asyncio.gather(*(pool.send(_message()) for _ in range(5)), return_exceptions=True),
+        timeout=2.0,
+    )
+
+    assert all(isinstance(r, ConnectionResetError) for r in results)
+    assert all(smtp.closed for smtp in created)
+    assert pool._slots._value == 2
+
+
+async def test_connect_failure_releases_slot() -> None:
+    pool = SMTPPool(1)
+    attempts = 0
+
+    async def connect() -> FakeSMTP:
+        nonlocal attempts
+        attempts += 1
+        raise aiosmtplib.SMTPConnectError("refused")
+
+    pool._connect = connect  # type: ignore[method-assign]
+
+    for _ in range(3):
+        with pytest.raises(aiosmtplib.SMTPConnectError):
+            await asyncio.wait_for(pool.send(_message()), timeout=1.0)
+    assert attempts == 3
+
+
+async def test_recipient_refused_keeps_connection() -> None:
+    refused = aiosmtplib.SMTPRecipientsRefused(
+        [aiosmtplib.SMTPRecipientRefused(550, "no such user", "bad@example.com")]
+    )
+    pool, created = _pool(size=1, error=refused)
+
+    with pytest.raises(aiosmtplib.SMTPRecipientsRefused):
+        await pool.send(_message())
+
+    # 같은 연결로 다음 메일 발송
+    created[0].error = None
+    await pool.send(_message())
+    assert len(created) == 1
+    assert created[0].sent == 1 and not created[0].closed
+
+
+async def test_connections_reused_up_to_pool_size() -> None:
+    pool, created = _pool(size=2)
+
+    await asyncio.gather(*(pool.send(_message()) for _ in range(10)))
+
+    assert len(created) <= 2
+    assert sum(smtp.sent for smtp in created) == 10
+
+
+# --------------------
+# 재시도 메일 이동 (실제 Redis, TEST_REDIS_URL이 있을 때만)
+# --------------------
+@pytest.fixture
+async def real_redis(monkeypatch: pytest.MonkeyPatch) -> AsyncIterator[redis.Redis]:
+    if not TEST_REDIS_URL:
+        pytest.skip("TEST_REDIS_URL 미설정")
+    client = redis.from_url(TEST_REDIS_URL, decode_responses=True)
+    await client.delete(OUTBOX_STREAM, RETRY_KEY)
+    monkeypatch.setattr(mail_outbox, "redis_client", client)
+    yield client
+    await client.delete(OUTBOX_STREAM, RETRY_KEY)
+    await client.aclose()
+
+
+async def test_promote_moves_only_due_retries(real_redis: redis.Redis) -> None:
+    now = time.time()
+    await real_redis.zadd(RETRY_KEY, {"due": now - 1, "later": now + 600})
+
+    assert await MailOutbox()._promote_due_retries() == 1
+
+    assert await real_redis.zrange(RETRY_KEY, 0, -1) == ["later"]
+    entries = await real_redis.xrange(OUTBOX_STREAM)
+    assert [fields["mail"] for _, fields in entries] == ["due"]
+
+
+async def test_failed_promote_keeps_mail_in_retry_set(real_redis: redis.Redis) -> None:
+    await real_redis.zadd(RETRY_KEY, {"due": time.time() - 1})
+    await real_redis.set(OUTBOX_STREAM, "not a stream")  # XADD가 WRONGTYPE으로 실패
+
+    with pytest.raises(redis.ResponseError):
+        await MailOutbox()._promote_due_retries()
+
+    assert await real_redis.zrange(RETRY_KEY, 0, -1) == ["due"]
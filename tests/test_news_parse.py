@@ -0,0 +1,136 @@
+"""
+news_service 파싱 (user-005)
+- 기사 컨테이너만 파싱해도 전체 페이지 파싱과 결과가 같은지
+- 스크래핑 중 파싱이 이벤트 루프가 아닌 news-parse 스레드에서 실행되는지
+- 컨테이너만 파싱 vs 전체 페이지 파싱 시간 비교 (pytest -m benchmark -s)
+"""
+import threading
+import time
+from pathlib import Path
+from typing import Callable, List
+
+import httpx
+import pytest
+from bs4 import BeautifulSoup
+
+from core import http_client
+from services import news_service
+from services.news_service import (
+    ARTICLE_CONTAINER_STRAINER,
+    HTML_PARSER,
+    extract_articles,
+    parse_article,
+    parse_news_html,
+    scrape_naver_news,
+)
+
+FIXTURE = Path(__file__).parent / "fixtures" / "naver_section_100.html"
+
+
+@pytest.fixture(scope="module")
+def section_html() -> str:
+    return FIXTURE.read_text(encoding="utf-8")
+
+
+def _parse_full_page(html: str, limit: int = 6) -> List[dict]:
+    """컨테이너 제한 전 방식 (전체 페이지 트리 → 셀렉터)"""
+    articles = extract_articles(BeautifulSoup(html, HTML_PARSER), limit)
+    items = [item for item in (parse_article(a) for a in articles) if item]
+    return items[:limit]
+
+
+def _parse_container(html: str, limit: int = 6) -> List[dict]:
+    articles = extract_articles(
+        BeautifulSoup(html, HTML_PARSER, parse_only=ARTICLE_CONTAINER_STRAINER), limit
+    )
+    items = [item for item in (parse_article(a) for a in articles) if item]
+    return items[:limit]
+
+
+def _best_of(fn: Callable[[], object], repeat: int = 5) -> float:
+    timings = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        fn()
+        timings.append(time.perf_counter() - started)
+    return min(timings)
+
+
+def test_parse_news_html_reads_section_fixture(section_html: str) -> None:
+    items = parse_news_html(section_html, limit=6)
+
+    assert len(items) == 6
+    for item in items:
+        assert item["title"]
+        assert item["url"].startswith("https://n.news.naver.com/mnews/article/")
+        assert item["source"]
+        assert item["summary"]
+        assert item["published"].endswith("분전")
+
+
+def test_container_parse_matches_full_page(section_html: str) -> None:
+    assert _parse_container(section_html) == _parse_full_page(section_html)
+
+
+def test_parse_news_html_falls_back_to_full_page() -> None:
+    # 목록 컨테이너 클래스가 바뀐 페이지 → 전체 페이지에서 li.sa_item으로 찾음
+    html = (
+        "<html><body><ul class='new_layout'><li class='sa_item'>"
+        "<a href='/mnews/article/001/0000000001'><strong class='sa_text_strong'>제목</strong></a>"
+        "<div class='sa_text_press'>연합뉴스</div>"
+        "</li></ul></body></html>"
+    )
+    items = parse_news_html(html, limit=6)
+
+    assert [item["title"] for item in items] == ["제목"]
+    assert items[0]["url"] == "https://news.naver.com/mnews/article/001/0000000001"
+
+
+async def test_scrape_parses_on_parse_thread(
+    section_html: str, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    transport = httpx.MockTransport(lambda request: httpx.Response(200, text=section_html))
+    client = httpx.AsyncClient(transport=transport)
+    monkeypatch.setitem(http_client._clients, "naver", client)
+
+    # 파싱이 어느 스레드에서 실행됐는지 기록 (이벤트 루프 스레드면 루프를 막은 것)
+    threads: List[str] = []
+
+    def recording_parse(html: str, limit: int = 6) -> List[dict]:
+        threads.append(threading.current_thread().name)
+        return parse_news_html(html, limit)
+
+    monkeypatch.setattr(news_service, "parse_news_html", recording_parse)
+    try:
+        items = await scrape_naver_news(news_service.NAVER_NEWS_SECTIONS["politics"], limit=6)
+    finally:
+        await client.aclose()
+
+    assert items == parse_news_html(section_html, limit=6)
+    assert len(threads) == 1
+    assert threads[0].startswith("news-parse")
+    assert threads[0] != threading.current_thread().name
+
+
+def test_parse_executor_is_recreated_after_shutdown() -> None:
+    # lifespan 종료 후 다시 시작(테스트 / 개발 서버 reload)해도 파싱 가능
+    news_service.init_parse_executor()
+    news_service.shutdown_parse_executor()
+    news_service.init_parse_executor()
+
+    future = news_service._get_parse_executor().submit(threading.current_thread)
+    assert future.result(timeout=5).name.startswith("news-parse")
+
+
+@pytest.mark.benchmark
+def test_parse_benchmark(section_html: str) -> None:
+    full = _best_of(lambda: _parse_full_page(section_html))
+    container = _best_of(lambda: _parse_container(section_html))
+
+    print(
+        f"\n[{HTML_PARSER}] {len(section_html) / 1024:.0f}KB 섹션 페이지"
+        f" | 전체 파싱 {full * 1000:.1f}ms | 컨테이너만 {container * 1000:.1f}ms"
+        f" | {full / container:.2f}x"
+    )
+    # 시간은 환경마다 달라 출력만 하고, 결과가 같은지만 확인
+    assert _parse_container(section_html) == _parse_full_page(section_html)
@@ -0,0 +1,133 @@
+"""
+본인 소유 행 수정 / 삭제 1문장 SQL (core.ownership, user-025, TEST_DATABASE_URL 필요)
+- 행 없음 → (None, None), 다른 사용자 행 → (owner_id, None), 반영 → (owner_id, row)
+- Soft Delete된 행은 없는 행으로 취급 (일정 hard delete만 예외)
+- None 인자는 기존 값 유지
+"""
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from models.schedules import Schedule
+from models.todo import Todo
+from models.user import User
+from repositories.schedules_repo import ScheduleRepository
+from repositories.todos_repo import TodosRepository
+
+T0 = datetime(2026, 10, 1, 9, tzinfo=timezone.utc)
+MISSING_ID = 10**9
+
+
+@pytest.fixture
+async def owner(postgres_db: None) -> User:
+    return await User.create(email="owner@example.com", username="owner")
+
+
+@pytest.fixture
+async def other(postgres_db: None) -> User:
+    return await User.create(email="other@example.com", username="other")
+
+
+async def _schedule(user: User, **kwargs: object) -> Schedule:
+    fields = {"title": "회의", "description": "주간", "start_time": T0, "end_time": T0 + timedelta(hours=1)}
+    fields.update(kwargs)
+    return await Schedule.create(user=user, **fields)
+
+
+# --------------------
+# todos
+# --------------------
+async def test_todo_update_applies_and_keeps_none_fields(owner: User) -> None:
+    todo = await Todo.create(user=owner, title="제목", description="설명")
+
+    owner_id, row = await TodosRepository.update_todo(todo.id, owner.id, title=None, is_completed=True)
+
+    assert owner_id == owner.id and row is not None
+    assert (row["title"], row["description"], row["is_completed"]) == ("제목", "설명", True)
+    stored = await Todo.get(id=todo.id)
+    assert (stored.title, stored.description, stored.is_completed) == ("제목", "설명", True)
+
+
+async def test_todo_missing_row(owner: User) -> None:
+    assert await TodosRepository.update_todo(MISSING_ID, owner.id, title="x") == (None, None)
+    assert await TodosRepository.delete_todo(MISSING_ID, owner.id) == (None, None)
+    assert await TodosRepository.hard_delete_todo(MISSING_ID, owner.id) == (None, None)
+
+
+async def test_todo_other_users_row_is_untouched(owner: User, other: User) -> None:
+    theirs = await Todo.create(user=other, title="남의 것")
+
+    assert await TodosRepository.update_todo(theirs.id, owner.id, title="가로채기") == (other.id, None)
+    assert await TodosRepository.delete_todo(theirs.id, owner.id) == (other.id, None)
+    assert await TodosRepository.hard_delete_todo(theirs.id, owner.id) == (other.id, None)
+
+    stored = await Todo.get(id=theirs.id)
+    assert (stored.title, stored.deleted_at) == ("남의 것", None)
+
+
+async def test_todo_soft_deleted_row_is_missing(owner: User) -> None:
+    todo = await Todo.create(user=owner, title="지운 것")
+
+    owner_id, row = await TodosRepository.delete_todo(todo.id, owner.id)
+    assert owner_id == owner.id and row == {"id": todo.id}
+
+    assert await TodosRepository.update_todo(todo.id, owner.id, title="되살리기") == (None, None)
+    assert await TodosRepository.delete_todo(todo.id, owner.id) == (None, None)
+    assert await TodosRepository.hard_delete_todo(todo.id, owner.id) == (None, None)
+    assert (await Todo.get(id=todo.id)).title == "지운 것"
+
+
+async def test_todo_hard_delete_removes_row(owner: User) -> None:
+    todo = await Todo.create(user=owner, title="완전 삭제")
+
+    assert await TodosRepository.hard_delete_todo(todo.id, owner.id) == (owner.id, {"id": todo.id})
+    assert not await Todo.filter(id=todo.id).exists()
+
+
+# --------------------
+# schedules
+# --------------------
+async def test_schedule_update_applies_and_keeps_none_fields(owner: User) -> None:
+    schedule = await _schedule(owner, location="회의실")
+    new_end = T0 + timedelta(hours=2)
+
+    owner_id, row = await ScheduleRepository.update_schedule(
+        schedule.id, owner.id, end_time=new_end, title=None, location=None
+    )
+
+    assert owner_id == owner.id and row is not None
+    assert (row["title"], row["description"], row["location"]) == ("회의", "주간", "회의실")
+    assert (row["start_time"], row["end_time"]) == (T0, new_end)
+    assert row["all_day"] is False
+
+
+async def test_schedule_missing_row(owner: User) -> None:
+    assert await ScheduleRepository.update_schedule(MISSING_ID, owner.id, title="x") == (None, None)
+    assert await ScheduleRepository.delete_schedule(MISSING_ID, owner.id) == (None, None)
+    assert await ScheduleRepository.hard_delete_schedule(MISSING_ID, owner.id) == (None, None)
+
+
+async def test_schedule_other_users_row_is_untouched(owner: User, other: User) -> None:
+    theirs = await _schedule(other)
+
+    assert await ScheduleRepository.update_schedule(theirs.id, owner.id, title="가로채기") == (other.id, None)
+    assert await ScheduleRepository.delete_schedule(theirs.id, owner.id) == (other.id, None)
+    assert await ScheduleRepository.hard_delete_schedule(theirs.id, owner.id) == (other.id, None)
+
+    stored = await Schedule.get(id=theirs.id)
+    assert (stored.title, stored.deleted_at) == ("회의", None)
+
+
+async def test_schedule_soft_deleted_row_is_missing_except_hard_delete(owner: User, other: User) -> None:
+    mine = await _schedule(owner)
+    theirs = await _schedule(other)
+    await Schedule.filter(id__in=[mine.id, theirs.id]).update(deleted_at=T0)
+
+    assert await ScheduleRepository.update_schedule(mine.id, owner.id, title="되살리기") == (None, None)
+    assert await ScheduleRepository.delete_schedule(mine.id, owner.id) == (None, None)
+
+    # hard delete는 Soft Delete된 일정도 대상 (소유자 확인은 그대로)
+    assert await ScheduleRepository.hard_delete_schedule(theirs.id, owner.id) == (other.id, None)
+    assert await ScheduleRepository.hard_delete_schedule(mine.id, owner.id) == (owner.id, {"id": mine.id})
+    assert not await Schedule.filter(id=mine.id).exists()
+    assert await Schedule.filter(id=theirs.id).exists()
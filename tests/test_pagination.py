@@ -0,0 +1,134 @@
+"""
+keyset 페이지네이션 (user-021)
+- created_at이 같은 행이 페이지 경계에 걸려도 id로 이어서 빠짐 / 중복 없이 순회
+- 내림차순 / 오름차순
+- 잘못된 커서는 400
+- 목록 총 개수 캐시와 invalidate_count
+"""
+from datetime import datetime, timedelta, timezone
+from typing import Any, AsyncIterator, List, Optional
+
+import pytest
+from fastapi import HTTPException
+
+from core.pagination import cached_count, decode_cursor, encode_cursor, fetch_page, invalidate_count
+from core.redis_client import redis_client
+from models.todo import Todo
+from models.user import User
+from repositories.todos_repo import TODO_COUNT_KEY, TodosRepository
+from tests.fakes import FakeRedis
+
+T0 = datetime(2026, 10, 1, tzinfo=timezone.utc)
+
+
+@pytest.fixture
+async def todos(sqlite_db: None) -> AsyncIterator[List[Todo]]:
+    """created_at: 세 개씩 같은 값 (T0, T0+1m, T0+2m)"""
+    user = await User.create(email="user@example.com", username="user")
+    other = await User.create(email="other@example.com", username="other")
+    created = []
+    for i in range(9):
+        todo = await Todo.create(user=user, title=f"todo {i}")
+        await Todo.filter(id=todo.id).update(created_at=T0 + timedelta(minutes=i // 3))
+        created.append(todo)
+    await Todo.create(user=other, title="other user")
+    yield created
+
+
+async def _walk(user_id: int, limit: int, descending: bool) -> List[List[int]]:
+    pages: List[List[int]] = []
+    after: Optional[tuple[Any, ...]] = None
+    while True:
+        queryset = Todo.filter(user_id=user_id, deleted_at=None)
+        rows, cursor = await fetch_page(queryset, "created_at", limit, after, descending=descending)
+        pages.append([row.id for row in rows])
+        if cursor is None:
+            return pages
+        after = decode_cursor(cursor, datetime, int)
+
+
+async def test_descending_pages_split_ties_by_id(todos: List[Todo]) -> None:
+    ids = [t.id for t in todos]
+    pages = await _walk(todos[0].user_id, limit=2, descending=True)
+
+    # (created_at desc, id desc): 같은 created_at 묶음이 페이지 경계에 걸림
+    expected = sorted(ids, key=lambda i: (ids.index(i) // 3, i), reverse=True)
+    assert [i for page in pages for i in page] == expected
+    assert [len(page) for page in pages] == [2, 2, 2, 2, 1]
+
+
+async def test_ascending_pages_split_ties_by_id(todos: List[Todo]) -> None:
+    ids = [t.id for t in todos]
+    pages = await _walk(todos[0].user_id, limit=4, descending=False)
+
+    assert [i for page in pages for i in page] == ids
+    assert [len(page) for page in pages] == [4, 4, 1]
+
+
+async def test_exact_page_has_no_next_cursor(todos: List[Todo]) -> None:
+    rows, cursor = await fetch_page(
+        Todo.filter(user_id=todos[0].user_id), "created_at", 9, descending=True
+    )
+
+    assert len(rows) == 9
+    assert cursor is None
+
+
+async def test_values_page_cursor(todos: List[Todo]) -> None:
+    rows, cursor = await fetch_page(
+        Todo.filter(user_id=todos[0].user_id), "created_at", 3, values=("id", "created_at", "title")
+    )
+
+    assert [row["id"] for row in rows] == [t.id for t in todos[:3]]
+    assert decode_cursor(cursor, datetime, int) == (T0, todos[2].id)
+
+
+@pytest.mark.parametrize(
+    "cursor",
+    [
+        "not-base64!!",
+        encode_cursor("2026-10-01T00:00:00"),           # 값 개수 불일치
+        encode_cursor("yesterday", 1),                   # datetime 아님
+        encode_cursor(T0, "abc"),                        # id 아님
+        "eyJhIjoxfQ",                                    # 배열이 아닌 JSON
+    ],
+)
+def test_malformed_cursor_is_400(cursor: str) -> None:
+    with pytest.raises(HTTPException) as exc:
+        decode_cursor(cursor, datetime, int)
+    assert exc.value.status_code == 400
+    assert exc.value.detail == "INVALID_CURSOR"
+
+
+def test_missing_cursor_is_first_page() -> None:
+    assert decode_cursor(None, datetime, int) is None
+    assert decode_cursor("", datetime, int) is None
+
+
+async def test_cached_count_until_invalidated(todos: List[Todo], fake_redis: FakeRedis) -> None:
+    user_id = todos[0].user_id
+    key = TODO_COUNT_KEY.format(user_id=user_id)
+
+    assert await TodosRepository.count_todos_by_user(user_id) == 9
+    assert await fake_redis.get(key) is not None
+
+    # 캐시가 살아 있는 동안은 이전 값
+    await Todo.filter(id=todos[0].id).update(deleted_at=T0)
+    assert await TodosRepository.count_todos_by_user(user_id) == 9
+
+    await TodosRepository.invalidate_count(user_id)
+    assert await fake_redis.get(key) is None
+    assert await TodosRepository.count_todos_by_user(user_id) == 8
+
+
+async def test_cached_count_without_redis(
+    todos: List[Todo], fake_redis: FakeRedis, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    async def redis_down(*args: Any, **kwargs: Any) -> None:
+        raise ConnectionError("redis down")
+
+    for name in ("get", "set", "delete"):
+        monkeypatch.setattr(redis_client, name, redis_down)
+
+    assert await cached_count("count:any", Todo.filter(user_id=todos[0].user_id)) == 9
+    await invalidate_count("count:any")
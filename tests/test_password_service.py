@@ -0,0 +1,130 @@
+"""
+bcrypt 전용 스레드 풀 (user-010)
+- 대기열이 가득 차면 503 SERVER_BUSY
+- 요청이 취소되어도 스레드 작업이 끝날 때까지 자리를 잡고 있는지
+- 로그인 폭주 중 다른 요청의 이벤트 루프 지연 (pytest -m benchmark -s)
+"""
+import asyncio
+import statistics
+import threading
+import time
+from typing import AsyncIterator, Callable, List
+
+import pytest
+from fastapi import HTTPException
+
+from services.password_service import PasswordHasher
+
+
+@pytest.fixture
+async def hasher() -> AsyncIterator[PasswordHasher]:
+    h = PasswordHasher(workers=1, max_pending=1, acquire_timeout=0.05, rounds=4)
+    yield h
+    h.shutdown()
+
+
+def _blocking(release: threading.Event) -> str:
+    release.wait(timeout=5)
+    return "done"
+
+
+async def _wait_until(predicate: Callable[[], bool], timeout: float = 1.0) -> None:
+    deadline = time.monotonic() + timeout
+    while not predicate():
+        assert time.monotonic() < deadline
+        await asyncio.sleep(0.005)
+
+
+async def test_hash_and_verify(hasher: PasswordHasher) -> None:
+    password_hash = await hasher.hash("s3cret!")
+
+    assert await hasher.verify("s3cret!", password_hash)
+    assert not await hasher.verify("wrong", password_hash)
+    assert hasher.metrics()["completed"] == 3
+
+
+async def test_rejects_with_503_when_saturated(hasher: PasswordHasher) -> None:
+    release = threading.Event()
+    busy = asyncio.create_task(hasher._run(_blocking, release))
+    await _wait_until(lambda: hasher.metrics()["running"] == 1)
+
+    with pytest.raises(HTTPException) as exc:
+        await hasher.hash("s3cret!")
+
+    assert exc.value.status_code == 503
+    assert exc.value.detail == "SERVER_BUSY"
+    assert hasher.metrics()["rejected"] == 1
+
+    release.set()
+    assert await busy == "done"
+    assert await hasher.verify("s3cret!", await hasher.hash("s3cret!"))
+
+
+async def test_cancelled_request_keeps_slot_until_job_finishes(hasher: PasswordHasher) -> None:
+    release = threading.Event()
+    request = asyncio.create_task(hasher._run(_blocking, release))
+    await _wait_until(lambda: hasher.metrics()["running"] == 1)
+
+    # 클라이언트 연결 끊김 → 요청 Task 취소, bcrypt 스레드는 계속 실행 중
+    request.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await request
+
+    with pytest.raises(HTTPException):
+        await hasher.hash("s3cret!")
+    assert hasher.metrics()["pending"] == 1
+
+    release.set()
+    await _wait_until(lambda: hasher.metrics()["pending"] == 0)
+    assert await hasher.hash("s3cret!")
+
+
+async def test_queued_job_cancelled_before_start_releases_slot() -> None:
+    h = PasswordHasher(workers=1, max_pending=2, acquire_timeout=0.05, rounds=4)
+    release = threading.Event()
+    try:
+        running = asyncio.create_task(h._run(_blocking, release))
+        await _wait_until(lambda: h.metrics()["running"] == 1)
+        queued = asyncio.create_task(h._run(_blocking, release))
+        await _wait_until(lambda: h.metrics()["pending"] == 2)
+
+        queued.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await queued
+        await _wait_until(lambda: h.metrics()["pending"] == 1)
+
+        release.set()
+        assert await running == "done"
+    finally:
+        release.set()
+        h.shutdown()
+
+
+@pytest.mark.benchmark
+async def test_login_storm_loop_latency() -> None:
+    """로그인 폭주(bcrypt 12 라운드) 중 다른 요청이 겪는 이벤트 루프 지연 p50 / p99"""
+    h = PasswordHasher(workers=2, max_pending=64, acquire_timeout=30.0, rounds=12)
+    password_hash = await h.hash("s3cret!")
+
+    latencies: List[float] = []
+    done = asyncio.Event()
+
+    async def unrelated_requests() -> None:
+        while not done.is_set():
+            started = time.perf_counter()
+            await asyncio.sleep(0.005)
+            latencies.append(time.perf_counter() - started - 0.005)
+
+    probe = asyncio.create_task(unrelated_requests())
+    started = time.perf_counter()
+    results = await asyncio.gather(*(h.verify("s3cret!", password_hash) for _ in range(16)))
+    elapsed = time.perf_counter() - started
+    done.set()
+    await probe
+    h.shutdown()
+
+    p50 = statistics.median(latencies) * 1000
+    p99 = statistics.quantiles(latencies, n=100)[98] * 1000
+    print(f"\n로그인 16건 {elapsed:.2f}s | 다른 요청 루프 지연 p50 {p50:.1f}ms, p99 {p99:.1f}ms")
+    assert all(results)
+    assert p99 < 50
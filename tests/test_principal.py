@@ -0,0 +1,133 @@
+"""
+인증 사용자 요약 캐시 (user-009)
+- 로컬 LRU → Redis → DB 순서로 조회하는지
+- 권한 / 상태가 바뀌는 경로에서 캐시를 지우는지 (지우지 않으면 비활성 / 강등된 사용자가 계속 통과)
+"""
+from typing import AsyncIterator
+
+import pytest
+
+from core import principal
+from core.principal import PRINCIPAL_KEY, get_user_principal
+from core.redis_client import redis_client
+from models.user import User
+from services import auth_service, user_service
+from services.auth_service import AuthService
+from services.password_service import PasswordHasher
+from services.user_service import UserService
+from tests.fakes import FakeRedis
+
+
+@pytest.fixture
+async def hasher(monkeypatch: pytest.MonkeyPatch) -> AsyncIterator[PasswordHasher]:
+    """테스트용 낮은 비용의 bcrypt"""
+    h = PasswordHasher(workers=1, max_pending=4, acquire_timeout=1.0, rounds=4)
+    monkeypatch.setattr(user_service, "password_hasher", h)
+    monkeypatch.setattr(auth_service, "password_hasher", h)
+    yield h
+    h.shutdown()
+
+
+@pytest.fixture
+async def user(sqlite_db: None, fake_redis: FakeRedis, hasher: PasswordHasher) -> AsyncIterator[User]:
+    principal._local_cache.clear()
+    yield await User.create(
+        email="user@example.com",
+        username="user",
+        password_hash=await hasher.hash("old-password"),
+    )
+    principal._local_cache.clear()
+
+
+def _key(user: User) -> str:
+    return PRINCIPAL_KEY.format(user_id=user.id)
+
+
+async def _assert_invalidated(user: User, fake_redis: FakeRedis) -> None:
+    assert principal._local_cache.get(_key(user)) is None
+    assert await fake_redis.get(_key(user)) is None
+
+
+async def _redis_down(*args: object, **kwargs: object) -> None:
+    raise ConnectionError("redis down")
+
+
+async def test_lookup_order_local_then_redis_then_db(user: User, fake_redis: FakeRedis) -> None:
+    first = await get_user_principal(user.id)
+    assert first is not None and first.is_superuser is False
+    assert principal._local_cache.get(_key(user)) is not None
+    assert await fake_redis.get(_key(user)) is not None
+
+    # DB만 바꾸면 캐시 값이 그대로 나옴 → 로컬 캐시에서 응답
+    await User.filter(id=user.id).update(is_superuser=True)
+    cached = await get_user_principal(user.id)
+    assert cached is not None and cached.is_superuser is False
+
+    # 로컬 캐시가 비면 Redis에서 (여전히 이전 값)
+    principal._local_cache.clear()
+    from_redis = await get_user_principal(user.id)
+    assert from_redis is not None and from_redis.is_superuser is False
+    assert principal._local_cache.get(_key(user)) is not None
+
+    # 둘 다 비면 DB
+    principal._local_cache.clear()
+    fake_redis.data.clear()
+    from_db = await get_user_principal(user.id)
+    assert from_db is not None and from_db.is_superuser is True
+
+
+async def test_redis_outage_reads_db(user: User, monkeypatch: pytest.MonkeyPatch) -> None:
+    for name in ("get", "set"):
+        monkeypatch.setattr(redis_client, name, _redis_down)
+
+    loaded = await get_user_principal(user.id)
+    assert loaded is not None and loaded.id == user.id
+
+
+async def test_missing_user_returns_none(user: User) -> None:
+    assert await get_user_principal(user.id + 1000) is None
+
+
+async def test_update_profile_invalidates(user: User, fake_redis: FakeRedis) -> None:
+    await get_user_principal(user.id)
+
+    await UserService.update_profile(user.id, username="renamed")
+
+    await _assert_invalidated(user, fake_redis)
+
+
+async def test_update_user_status_invalidates(user: User, fake_redis: FakeRedis) -> None:
+    await get_user_principal(user.id)
+
+    await UserService.update_user_status(user.id, is_active=False)
+
+    await _assert_invalidated(user, fake_redis)
+    deactivated = await get_user_principal(user.id)
+    assert deactivated is not None and deactivated.is_active is False
+
+
+async def test_delete_user_invalidates(user: User, fake_redis: FakeRedis) -> None:
+    await get_user_principal(user.id)
+
+    assert await UserService.delete_user(user.id)
+
+    await _assert_invalidated(user, fake_redis)
+    assert await get_user_principal(user.id) is None
+
+
+async def test_change_password_invalidates(user: User, fake_redis: FakeRedis) -> None:
+    await get_user_principal(user.id)
+
+    result = await UserService.change_password(user, "old-password", "new-password", "new-password")
+
+    assert result == {"success": True}
+    await _assert_invalidated(user, fake_redis)
+
+
+async def test_confirm_password_reset_invalidates(user: User, fake_redis: FakeRedis) -> None:
+    await get_user_principal(user.id)
+
+    result = await AuthService.confirm_password_reset(user.email, "new-password", "new-password")
+
+    assert result == {"success": True}
+    await _assert_invalidated(user, fake_redis)
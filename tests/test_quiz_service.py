@@ -0,0 +1,106 @@
+"""
+퀴즈 메모리 저장소 (user-001)
+- 엑셀 적재 / mtime 변경 시 다시 읽기
+- 다시 읽기 실패(깨진 파일, 삭제) 시 직전 데이터 유지, 같은 파일을 매번 다시 읽지 않음
+"""
+import os
+from pathlib import Path
+from typing import Any, List
+
+import pandas as pd
+import pytest
+
+from services.quiz_service import QuizBank
+
+
+def _write(path: Path, rows: List[dict[str, Any]], mtime: float) -> None:
+    pd.DataFrame(rows).to_excel(path, index=False)
+    os.utime(path, (mtime, mtime))
+
+
+def _row(quiz_id: int, question: str) -> dict[str, Any]:
+    return {
+        "id": quiz_id,
+        "question": question,
+        "option1": "A",
+        "option2": "B",
+        "option3": None,
+        "option4": None,
+        "answer": "A",
+    }
+
+
+@pytest.fixture
+def workbook(tmp_path: Path) -> Path:
+    path = tmp_path / "quiz.xlsx"
+    _write(path, [_row(1, "첫 문제"), _row(2, "둘째 문제")], mtime=1_000_000)
+    return path
+
+
+def _count_reads(bank: QuizBank, monkeypatch: pytest.MonkeyPatch) -> List[int]:
+    calls: List[int] = []
+    read = bank._read
+
+    def counting_read() -> Any:
+        calls.append(1)
+        return read()
+
+    monkeypatch.setattr(bank, "_read", counting_read)
+    return calls
+
+
+def test_load_parses_rows(workbook: Path) -> None:
+    quizzes = QuizBank(str(workbook)).load()
+
+    assert [q.id for q in quizzes] == [1, 2]
+    assert quizzes[0].question == "첫 문제"
+    assert quizzes[0].options == ("A", "B")  # 빈 보기(NaN) 제외
+    assert quizzes[0].to_dict()["options"] == ["A", "B"]
+
+
+def test_reload_only_when_mtime_changes(workbook: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    bank = QuizBank(str(workbook))
+    bank.load()
+    reads = _count_reads(bank, monkeypatch)
+
+    bank.reload_if_changed()
+    assert reads == []
+
+    _write(workbook, [_row(3, "새 문제")], mtime=1_000_100)
+    assert [q.id for q in bank.reload_if_changed()] == [3]
+    assert len(reads) == 1
+
+
+def test_broken_file_keeps_previous_data_and_is_not_reread(
+    workbook: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    bank = QuizBank(str(workbook))
+    bank.load()
+    reads = _count_reads(bank, monkeypatch)
+
+    # 복사 도중처럼 깨진 파일
+    workbook.write_bytes(b"not an excel file")
+    os.utime(workbook, (1_000_100, 1_000_100))
+
+    assert [q.id for q in bank.reload_if_changed()] == [1, 2]
+    assert [q.id for q in bank.reload_if_changed()] == [1, 2]
+    assert len(reads) == 1
+
+    # 정상 파일로 다시 바뀌면 적재
+    _write(workbook, [_row(3, "새 문제")], mtime=1_000_200)
+    assert [q.id for q in bank.reload_if_changed()] == [3]
+
+
+def test_missing_file_keeps_previous_data(workbook: Path) -> None:
+    bank = QuizBank(str(workbook))
+    bank.load()
+    workbook.unlink()
+
+    assert bank.random_quiz() is not None
+
+
+def test_first_load_failure_raises(tmp_path: Path) -> None:
+    bank = QuizBank(str(tmp_path / "missing.xlsx"))
+
+    with pytest.raises(FileNotFoundError):
+        bank.reload_if_changed()
@@ -0,0 +1,79 @@
+"""
+세션 버전 (user-012)
+users.session_version이 원본이고 Redis는 캐시 → Redis가 비거나 죽어도 무효화가 유지되는지
+"""
+from typing import AsyncIterator, Optional
+
+import pytest
+
+from core import session_version
+from core.redis_client import redis_client
+from core.session_version import bump_session_version, get_session_version
+from models.user import User
+from repositories.user_repo import UserRepository
+from services.user_service import UserService
+from tests.fakes import FakeRedis
+
+
+@pytest.fixture
+async def user(sqlite_db: None) -> AsyncIterator[User]:
+    session_version._local_cache.clear()
+    yield await User.create(email="user@example.com", username="user")
+    session_version._local_cache.clear()
+
+
+async def _redis_down(*args: object, **kwargs: object) -> None:
+    raise ConnectionError("redis down")
+
+
+async def test_bump_is_stored_in_db(user: User, fake_redis: FakeRedis) -> None:
+    assert await get_session_version(user.id) == 0
+
+    assert await bump_session_version(user.id) == 1
+    assert await get_session_version(user.id) == 1
+    assert (await User.get(id=user.id)).session_version == 1
+
+
+async def test_redis_flush_does_not_revive_revoked_tokens(user: User, fake_redis: FakeRedis) -> None:
+    await bump_session_version(user.id)
+    await bump_session_version(user.id)
+
+    # Redis 초기화 / 키 축출 + 워커 캐시 만료
+    fake_redis.data.clear()
+    session_version._local_cache.clear()
+
+    assert await get_session_version(user.id) == 2
+
+
+async def test_redis_outage_reads_and_bumps_through_db(
+    user: User, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    for name in ("get", "set", "delete"):
+        monkeypatch.setattr(redis_client, name, _redis_down)
+
+    assert await get_session_version(user.id) == 0
+    assert await bump_session_version(user.id) == 1
+
+    session_version._local_cache.clear()
+    assert await get_session_version(user.id) == 1
+
+
+async def test_profile_update_keeps_concurrent_bump(
+    user: User, fake_redis: FakeRedis, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    # 프로필 수정이 User를 읽은 직후 다른 요청이 버전을 올림 (비밀번호 변경 / 전체 로그아웃)
+    get_user_by_id = UserRepository.get_user_by_id
+
+    async def read_then_bump(user_id: int) -> Optional[User]:
+        stale = await get_user_by_id(user_id)
+        await bump_session_version(user_id)
+        return stale
+
+    monkeypatch.setattr(UserRepository, "get_user_by_id", staticmethod(read_then_bump))
+
+    # 버전 증가 전에 읽은 객체로 저장해도 session_version은 덮지 않음
+    await UserService.update_profile(user.id, username="renamed")
+
+    refreshed = await User.get(id=user.id)
+    assert refreshed.username == "renamed"
+    assert refreshed.session_version == 1
@@ -0,0 +1,164 @@
+"""
+Todo 일괄 처리 (user-024, TEST_DATABASE_URL 필요)
+- 결과는 요청 순서대로, 생성된 행도 요청 순서대로
+- 같은 id에 대한 두 번째 작업은 DUPLICATE_TODO_ID
+- 다른 사용자 Todo는 NOT_ALLOWED, 없거나 Soft Delete된 Todo는 TODO_NOT_FOUND
+- 한 문장이라도 실패하면 전체 롤백
+"""
+from datetime import datetime, timezone
+from typing import List
+
+import pytest
+from pydantic import ValidationError
+from tortoise.exceptions import OperationalError
+
+from models.todo import Todo
+from models.user import User
+from schemas.todos import TodoBatchOperation
+from services.todo_service import TodoService
+
+
+@pytest.fixture
+async def owner(postgres_db: None) -> User:
+    return await User.create(email="owner@example.com", username="owner")
+
+
+@pytest.fixture
+async def other(postgres_db: None) -> User:
+    return await User.create(email="other@example.com", username="other")
+
+
+def _ops(*operations: dict) -> List[TodoBatchOperation]:
+    return [TodoBatchOperation(**op) for op in operations]
+
+
+async def test_results_follow_request_order(owner: User) -> None:
+    existing = await Todo.create(user=owner, title="기존")
+    to_delete = await Todo.create(user=owner, title="삭제 대상")
+
+    results = await TodoService.apply_batch(
+        owner.id,
+        _ops(
+            {"op": "create", "title": "첫째"},
+            {"op": "complete", "id": existing.id},
+            {"op": "create", "title": "둘째", "description": "설명", "is_completed": True},
+            {"op": "delete", "id": to_delete.id},
+            {"op": "create", "title": "셋째"},
+        ),
+    )
+
+    assert [r.index for r in results] == [0, 1, 2, 3, 4]
+    assert all(r.success for r in results)
+    created = [results[0].todo, results[2].todo, results[4].todo]
+    assert [t.title for t in created if t] == ["첫째", "둘째", "셋째"]
+    assert results[2].todo is not None and results[2].todo.is_completed
+    assert results[1].todo is not None and results[1].todo.is_completed
+    assert results[3].id == to_delete.id and results[3].todo is None
+
+    deleted = await Todo.get(id=to_delete.id)
+    assert deleted.deleted_at is not None
+
+
+async def test_update_keeps_unset_fields(owner: User) -> None:
+    todo = await Todo.create(user=owner, title="제목", description="설명")
+
+    [result] = await TodoService.apply_batch(owner.id, _ops({"op": "update", "id": todo.id, "title": "새 제목"}))
+
+    assert result.success and result.todo is not None
+    assert (result.todo.title, result.todo.description) == ("새 제목", "설명")
+
+
+async def test_second_operation_on_same_id_is_duplicate(owner: User) -> None:
+    todo = await Todo.create(user=owner, title="하나")
+
+    results = await TodoService.apply_batch(
+        owner.id,
+        _ops(
+            {"op": "complete", "id": todo.id},
+            {"op": "delete", "id": todo.id},
+        ),
+    )
+
+    assert results[0].success
+    assert (results[1].success, results[1].error) == (False, "DUPLICATE_TODO_ID")
+    assert (await Todo.get(id=todo.id)).deleted_at is None
+
+
+async def test_other_users_todo_is_not_allowed_and_missing_is_not_found(owner: User, other: User) -> None:
+    theirs = await Todo.create(user=other, title="남의 것")
+
+    results = await TodoService.apply_batch(
+        owner.id,
+        _ops(
+            {"op": "update", "id": theirs.id, "title": "가로채기"},
+            {"op": "delete", "id": theirs.id + 1000},
+            {"op": "complete", "id": theirs.id + 1001},
+        ),
+    )
+
+    assert [r.error for r in results] == ["NOT_ALLOWED", "TODO_NOT_FOUND", "TODO_NOT_FOUND"]
+    assert (await Todo.get(id=theirs.id)).title == "남의 것"
+
+
+async def test_soft_deleted_todo_is_not_found_for_every_op(owner: User) -> None:
+    ids = []
+    for i in range(4):
+        todo = await Todo.create(user=owner, title=f"지운 것 {i}")
+        ids.append(todo.id)
+    deleted_at = datetime(2026, 10, 1, tzinfo=timezone.utc)
+    await Todo.filter(id__in=ids).update(deleted_at=deleted_at)
+
+    results = await TodoService.apply_batch(
+        owner.id,
+        _ops(
+            {"op": "update", "id": ids[0], "title": "되살리기"},
+            {"op": "complete", "id": ids[1]},
+            {"op": "delete", "id": ids[2]},
+            {"op": "delete", "id": ids[3], "hard": True},
+        ),
+    )
+
+    assert [r.error for r in results] == ["TODO_NOT_FOUND"] * 4
+    # hard delete도 Soft Delete된 행은 건드리지 않음
+    assert await Todo.filter(id__in=ids, deleted_at=deleted_at).count() == 4
+
+
+async def test_hard_delete_removes_row(owner: User) -> None:
+    todo = await Todo.create(user=owner, title="완전 삭제")
+
+    [result] = await TodoService.apply_batch(owner.id, _ops({"op": "delete", "id": todo.id, "hard": True}))
+
+    assert result.success
+    assert not await Todo.filter(id=todo.id).exists()
+
+
+async def test_invalid_operations_fail_without_touching_db(owner: User) -> None:
+    results = await TodoService.apply_batch(
+        owner.id,
+        _ops({"op": "create"}, {"op": "complete"}),
+    )
+
+    assert [r.error for r in results] == ["TITLE_REQUIRED", "ID_REQUIRED"]
+    assert await Todo.all().count() == 0
+
+
+async def test_failing_statement_rolls_back_whole_batch(owner: User) -> None:
+    todo = await Todo.create(user=owner, title="원래 제목")
+    # 스키마 검증을 건너뛴 256자 제목 → UPDATE가 VARCHAR(255) 오류
+    too_long = TodoBatchOperation.model_construct(op="update", id=todo.id, title="가" * 256, hard=False)
+
+    with pytest.raises(OperationalError):
+        await TodoService.apply_batch(
+            owner.id,
+            [TodoBatchOperation(op="create", title="롤백될 생성"), too_long],
+        )
+
+    assert not await Todo.filter(title="롤백될 생성").exists()
+    assert (await Todo.get(id=todo.id)).title == "원래 제목"
+
+
+def test_title_longer_than_column_is_rejected() -> None:
+    TodoBatchOperation(op="create", title="가" * 255)
+
+    with pytest.raises(ValidationError):
+        TodoBatchOperation(op="create", title="가" * 256)
@@ -0,0 +1,155 @@
+"""
+무효화 토큰 저장소 (user-011)
+- revoke → is_revoked
+- 동기화된 Bloom filter가 모르는 jti는 Redis 조회 없이 통과
+- Redis 장애 시 Postgres 감사 기록으로 판정
+- Redis 인덱스에서 Bloom filter 재구성 (만료분 제거, 재구성 중 무효화 포함)
+"""
+import time
+from datetime import datetime, timedelta, timezone
+from typing import Any, AsyncIterator, List
+
+import pytest
+
+from core.bloom import BloomFilter
+from core.redis_client import redis_client
+from models.token_revocations import TokenRevocation
+from models.user import User
+from services.token_revocation_service import REVOKED_INDEX_KEY, REVOKED_KEY, TokenRevocationStore
+from tests.fakes import FakeRedis
+
+
+@pytest.fixture
+async def user(sqlite_db: None) -> AsyncIterator[User]:
+    yield await User.create(email="user@example.com", username="user")
+
+
+@pytest.fixture
+def store(fake_redis: FakeRedis) -> TokenRevocationStore:
+    return TokenRevocationStore()
+
+
+def _expires(minutes: int = 30) -> datetime:
+    return datetime.now(timezone.utc) + timedelta(minutes=minutes)
+
+
+async def _redis_down(*args: Any, **kwargs: Any) -> None:
+    raise ConnectionError("redis down")
+
+
+def test_bloom_filter_has_no_false_negatives() -> None:
+    bloom = BloomFilter(capacity=1000, error_rate=0.001)
+    members = [f"jti-{i}" for i in range(1000)]
+    for jti in members:
+        bloom.add(jti)
+
+    assert all(jti in bloom for jti in members)
+    false_positives = sum(f"other-{i}" in bloom for i in range(10000))
+    assert false_positives < 100  # 오탐률 0.1% 설계, 여유 있게 1% 미만
+    assert len(bloom) == 1000
+
+
+async def test_revoke_then_is_revoked(store: TokenRevocationStore, user: User, fake_redis: FakeRedis) -> None:
+    await store.revoke("jti-1", user.id, _expires(), reason="logout")
+
+    assert await store.is_revoked("jti-1")
+    assert not await store.is_revoked("jti-2")
+    assert await fake_redis.exists(REVOKED_KEY.format(jti="jti-1"))
+    assert await TokenRevocation.filter(jti="jti-1").exists()
+
+
+async def test_expired_token_is_not_recorded(store: TokenRevocationStore, user: User) -> None:
+    await store.revoke("jti-old", user.id, _expires(minutes=-1))
+
+    assert not await TokenRevocation.filter(jti="jti-old").exists()
+
+
+async def test_synced_bloom_skips_redis_for_unknown_jti(
+    store: TokenRevocationStore, user: User, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    await store.revoke("jti-1", user.id, _expires())
+    await store.rebuild()
+
+    lookups: List[str] = []
+    exists = redis_client.exists
+
+    async def counting_exists(*keys: str) -> int:
+        lookups.extend(keys)
+        return await exists(*keys)
+
+    monkeypatch.setattr(redis_client, "exists", counting_exists)
+
+    assert not await store.is_revoked("never-revoked")
+    assert lookups == []
+    assert store.metrics()["bloom_negatives"] == 1
+
+    # Bloom filter에 걸린 jti만 Redis 확인
+    assert await store.is_revoked("jti-1")
+    assert lookups == [REVOKED_KEY.format(jti="jti-1")]
+
+
+async def test_unsynced_store_always_checks_redis(store: TokenRevocationStore, fake_redis: FakeRedis) -> None:
+    # 동기화 전에는 다른 워커가 무효화한 jti를 모를 수 있음
+    await fake_redis.set(REVOKED_KEY.format(jti="other-worker"), "1", ex=60)
+
+    assert await store.is_revoked("other-worker")
+    assert store.metrics()["remote_checks"] == 1
+
+
+async def test_redis_outage_falls_back_to_postgres(
+    store: TokenRevocationStore, user: User, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    await store.revoke("jti-1", user.id, _expires())
+    monkeypatch.setattr(redis_client, "exists", _redis_down)
+
+    assert await store.is_revoked("jti-1")
+    assert not await store.is_revoked("jti-2")
+
+
+async def test_revoke_still_records_in_postgres_when_redis_is_down(
+    store: TokenRevocationStore, user: User, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setattr(redis_client, "pipeline", _redis_down)
+    monkeypatch.setattr(redis_client, "exists", _redis_down)
+
+    await store.revoke("jti-1", user.id, _expires())
+
+    assert await store.is_revoked("jti-1")
+
+
+async def test_rebuild_drops_expired_and_keeps_live(store: TokenRevocationStore, fake_redis: FakeRedis) -> None:
+    now = time.time()
+    await fake_redis.zadd(REVOKED_INDEX_KEY, {"expired": now - 10, "live": now + 600})
+
+    await store.rebuild()
+
+    assert store.metrics()["synced"] is True
+    assert await fake_redis.zrangebyscore(REVOKED_INDEX_KEY, "-inf", "+inf") == ["live"]
+    assert "live" in store._bloom
+    assert "expired" not in store._bloom
+
+
+async def test_rebuild_keeps_revocations_made_during_rebuild(
+    store: TokenRevocationStore, fake_redis: FakeRedis, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    zrange = fake_redis.zrangebyscore
+
+    async def revoke_during_rebuild(key: str, min: Any, max: Any) -> List[str]:
+        store._remember("revoked-meanwhile")  # pub/sub 메시지가 재구성 도중 도착
+        return await zrange(key, min, max)
+
+    monkeypatch.setattr(redis_client, "zrangebyscore", revoke_during_rebuild)
+
+    await store.rebuild()
+
+    assert "revoked-meanwhile" in store._bloom
+
+
+async def test_failed_rebuild_does_not_trust_bloom(
+    store: TokenRevocationStore, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setattr(redis_client, "zremrangebyscore", _redis_down)
+
+    await store.rebuild()
+
+    assert store.metrics()["synced"] is False
@@ -0,0 +1,68 @@
+"""
+관리자 사용자 검색 (user-020, TEST_DATABASE_URL 필요)
+- 3글자 이상: 부분 일치 + trigram 유사도 순, 후보 수 상한
+- 2글자 이하: 앞부분 일치 (trigram 인덱스를 쓸 수 없는 길이)
+- (score, id) 커서로 이어서 조회
+"""
+from typing import List
+
+import pytest
+
+from core.config import settings
+from models.user import User
+from repositories.user_repo import UserRepository
+
+
+@pytest.fixture
+async def users(postgres_db: None) -> List[User]:
+    names = ["ohnana", "oh", "ohna", "john", "noh", "kim", "ohnan", "o_h"]
+    return [await User.create(email=f"{name}@example.com", username=name) for name in names]
+
+
+async def _search_all(keyword: str, limit: int) -> List[str]:
+    found: List[str] = []
+    after = None
+    while True:
+        rows = await UserRepository.search_users(keyword, limit=limit, after=after)
+        found.extend(row["username"] for row in rows)
+        if len(rows) < limit:
+            return found
+        after = (rows[-1]["score"], rows[-1]["id"])
+
+
+async def test_short_keyword_matches_prefix_only(users: List[User]) -> None:
+    found = await _search_all("oh", limit=20)
+
+    # id 순, 가운데 일치(john, noh)는 제외
+    assert found == ["ohnana", "oh", "ohna", "ohnan"]
+
+
+async def test_short_keyword_escapes_like_wildcards(users: List[User]) -> None:
+    assert await _search_all("o_", limit=20) == ["o_h"]
+
+
+async def test_short_keyword_pages_by_id(users: List[User]) -> None:
+    assert await _search_all("oh", limit=1) == ["ohnana", "oh", "ohna", "ohnan"]
+
+
+async def test_trigram_search_ranks_by_similarity(users: List[User]) -> None:
+    found = await _search_all("ohna", limit=20)
+
+    assert found[0] == "ohna"
+    assert set(found) >= {"ohna", "ohnan", "ohnana"}
+    assert "kim" not in found
+
+
+async def test_trigram_search_pages_without_gaps(users: List[User]) -> None:
+    everything = await _search_all("ohna", limit=20)
+
+    assert await _search_all("ohna", limit=1) == everything
+
+
+async def test_trigram_candidates_are_capped(users: List[User], monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(settings, "USER_SEARCH_MAX_CANDIDATES", 3)
+
+    found = await _search_all("ohna", limit=20)
+
+    # 후보는 id 순 앞 3명(ohnana, oh, ohna)만, 그 안에서 유사도 순 (ohnan은 후보 밖)
+    assert found == ["ohna", "ohnana", "oh"]